@@ -1,19 +1,48 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.response import Response
+
 from api.v1.admin.serializers import HistorySerializer
+from common.rest_framework.pagination import ExtendedPagination
 
+HISTORY_PAGINATION_PARAMETERS = [
+    OpenApiParameter(
+        ExtendedPagination.page_query_param,
+        OpenApiTypes.INT,
+        OpenApiParameter.QUERY,
+        description="A page number within the paginated result set. The response "
+        "is paginated if page or page_size is given.",
+    ),
+    OpenApiParameter(
+        ExtendedPagination.page_size_query_param,
+        OpenApiTypes.INT,
+        OpenApiParameter.QUERY,
+        description="Number of results to return per page.",
+    ),
+]
 
-def serialize_history(objects):
-    if len(objects) < 2:
-        return None
 
-    history = []
-    for i in range(0, len(objects) - 1):
-        new_record, old_record = objects[i], objects[i + 1]
-        diff = new_record.diff_against(old_record)
+def get_history_response(view, obj):
+    # The changes are stored with the historical records when they are created. The
+    # records without changes (the first one and saves without modifications) are
+    # skipped.
+    history = (
+        obj.history.filter(history_changes__isnull=False)
+        .exclude(history_changes=[])
+        .select_related("history_user__userprofile")
+        .order_by("-history_date", "-history_id")
+    )
 
-        # HistoricalRecord is already created when Model.save() is called regardless of data having actually changed.
-        # If there is no difference between the old and the new one do not serialize that.
-        if len(diff.changes):
-            history.append(diff)
+    # The plain list is returned unless a page is requested
+    paginator = ExtendedPagination()
+    if any(
+        param in view.request.query_params
+        for param in [paginator.page_query_param, paginator.page_size_query_param]
+    ):
+        page = paginator.paginate_queryset(history, view.request, view)
+        if page is not None:
+            serializer = HistorySerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
 
     serializer = HistorySerializer(history, many=True)
-    return serializer.data
+    return Response(serializer.data)
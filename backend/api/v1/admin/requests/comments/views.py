@@ -2,23 +2,35 @@ from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.generics import get_object_or_404
-from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from api.v1.admin.helpers import serialize_history
+from api.v1.admin.helpers import (
+    HISTORY_PAGINATION_PARAMETERS,
+    get_history_response,
+)
 from api.v1.admin.requests.comments.serializers import (
     CommentAdminCreateUpdateSerializer,
     CommentAdminListRetrieveSerializer,
 )
 from api.v1.admin.serializers import HistorySerializer
+from common.rest_framework.mixins import (
+    ConditionalGetMixin,
+    NestedParentsMixin,
+    SparseFieldsetMixin,
+)
 from common.rest_framework.permissions import IsStaffSelfOrAdmin, IsStaffUser
 from video_requests.models import Comment, Request
 
 
-class CommentAdminViewSet(ModelViewSet):
+class CommentAdminViewSet(
+    ConditionalGetMixin, NestedParentsMixin, SparseFieldsetMixin, ModelViewSet
+):
+    authenticate_with_claims = True
     filter_backends = [OrderingFilter]
+    modified_relations = ["author__userprofile"]
     ordering = ["created"]
     ordering_fields = ["author__first_name", "author__last_name", "created", "internal"]
+    parent_lookups = [("request", Request, "request_pk")]
 
     def get_permissions(self):
         # Staff members can read every comment but can only modify and delete those which were created by them.
@@ -29,8 +41,9 @@ class CommentAdminViewSet(ModelViewSet):
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Comment.objects.none()
-        return Comment.objects.select_related("author__userprofile").filter(
-            request=get_object_or_404(Request, pk=self.kwargs["request_pk"])
+        return self.prune_related(
+            Comment.objects.filter(request=self.get_parent("request")),
+            select_related={"author": ["author__userprofile"]},
         )
 
     def get_serializer_class(self):
@@ -41,15 +54,15 @@ class CommentAdminViewSet(ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(
             author=self.request.user,
-            request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
+            request=self.get_parent("request"),
         )
 
-    @extend_schema(responses=HistorySerializer(many=True))
+    @extend_schema(
+        parameters=HISTORY_PAGINATION_PARAMETERS,
+        responses=HistorySerializer(many=True),
+    )
     @action(detail=True, filter_backends=[], pagination_class=None)
     def history(self, request, pk=None, request_pk=None):
-        history_objects = (
-            get_object_or_404(Comment, pk=pk, request__pk=request_pk)
-            .history.all()
-            .order_by("-history_date")
+        return get_history_response(
+            self, get_object_or_404(Comment, pk=pk, request__pk=request_pk)
         )
-        return Response(serialize_history(history_objects))
@@ -2,6 +2,10 @@ from rest_framework.fields import CharField, IntegerField
 from rest_framework.serializers import ModelSerializer, Serializer
 
 from api.v1.admin.users.serializers import UserNestedListSerializer
+from common.rest_framework.serializers import (
+    BulkWriteResultSerializer,
+    BulkWriteSerializer,
+)
 from video_requests.models import CrewMember
 
 
@@ -16,3 +20,21 @@ class CrewMemberAdminCreateUpdateSerializer(ModelSerializer):
         model = CrewMember
         fields = ["id", "member", "position"]
         read_only_fields = ["id"]
+
+
+class CrewMemberAdminBulkUpdateSerializer(CrewMemberAdminCreateUpdateSerializer):
+    id = IntegerField()
+
+    class Meta(CrewMemberAdminCreateUpdateSerializer.Meta):
+        extra_kwargs = {"member": {"required": False}, "position": {"required": False}}
+        read_only_fields = []
+
+
+class CrewMemberAdminBulkSerializer(BulkWriteSerializer):
+    create = CrewMemberAdminCreateUpdateSerializer(many=True, required=False)
+    update = CrewMemberAdminBulkUpdateSerializer(many=True, required=False)
+
+
+class CrewMemberAdminBulkResultSerializer(BulkWriteResultSerializer):
+    created = CrewMemberAdminListRetrieveSerializer(many=True, read_only=True)
+    updated = CrewMemberAdminListRetrieveSerializer(many=True, read_only=True)
@@ -1,24 +1,39 @@
 from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
-from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.status import HTTP_201_CREATED
 from rest_framework.viewsets import ModelViewSet
 
 from api.v1.admin.requests.crew.serializers import (
+    CrewMemberAdminBulkResultSerializer,
+    CrewMemberAdminBulkSerializer,
     CrewMemberAdminCreateUpdateSerializer,
     CrewMemberAdminListRetrieveSerializer,
 )
+from common.rest_framework.mixins import BulkWriteMixin, NestedParentsMixin
 from common.rest_framework.permissions import IsStaffUser
 from video_requests.models import CrewMember, Request
+from video_requests.services import bulk_write_crew_members
 
 
-class CrewMemberAdminViewSet(ModelViewSet):
+class CrewMemberAdminViewSet(BulkWriteMixin, NestedParentsMixin, ModelViewSet):
+    bulk_result_serializer_class = CrewMemberAdminBulkResultSerializer
+    bulk_serializer_class = CrewMemberAdminBulkSerializer
     filter_backends = [OrderingFilter]
     ordering = ["position"]
     ordering_fields = ["member__first_name", "member__last_name", "position"]
+    parent_lookups = [("request", Request, "request_pk")]
     permission_classes = [IsStaffUser]
 
+    @extend_schema(
+        request=CrewMemberAdminBulkSerializer,
+        responses=CrewMemberAdminBulkResultSerializer,
+    )
+    @action(detail=False, methods=["post"], filter_backends=[])
+    def bulk(self, request, request_pk=None):
+        return self.bulk_write(request)
+
     @extend_schema(
         request=CrewMemberAdminCreateUpdateSerializer,
         responses=CrewMemberAdminListRetrieveSerializer,
@@ -39,7 +54,7 @@ class CrewMemberAdminViewSet(ModelViewSet):
         if getattr(self, "swagger_fake_view", False):
             return CrewMember.objects.none()
         return CrewMember.objects.select_related("member__userprofile").filter(
-            request=get_object_or_404(Request, pk=self.kwargs["request_pk"])
+            request=self.get_parent("request")
         )
 
     def get_serializer_class(self):
@@ -54,11 +69,17 @@ class CrewMemberAdminViewSet(ModelViewSet):
     def partial_update(self, request, *args, **kwargs):
         return super().partial_update(request, *args, **kwargs)
 
-    def perform_create(self, serializer):
-        serializer.save(
-            request=get_object_or_404(Request, pk=self.kwargs["request_pk"])
+    def perform_bulk_write(self, create, update, delete):
+        return bulk_write_crew_members(
+            request=self.get_parent("request"),
+            create=create,
+            update=update,
+            delete=delete,
         )
 
+    def perform_create(self, serializer):
+        serializer.save(request=self.get_parent("request"))
+
     @extend_schema(
         request=CrewMemberAdminCreateUpdateSerializer,
         responses=CrewMemberAdminListRetrieveSerializer,
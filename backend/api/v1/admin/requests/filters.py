@@ -44,10 +44,10 @@ class TodoFilter(FilterSet):
 class VideoFilter(FilterSet):
     last_aired = DateFilter(method="filter_last_aired")
     length_max = extend_schema_field(OpenApiTypes.NUMBER)(
-        IntegerFilter(field_name="additional_data__length", method="filter_length_max")
+        IntegerFilter(field_name="length", method="filter_length_max")
     )
     length_min = extend_schema_field(OpenApiTypes.NUMBER)(
-        IntegerFilter(field_name="additional_data__length", lookup_expr="gte")
+        IntegerFilter(field_name="length", lookup_expr="gte")
     )
     request_start_datetime = DateFromToRangeFilter(field_name="request__start_datetime")
     status = MultipleChoiceFilter(choices=Video.Statuses.choices)
@@ -1,9 +1,15 @@
 from collections.abc import Mapping
+from copy import deepcopy
+from itertools import batched
 
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
 
 from api.v1.requests.utilities import create_user
 from video_requests.models import Request, Video
+from video_requests.utilities import bulk_update_request_status
 
 
 def check_and_remove_unauthorized_additional_data(
@@ -82,6 +88,20 @@ def handle_additional_data(
     return validated_data
 
 
+def lock_additional_data(instance: Request | Video) -> None:
+    """
+    Lock the row of the object until the end of the transaction and load its current
+    additional data. The changes are merged into the current data and concurrent
+    writes (e.g. status_by_admin or email_sent_to_user) are not overwritten.
+    """
+    instance.additional_data = (
+        type(instance)
+        ._base_manager.select_for_update()
+        .values_list("additional_data", flat=True)
+        .get(pk=instance.pk)
+    )
+
+
 def is_status_by_admin(obj: Request | Video) -> bool:
     try:
         return isinstance(obj.additional_data.get("status_by_admin").get("status"), int)
@@ -108,3 +128,49 @@ def update_additional_data(orig_dict: dict, new_dict: dict) -> dict:
             else:
                 orig_dict[key] = new_dict[key]
     return orig_dict
+
+
+def bulk_update_additional_data(
+    request_ids: list[int], patch: dict, user: User, batch_size: int = 100
+) -> list[dict]:
+    """
+    Apply the additional data patch to every request the same way as an update by the
+    user would do. The requests are locked and saved in batches and the statuses of
+    the updated requests are recalculated together at the end. Return the result of
+    every request (the errors of the invalid ones).
+    """
+    field = Request._meta.get_field("additional_data")
+    results = {request_id: {"id": request_id} for request_id in request_ids}
+    for batch in batched(request_ids, batch_size):
+        with transaction.atomic():
+            requests = Request.objects.select_for_update().in_bulk(batch)
+            updated = []
+            for request in requests.values():
+                additional_data = update_additional_data(
+                    deepcopy(request.additional_data),
+                    check_and_remove_unauthorized_additional_data(
+                        deepcopy(patch), user, request
+                    ),
+                )
+                try:
+                    field.clean(additional_data, request)
+                except ValidationError as error:
+                    results[request.id]["errors"] = error.messages
+                    continue
+                request.additional_data = additional_data
+                updated.append(request)
+            Request.bulk_update_versioned(updated, ["additional_data"])
+        for request_id in batch:
+            if request_id not in requests:
+                results[request_id]["errors"] = [_("Not found.")]
+
+    updated_ids = [
+        request_id for request_id, result in results.items() if "errors" not in result
+    ]
+    for request in bulk_update_request_status(
+        Request.objects.filter(pk__in=updated_ids)
+    ):
+        results[request.id]["status"] = request.status
+    return [
+        {"success": "errors" not in result, **result} for result in results.values()
+    ]
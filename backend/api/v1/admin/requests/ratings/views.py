@@ -7,17 +7,21 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from api.v1.admin.helpers import serialize_history
+from api.v1.admin.helpers import (
+    HISTORY_PAGINATION_PARAMETERS,
+    get_history_response,
+)
 from api.v1.admin.requests.ratings.serializers import (
     RatingAdminCreateUpdateSerializer,
     RatingAdminListRetrieveSerializer,
 )
 from api.v1.admin.serializers import HistorySerializer
+from common.rest_framework.mixins import NestedParentsMixin
 from common.rest_framework.permissions import IsStaffSelfOrAdmin, IsStaffUser
 from video_requests.models import Rating, Request, Video
 
 
-class RatingAdminViewSet(ModelViewSet):
+class RatingAdminViewSet(NestedParentsMixin, ModelViewSet):
     filter_backends = [OrderingFilter]
     ordering = ["created"]
     ordering_fields = [
@@ -27,6 +31,10 @@ class RatingAdminViewSet(ModelViewSet):
         "rating",
         "review",
     ]
+    parent_lookups = [
+        ("request", Request, "request_pk"),
+        ("video", Video, "video_pk"),
+    ]
 
     def get_permissions(self):
         # Staff members can read every comment but can only modify and delete those which were created by them.
@@ -38,8 +46,7 @@ class RatingAdminViewSet(ModelViewSet):
         if getattr(self, "swagger_fake_view", False):
             return Rating.objects.none()
         return Rating.objects.select_related("author__userprofile").filter(
-            video=get_object_or_404(Video, pk=self.kwargs["video_pk"]),
-            video__request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
+            video=self.get_parent("video")
         )
 
     def get_serializer_class(self):
@@ -48,11 +55,7 @@ class RatingAdminViewSet(ModelViewSet):
         return RatingAdminCreateUpdateSerializer
 
     def perform_create(self, serializer):
-        video = get_object_or_404(
-            Video,
-            pk=self.kwargs["video_pk"],
-            request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
-        )
+        video = self.get_parent("video")
 
         if video.status < Video.Statuses.EDITED:
             # A video cannot be rated before being edited (reached status 3).
@@ -68,17 +71,18 @@ class RatingAdminViewSet(ModelViewSet):
 
         serializer.save(author=self.request.user, video=video)
 
-    @extend_schema(responses=HistorySerializer(many=True))
+    @extend_schema(
+        parameters=HISTORY_PAGINATION_PARAMETERS,
+        responses=HistorySerializer(many=True),
+    )
     @action(detail=True, filter_backends=[], pagination_class=None)
     def history(self, request, pk=None, request_pk=None, video_pk=None):
-        history_objects = (
+        return get_history_response(
+            self,
             get_object_or_404(
                 Rating, pk=pk, video__pk=video_pk, video__request__pk=request_pk
-            )
-            .history.all()
-            .order_by("-history_date")
+            ),
         )
-        return Response(serialize_history(history_objects))
 
     @extend_schema(responses=RatingAdminListRetrieveSerializer())
     @action(detail=False, filter_backends=[], pagination_class=None)
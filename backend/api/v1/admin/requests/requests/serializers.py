@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema_field
@@ -9,19 +10,33 @@ from rest_framework.fields import (
     CharField,
     DateField,
     DateTimeField,
+    DictField,
     EmailField,
     IntegerField,
     JSONField,
+    ListField,
     SerializerMethodField,
 )
 from rest_framework.relations import PrimaryKeyRelatedField, RelatedField
 from rest_framework.serializers import ModelSerializer, Serializer
 
+from api.v1.admin.requests.comments.serializers import (
+    CommentAdminListRetrieveSerializer,
+)
+from api.v1.admin.requests.crew.serializers import (
+    CrewMemberAdminListRetrieveSerializer,
+)
 from api.v1.admin.requests.helpers import (
     get_or_create_requester_from_data,
     handle_additional_data,
     is_status_by_admin,
+    lock_additional_data,
+)
+from api.v1.admin.requests.ratings.serializers import (
+    RatingAdminListRetrieveSerializer,
 )
+from api.v1.admin.requests.videos.serializers import VideoAdminListSerializer
+from api.v1.admin.todos.serializers import TodoAdminListRetrieveSerializer
 from api.v1.admin.users.serializers import (
     UserNestedDetailSerializer,
     UserNestedListSerializer,
@@ -53,7 +68,7 @@ class RequestAdminListSerializer(Serializer):
     status_by_admin = SerializerMethodField(read_only=True)
     responsible = UserNestedListSerializer(read_only=True)
     title = CharField(read_only=True)
-    video_count = IntegerField(read_only=True, source="videos.count")
+    video_count = IntegerField(read_only=True)
 
     @staticmethod
     def get_status_by_admin(obj) -> bool:
@@ -62,7 +77,7 @@ class RequestAdminListSerializer(Serializer):
 
 class RequestAdminRetrieveSerializer(RequestAdminListSerializer):
     additional_data = JSONField(read_only=True)
-    comment_count = IntegerField(read_only=True, source="comments.count")
+    comment_count = IntegerField(read_only=True)
     end_datetime = DateTimeField(read_only=True)
     place = CharField(read_only=True)
     requester = UserNestedDetailSerializer(read_only=True)
@@ -79,6 +94,57 @@ class RequestAdminRetrieveSerializer(RequestAdminListSerializer):
         )
 
 
+class RequestAdminBundleRatingSerializer(RatingAdminListRetrieveSerializer):
+    video = IntegerField(read_only=True, source="video_id")
+
+
+class RequestAdminBundleSerializer(Serializer):
+    comments = CommentAdminListRetrieveSerializer(
+        many=True, read_only=True, source="comments.all"
+    )
+    crew = CrewMemberAdminListRetrieveSerializer(
+        many=True, read_only=True, source="crew.all"
+    )
+    ratings = SerializerMethodField(read_only=True)
+    request = RequestAdminRetrieveSerializer(read_only=True, source="*")
+    todos = TodoAdminListRetrieveSerializer(
+        many=True, read_only=True, source="todos.all"
+    )
+    videos = VideoAdminListSerializer(many=True, read_only=True, source="videos.all")
+
+    @extend_schema_field(RequestAdminBundleRatingSerializer(many=True))
+    def get_ratings(self, obj):
+        # Only the ratings of the current user are prefetched
+        ratings = [
+            rating for video in obj.videos.all() for rating in video.user_ratings
+        ]
+        return RequestAdminBundleRatingSerializer(
+            ratings, many=True, context=self.context
+        ).data
+
+
+class RequestAdminBulkUpdateSerializer(Serializer):
+    additional_data = JSONField()
+    filter = DictField(required=False)
+    ids = ListField(child=IntegerField(), required=False)
+
+    def validate(self, attrs):
+        if "filter" not in attrs and "ids" not in attrs:
+            raise ValidationError(
+                {"non_field_errors": [_("Either ids or filter must be provided.")]}
+            )
+        if not isinstance(attrs["additional_data"], dict):
+            raise ValidationError({"additional_data": [_("Must be an object.")]})
+        return attrs
+
+
+class RequestAdminBulkUpdateResultSerializer(Serializer):
+    errors = ListField(child=CharField(), required=False, read_only=True)
+    id = IntegerField(read_only=True)
+    status = IntegerField(required=False, read_only=True)
+    success = BooleanField(read_only=True)
+
+
 class RequestAdminUpdateSerializer(ModelSerializer):
     requester = PrimaryKeyRelatedField(queryset=User.objects.all(), required=False)
     requester_email = EmailField(required=False)
@@ -130,17 +196,22 @@ class RequestAdminUpdateSerializer(ModelSerializer):
 
     def update(self, instance, validated_data):
         send_notification = validated_data.pop("send_notification", None)
-        recalculate_deadline(instance, validated_data)
-        handle_additional_data(validated_data, self.context["request"].user, instance)
-        if validated_data.get("requester_email"):
-            # As validate() should have already run if any of requester attribute exists all should exist.
-            get_or_create_requester_from_data(validated_data, instance)
-        changed_datetime = now()
-        changed_by = self.context["request"].user.get_full_name_eastern_order()
-        changed_values = None
-        if send_notification:
-            changed_values = self.get_changed_values(instance, validated_data)
-        request = super().update(instance, validated_data)
+        with transaction.atomic():
+            # Every field is saved so the additional data must be the current one
+            lock_additional_data(instance)
+            recalculate_deadline(instance, validated_data)
+            handle_additional_data(
+                validated_data, self.context["request"].user, instance
+            )
+            if validated_data.get("requester_email"):
+                # As validate() should have already run if any of requester attribute exists all should exist.
+                get_or_create_requester_from_data(validated_data, instance)
+            changed_datetime = now()
+            changed_by = self.context["request"].user.get_full_name_eastern_order()
+            changed_values = None
+            if send_notification:
+                changed_values = self.get_changed_values(instance, validated_data)
+            request = super().update(instance, validated_data)
         if send_notification and changed_values:
             email_crew_request_modified.delay(
                 request.id, changed_by, changed_datetime, changed_values
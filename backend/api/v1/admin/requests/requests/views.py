@@ -1,33 +1,53 @@
-from django.db.models import Count, Prefetch
+from django.contrib.auth.models import User
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.decorators import action
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.status import HTTP_201_CREATED
 from rest_framework.viewsets import ModelViewSet
 
-from api.v1.admin.helpers import serialize_history
+from api.v1.admin.helpers import (
+    HISTORY_PAGINATION_PARAMETERS,
+    get_history_response,
+)
 from api.v1.admin.requests.filters import RequestFilter
+from api.v1.admin.requests.helpers import bulk_update_additional_data
 from api.v1.admin.requests.requests.serializers import (
+    RequestAdminBulkUpdateResultSerializer,
+    RequestAdminBulkUpdateSerializer,
+    RequestAdminBundleSerializer,
     RequestAdminCreateSerializer,
     RequestAdminListSerializer,
     RequestAdminRetrieveSerializer,
     RequestAdminUpdateSerializer,
 )
 from api.v1.admin.serializers import HistorySerializer
+from common.rest_framework.filters import FullTextSearchFilter
+from common.rest_framework.mixins import (
+    ConditionalGetMixin,
+    SparseFieldsetMixin,
+    StreamingListModelMixin,
+)
 from common.rest_framework.pagination import ExtendedPagination
 from common.rest_framework.permissions import IsStaffSelfOrAdmin, IsStaffUser
 from common.utilities import remove_calendar_event
-from video_requests.models import CrewMember, Request
+from video_requests.models import Comment, CrewMember, Rating, Request, Todo, Video
+from video_requests.utilities import status_unit_of_work
 
 
-class RequestAdminViewSet(ModelViewSet):
+class RequestAdminViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, StreamingListModelMixin, ModelViewSet
+):
+    authenticate_with_claims = True
     filter_backends = [
         DjangoFilterBackend,
         OrderingFilter,
-        SearchFilter,
+        FullTextSearchFilter,
     ]
     filterset_class = RequestFilter
     ordering = ["created"]
@@ -41,7 +61,71 @@ class RequestAdminViewSet(ModelViewSet):
         "title",
     ]
     pagination_class = ExtendedPagination
-    search_fields = ["title"]
+    search_fields = ["title", "videos__title"]
+
+    bundle_includes = ["comments", "crew", "ratings", "todos", "videos"]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "include",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                description="Comma separated list of comments, crew, ratings, todos "
+                "and videos. Default is all.",
+            ),
+        ],
+        responses=RequestAdminBundleSerializer,
+    )
+    @action(detail=True, filter_backends=[], pagination_class=None)
+    def bundle(self, request, pk=None):
+        includes = self.get_bundle_includes()
+        video_request = get_object_or_404(self.get_bundle_queryset(includes), pk=pk)
+        serializer = RequestAdminBundleSerializer(
+            video_request, context=self.get_serializer_context()
+        )
+        for name in self.bundle_includes:
+            if name not in includes:
+                serializer.fields.pop(name)
+        return Response(serializer.data)
+
+    @extend_schema(
+        request=RequestAdminBulkUpdateSerializer,
+        responses=RequestAdminBulkUpdateResultSerializer(many=True),
+    )
+    @action(detail=False, methods=["post"], filter_backends=[], pagination_class=None)
+    def bulk_update(self, request):
+        """
+        Apply the additional data patch to the requests selected by their id or the
+        filter (same parameters as the list) and return the result of each request.
+        """
+        serializer = RequestAdminBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        queryset = Request.objects.all()
+        if "filter" in serializer.validated_data:
+            filterset = RequestFilter(
+                data=serializer.validated_data["filter"],
+                queryset=queryset,
+                request=request,
+            )
+            if not filterset.is_valid():
+                raise ValidationError({"filter": filterset.errors})
+            queryset = filterset.qs
+        if "ids" in serializer.validated_data:
+            request_ids = list(dict.fromkeys(serializer.validated_data["ids"]))
+            if "filter" in serializer.validated_data:
+                matching = set(
+                    queryset.filter(pk__in=request_ids).values_list("pk", flat=True)
+                )
+                request_ids = [pk for pk in request_ids if pk in matching]
+        else:
+            request_ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+
+        results = bulk_update_additional_data(
+            request_ids, serializer.validated_data["additional_data"], request.user
+        )
+        return Response(RequestAdminBulkUpdateResultSerializer(results, many=True).data)
 
     @extend_schema(
         request=RequestAdminCreateSerializer,
@@ -64,6 +148,81 @@ class RequestAdminViewSet(ModelViewSet):
         remove_calendar_event.delay(video_request.id)
         return super().destroy(request, *args, **kwargs)
 
+    def get_bundle_includes(self) -> set[str]:
+        value = self.request.query_params.get("include")
+        if value is None:
+            return set(self.bundle_includes)
+        return {name.strip() for name in value.split(",")} & set(self.bundle_includes)
+
+    def get_bundle_queryset(self, includes: set[str]):
+        """
+        Fetch the request with the included sub-resources using one query per
+        relation regardless of the number of videos, comments and todos.
+        """
+        videos = Video.objects.order_by("title")
+        if "videos" in includes:
+            videos = videos.select_related("editor__userprofile")
+        if includes & {"ratings", "videos"}:
+            videos = videos.prefetch_related(
+                Prefetch(
+                    "ratings",
+                    queryset=Rating.objects.select_related(
+                        "author__userprofile"
+                    ).filter(author_id=self.request.user.id),
+                    to_attr="user_ratings",
+                )
+            )
+        queryset = Request.objects.select_related(
+            "requester__userprofile",
+            "requested_by__userprofile",
+            "responsible__userprofile",
+        ).prefetch_related(
+            Prefetch(
+                "crew",
+                queryset=CrewMember.objects.select_related(
+                    "member__userprofile"
+                ).order_by("position"),
+            ),
+            Prefetch("videos", queryset=videos),
+        )
+        if "comments" in includes:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "comments",
+                    queryset=Comment.objects.select_related(
+                        "author__userprofile"
+                    ).order_by("created"),
+                )
+            )
+        if "todos" in includes:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "todos",
+                    queryset=Todo.objects.select_related(
+                        "creator__userprofile", "request", "video"
+                    )
+                    .prefetch_related(
+                        Prefetch(
+                            "assignees",
+                            queryset=User.objects.select_related("userprofile"),
+                        )
+                    )
+                    .order_by("created"),
+                )
+            )
+        return queryset
+
+    def get_modified_relations(self):
+        relations = ["crew__member__userprofile", "responsible__userprofile"]
+        if self.action == "list":
+            return relations
+        return [
+            *relations,
+            "requested_by__userprofile",
+            "requester__userprofile",
+            "videos",
+        ]
+
     def get_permissions(self):
         if self.request.method == "DELETE":
             # Staff members can only delete requests which were created by them.
@@ -71,33 +230,25 @@ class RequestAdminViewSet(ModelViewSet):
         return [IsStaffUser()]
 
     def get_queryset(self):
+        crew = Prefetch(
+            "crew",
+            queryset=CrewMember.objects.select_related("member__userprofile"),
+        )
         if self.action == "list":
-            return (
-                Request.objects.select_related("responsible__userprofile")
-                .prefetch_related(
-                    Prefetch(
-                        "crew",
-                        queryset=CrewMember.objects.select_related(
-                            "member__userprofile"
-                        ),
-                    ),
-                )
-                .annotate(video_count=Count("videos"))
-                .cache()
-            )
+            return self.prune_related(
+                Request.objects.all(),
+                select_related={"responsible": ["responsible__userprofile"]},
+                prefetch_related={"crew": [crew]},
+            ).cache()
 
-        return (
-            Request.objects.select_related("requester__userprofile")
-            .select_related("requested_by__userprofile")
-            .select_related("responsible__userprofile")
-            .prefetch_related(
-                Prefetch(
-                    "crew",
-                    queryset=CrewMember.objects.select_related("member__userprofile"),
-                ),
-            )
-            .prefetch_related("videos")
-            .annotate(comment_count=Count("comments"), video_count=Count("videos"))
+        return self.prune_related(
+            Request.objects.all(),
+            select_related={
+                "requester": ["requester__userprofile"],
+                "requested_by": ["requested_by__userprofile"],
+                "responsible": ["responsible__userprofile"],
+            },
+            prefetch_related={"crew": [crew], "videos_edited": ["videos"]},
         )
 
     def get_serializer_class(self):
@@ -117,7 +268,12 @@ class RequestAdminViewSet(ModelViewSet):
         return super().partial_update(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        serializer.save(requested_by=self.request.user)
+        with status_unit_of_work():
+            serializer.save(requested_by=self.request.user)
+
+    def perform_update(self, serializer):
+        with status_unit_of_work():
+            serializer.save()
 
     @extend_schema(
         request=RequestAdminUpdateSerializer,
@@ -140,10 +296,10 @@ class RequestAdminViewSet(ModelViewSet):
 
         return Response(output_serializer.data)
 
-    @extend_schema(responses=HistorySerializer(many=True))
+    @extend_schema(
+        parameters=HISTORY_PAGINATION_PARAMETERS,
+        responses=HistorySerializer(many=True),
+    )
     @action(detail=True, filter_backends=[], pagination_class=None)
     def history(self, request, pk=None):
-        history_objects = (
-            get_object_or_404(Request, pk=pk).history.all().order_by("-history_date")
-        )
-        return Response(serialize_history(history_objects))
+        return get_history_response(self, get_object_or_404(Request, pk=pk))
@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework.fields import (
     CharField,
     DateField,
@@ -9,8 +10,16 @@ from rest_framework.fields import (
 )
 from rest_framework.serializers import ModelSerializer, Serializer
 
-from api.v1.admin.requests.helpers import handle_additional_data, is_status_by_admin
+from api.v1.admin.requests.helpers import (
+    handle_additional_data,
+    is_status_by_admin,
+    lock_additional_data,
+)
 from api.v1.admin.users.serializers import UserNestedListSerializer
+from common.rest_framework.serializers import (
+    BulkWriteResultSerializer,
+    BulkWriteSerializer,
+)
 from video_requests.models import Video
 from video_requests.utilities import update_video_status
 
@@ -53,12 +62,35 @@ class VideoAdminCreateUpdateSerializer(ModelSerializer):
         return video
 
     def update(self, instance, validated_data):
-        handle_additional_data(validated_data, self.context["request"].user, instance)
-        video = super().update(instance, validated_data)
+        with transaction.atomic():
+            # Every field is saved so the additional data must be the current one
+            lock_additional_data(instance)
+            handle_additional_data(
+                validated_data, self.context["request"].user, instance
+            )
+            video = super().update(instance, validated_data)
         update_video_status(video)
         return video
 
 
+class VideoAdminBulkUpdateSerializer(VideoAdminCreateUpdateSerializer):
+    id = IntegerField()
+
+    class Meta(VideoAdminCreateUpdateSerializer.Meta):
+        fields = ("id", *VideoAdminCreateUpdateSerializer.Meta.fields)
+        extra_kwargs = {"title": {"required": False}}
+
+
+class VideoAdminBulkSerializer(BulkWriteSerializer):
+    create = VideoAdminCreateUpdateSerializer(many=True, required=False)
+    update = VideoAdminBulkUpdateSerializer(many=True, required=False)
+
+
+class VideoAdminBulkResultSerializer(BulkWriteResultSerializer):
+    created = VideoAdminRetrieveSerializer(many=True, read_only=True)
+    updated = VideoAdminRetrieveSerializer(many=True, read_only=True)
+
+
 class VideoAdminSearchSerializer(Serializer):
     avg_rating = FloatField(default=0.0, read_only=True)
     editor = UserNestedListSerializer(read_only=True)
@@ -1,30 +1,55 @@
 from django.db.models import Prefetch
-from django.db.models.fields.json import KeyTransform
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import ListAPIView, get_object_or_404
 from rest_framework.response import Response
 from rest_framework.status import HTTP_201_CREATED
 from rest_framework.viewsets import ModelViewSet
 
-from api.v1.admin.helpers import serialize_history
+from api.v1.admin.helpers import (
+    HISTORY_PAGINATION_PARAMETERS,
+    get_history_response,
+)
 from api.v1.admin.requests.filters import VideoFilter
+from api.v1.admin.requests.helpers import handle_additional_data
 from api.v1.admin.requests.videos.serializers import (
+    VideoAdminBulkResultSerializer,
+    VideoAdminBulkSerializer,
     VideoAdminCreateUpdateSerializer,
     VideoAdminListSerializer,
     VideoAdminRetrieveSerializer,
     VideoAdminSearchSerializer,
 )
 from api.v1.admin.serializers import HistorySerializer
+from common.rest_framework.filters import FullTextSearchFilter
+from common.rest_framework.mixins import (
+    BulkWriteMixin,
+    ConditionalGetMixin,
+    NestedParentsMixin,
+    SparseFieldsetMixin,
+    StreamingListModelMixin,
+)
 from common.rest_framework.pagination import ExtendedPagination
 from common.rest_framework.permissions import IsStaffUser
 from video_requests.models import Rating, Request, Video
-
-
-class VideoAdminViewSet(ModelViewSet):
+from video_requests.services import bulk_write_videos
+from video_requests.utilities import status_unit_of_work
+
+
+class VideoAdminViewSet(
+    BulkWriteMixin,
+    ConditionalGetMixin,
+    NestedParentsMixin,
+    SparseFieldsetMixin,
+    ModelViewSet,
+):
+    authenticate_with_claims = True
+    bulk_result_serializer_class = VideoAdminBulkResultSerializer
+    bulk_serializer_class = VideoAdminBulkSerializer
     filter_backends = [OrderingFilter]
+    modified_relations = ["editor__userprofile"]
     ordering = ["title"]
     ordering_fields = [
         "avg_rating",
@@ -33,8 +58,17 @@ class VideoAdminViewSet(ModelViewSet):
         "status",
         "title",
     ]
+    parent_lookups = [("request", Request, "request_pk")]
     permission_classes = [IsStaffUser]
 
+    @extend_schema(
+        request=VideoAdminBulkSerializer,
+        responses=VideoAdminBulkResultSerializer,
+    )
+    @action(detail=False, methods=["post"], filter_backends=[])
+    def bulk(self, request, request_pk=None):
+        return self.bulk_write(request)
+
     @extend_schema(
         request=VideoAdminCreateUpdateSerializer,
         responses=VideoAdminRetrieveSerializer,
@@ -54,16 +88,18 @@ class VideoAdminViewSet(ModelViewSet):
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Video.objects.none()
-        return (
-            Video.objects.select_related("editor__userprofile")
-            .prefetch_related(
-                Prefetch(
-                    "ratings",
-                    queryset=Rating.objects.filter(author=self.request.user),
-                    to_attr="user_ratings",
-                )
-            )
-            .filter(request=get_object_or_404(Request, pk=self.kwargs["request_pk"]))
+        return self.prune_related(
+            Video.objects.filter(request=self.get_parent("request")),
+            select_related={"editor": ["editor__userprofile"]},
+            prefetch_related={
+                "rated": [
+                    Prefetch(
+                        "ratings",
+                        queryset=Rating.objects.filter(author_id=self.request.user.id),
+                        to_attr="user_ratings",
+                    )
+                ]
+            },
         )
 
     def get_serializer_class(self):
@@ -80,11 +116,30 @@ class VideoAdminViewSet(ModelViewSet):
     def partial_update(self, request, *args, **kwargs):
         return super().partial_update(request, *args, **kwargs)
 
-    def perform_create(self, serializer):
-        serializer.save(
-            request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
+    def perform_bulk_write(self, create, update, delete):
+        for data in create:
+            handle_additional_data(data, self.request.user)
+        for video, data in update:
+            handle_additional_data(data, self.request.user, video)
+        return bulk_write_videos(
+            request=self.get_parent("request"),
+            create=create,
+            update=update,
+            delete=delete,
         )
 
+    def perform_create(self, serializer):
+        with status_unit_of_work():
+            serializer.save(request=self.get_parent("request"))
+
+    def perform_destroy(self, instance):
+        with status_unit_of_work():
+            instance.delete()
+
+    def perform_update(self, serializer):
+        with status_unit_of_work():
+            serializer.save()
+
     @extend_schema(
         request=VideoAdminCreateUpdateSerializer,
         responses=VideoAdminRetrieveSerializer,
@@ -106,24 +161,28 @@ class VideoAdminViewSet(ModelViewSet):
 
         return Response(output_serializer.data)
 
-    @extend_schema(responses=HistorySerializer(many=True))
+    @extend_schema(
+        parameters=HISTORY_PAGINATION_PARAMETERS,
+        responses=HistorySerializer(many=True),
+    )
     @action(detail=True, filter_backends=[], pagination_class=None)
     def history(self, request, pk=None, request_pk=None):
-        history_objects = (
-            get_object_or_404(Video, pk=pk, request__pk=request_pk)
-            .history.all()
-            .order_by("-history_date")
+        return get_history_response(
+            self, get_object_or_404(Video, pk=pk, request__pk=request_pk)
         )
-        return Response(serialize_history(history_objects))
 
 
-class VideoAdminSearchListAPIView(ListAPIView):
+class VideoAdminSearchListAPIView(
+    ConditionalGetMixin, SparseFieldsetMixin, StreamingListModelMixin, ListAPIView
+):
+    authenticate_with_claims = True
     filter_backends = [
         DjangoFilterBackend,
         OrderingFilter,
-        SearchFilter,
+        FullTextSearchFilter,
     ]
     filterset_class = VideoFilter
+    modified_relations = ["editor__userprofile", "request"]
     ordering = ["-request__start_datetime"]
     ordering_fields = [
         "avg_rating",
@@ -139,11 +198,10 @@ class VideoAdminSearchListAPIView(ListAPIView):
     serializer_class = VideoAdminSearchSerializer
 
     def get_queryset(self):
-        return (
-            Video.objects.select_related("request")
-            .prefetch_related("ratings")
-            .annotate(
-                last_aired=KeyTransform(0, KeyTransform("aired", "additional_data"))
-            )
-            .annotate(length=KeyTransform("length", "additional_data"))
+        return self.prune_related(
+            Video.objects.all(),
+            select_related={
+                "editor": ["editor__userprofile"],
+                "request_start_datetime": ["request"],
+            },
         )
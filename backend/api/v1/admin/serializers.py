@@ -11,6 +11,8 @@ class HistoryChangesSerializer(Serializer):
 
 
 class HistorySerializer(Serializer):
-    changes = HistoryChangesSerializer(many=True, read_only=True)
-    date = DateTimeField(read_only=True, source="new_record.history_date")
-    user = UserNestedListSerializer(read_only=True, source="new_record.history_user")
+    changes = HistoryChangesSerializer(
+        many=True, read_only=True, source="history_changes"
+    )
+    date = DateTimeField(read_only=True, source="history_date")
+    user = UserNestedListSerializer(read_only=True, source="history_user")
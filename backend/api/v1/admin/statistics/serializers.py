@@ -0,0 +1,33 @@
+from rest_framework.fields import CharField, DateField, FloatField, IntegerField
+from rest_framework.serializers import Serializer
+
+from api.v1.admin.users.serializers import UserNestedListSerializer
+
+
+class StatisticsRequestsSerializer(Serializer):
+    count = IntegerField(read_only=True)
+    status = IntegerField(read_only=True)
+
+
+class StatisticsEditorSerializer(Serializer):
+    count = IntegerField(read_only=True)
+    user = UserNestedListSerializer(allow_null=True, read_only=True)
+
+
+class StatisticsCrewSerializer(Serializer):
+    count = IntegerField(read_only=True)
+    hours = FloatField(read_only=True)
+    user = UserNestedListSerializer(allow_null=True, read_only=True)
+
+
+class StatisticsAdminSerializer(Serializer):
+    avg_rating = FloatField(allow_null=True, read_only=True)
+    avg_turnaround_hours = FloatField(allow_null=True, read_only=True)
+    crew = StatisticsCrewSerializer(many=True, read_only=True)
+    edited_videos = StatisticsEditorSerializer(many=True, read_only=True)
+    end_date = DateField(read_only=True)
+    period = CharField(read_only=True)
+    published_video_count = IntegerField(read_only=True)
+    rating_count = IntegerField(read_only=True)
+    requests = StatisticsRequestsSerializer(many=True, read_only=True)
+    start_date = DateField(read_only=True)
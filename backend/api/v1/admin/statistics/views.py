@@ -0,0 +1,161 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.utils.timezone import localdate
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+from api.v1.admin.statistics.serializers import StatisticsAdminSerializer
+from common.rest_framework.permissions import IsAdminUser
+from video_requests.models import MonthlyStatistic
+from video_requests.statistics import get_next_month, get_semester
+
+
+def get_period(month: date, semester: bool) -> tuple[str, date, date]:
+    if semester:
+        return get_semester(month)
+    return f"{month:%Y-%m}", month, get_next_month(month) - timedelta(days=1)
+
+
+class StatisticsAdminView(GenericAPIView):
+    authenticate_with_claims = True
+    filter_backends = []
+    pagination_class = None
+    permission_classes = [IsAdminUser]
+    queryset = MonthlyStatistic.objects.all()
+    serializer_class = StatisticsAdminSerializer
+
+    def get_date(self, name: str, default: date) -> date:
+        try:
+            value = self.request.query_params.get(name)
+            return date.fromisoformat(value) if value else default
+        except ValueError:
+            raise ValidationError({name: [_("Invalid filter.")]})
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "period",
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                description="month or semester. Default is month.",
+                enum=["month", "semester"],
+            ),
+            OpenApiParameter(
+                "start_datetime_after",
+                OpenApiTypes.DATE,
+                OpenApiParameter.QUERY,
+                description="Default is 1 year before start_datetime_before.",
+            ),
+            OpenApiParameter(
+                "start_datetime_before",
+                OpenApiTypes.DATE,
+                OpenApiParameter.QUERY,
+                description="Default is today.",
+            ),
+        ],
+        responses=StatisticsAdminSerializer(many=True),
+    )
+    def get(self, request, *args, **kwargs):
+        period = request.query_params.get("period", "month")
+        if period not in ["month", "semester"]:
+            raise ValidationError({"period": [_("Invalid filter.")]})
+        start_datetime_before = self.get_date("start_datetime_before", localdate())
+        start_datetime_after = self.get_date(
+            "start_datetime_after", start_datetime_before - timedelta(weeks=52)
+        )
+        if start_datetime_before < start_datetime_after:
+            raise ValidationError(
+                {
+                    "start_datetime_after": [
+                        _("Must be earlier than start_datetime_before.")
+                    ]
+                }
+            )
+
+        # The statistics are precomputed by months (see update_statistics) so only
+        # the rows of the months in the range are summed up
+        statistics = list(
+            self.get_queryset()
+            .filter(
+                month__gte=start_datetime_after.replace(day=1),
+                month__lte=start_datetime_before,
+            )
+            .order_by("month", "metric", "key")
+            .cache()
+        )
+        users = User.objects.select_related("userprofile").in_bulk(
+            {
+                statistic.key
+                for statistic in statistics
+                if statistic.metric
+                in [
+                    MonthlyStatistic.Metrics.CREW,
+                    MonthlyStatistic.Metrics.EDITED_VIDEOS,
+                ]
+            }
+        )
+
+        periods = {}
+        for statistic in statistics:
+            name, start_date, end_date = get_period(
+                statistic.month, period == "semester"
+            )
+            totals = periods.setdefault(
+                name,
+                {
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    **{
+                        metric: defaultdict(lambda: [0, 0])
+                        for metric in MonthlyStatistic.Metrics
+                    },
+                },
+            )
+            total = totals[statistic.metric][statistic.key]
+            total[0] += statistic.count
+            total[1] += statistic.total
+
+        data = []
+        for name, totals in periods.items():
+            rating_count, rating_sum = totals[MonthlyStatistic.Metrics.RATINGS][0]
+            published_count, turnaround = totals[MonthlyStatistic.Metrics.TURNAROUND][0]
+            data.append(
+                {
+                    "period": name,
+                    "start_date": totals["start_date"],
+                    "end_date": totals["end_date"],
+                    "requests": [
+                        {"status": status, "count": count}
+                        for status, (count, _total) in totals[
+                            MonthlyStatistic.Metrics.REQUESTS
+                        ].items()
+                    ],
+                    "edited_videos": [
+                        {"user": users.get(user_id), "count": count}
+                        for user_id, (count, _total) in totals[
+                            MonthlyStatistic.Metrics.EDITED_VIDEOS
+                        ].items()
+                    ],
+                    "crew": [
+                        {"user": users.get(user_id), "count": count, "hours": hours}
+                        for user_id, (count, hours) in totals[
+                            MonthlyStatistic.Metrics.CREW
+                        ].items()
+                    ],
+                    "rating_count": rating_count,
+                    "avg_rating": (rating_sum / rating_count if rating_count else None),
+                    "published_video_count": published_count,
+                    "avg_turnaround_hours": (
+                        turnaround / published_count if published_count else None
+                    ),
+                }
+            )
+
+        serializer = self.get_serializer(data, many=True)
+        return Response(serializer.data)
@@ -2,6 +2,10 @@ from rest_framework.fields import CharField, DateTimeField, IntegerField
 from rest_framework.serializers import ModelSerializer, Serializer
 
 from api.v1.admin.users.serializers import UserNestedListSerializer
+from common.rest_framework.serializers import (
+    BulkWriteResultSerializer,
+    BulkWriteSerializer,
+)
 from video_requests.models import Todo
 
 
@@ -24,3 +28,21 @@ class TodoAdminCreateUpdateSerializer(ModelSerializer):
     class Meta:
         model = Todo
         fields = ["assignees", "description", "status"]
+
+
+class TodoAdminBulkUpdateSerializer(TodoAdminCreateUpdateSerializer):
+    id = IntegerField()
+
+    class Meta(TodoAdminCreateUpdateSerializer.Meta):
+        fields = ["id", *TodoAdminCreateUpdateSerializer.Meta.fields]
+        extra_kwargs = {"description": {"required": False}}
+
+
+class TodoAdminBulkSerializer(BulkWriteSerializer):
+    create = TodoAdminCreateUpdateSerializer(many=True, required=False)
+    update = TodoAdminBulkUpdateSerializer(many=True, required=False)
+
+
+class TodoAdminBulkResultSerializer(BulkWriteResultSerializer):
+    created = TodoAdminListRetrieveSerializer(many=True, read_only=True)
+    updated = TodoAdminListRetrieveSerializer(many=True, read_only=True)
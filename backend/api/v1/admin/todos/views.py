@@ -2,12 +2,9 @@ from django.contrib.auth.models import User
 from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
-from rest_framework.generics import (
-    ListCreateAPIView,
-    RetrieveUpdateDestroyAPIView,
-    get_object_or_404,
-)
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.mixins import ListModelMixin
 from rest_framework.response import Response
 from rest_framework.status import HTTP_201_CREATED
@@ -15,38 +12,73 @@ from rest_framework.viewsets import GenericViewSet
 
 from api.v1.admin.requests.filters import TodoFilter
 from api.v1.admin.todos.serializers import (
+    TodoAdminBulkResultSerializer,
+    TodoAdminBulkSerializer,
     TodoAdminCreateUpdateSerializer,
     TodoAdminListRetrieveSerializer,
 )
+from common.rest_framework.mixins import (
+    BulkWriteMixin,
+    ConditionalGetMixin,
+    ConditionalListMixin,
+    NestedParentsMixin,
+    SparseFieldsetMixin,
+    StreamingListModelMixin,
+)
 from common.rest_framework.pagination import ExtendedPagination
 from common.rest_framework.permissions import IsStaffSelfOrAdmin, IsStaffUser
 from video_requests.models import Request, Todo, Video
+from video_requests.services import bulk_write_todos
+
+
+def prune_todo_related(view, queryset):
+    return view.prune_related(
+        queryset,
+        select_related={
+            "creator": ["creator__userprofile"],
+            "request": ["request"],
+            "video": ["video"],
+        },
+        prefetch_related={
+            "assignees": [
+                Prefetch(
+                    "assignees",
+                    queryset=User.objects.select_related("userprofile"),
+                )
+            ]
+        },
+    )
 
 
-class TodoAdminViewSet(RetrieveUpdateDestroyAPIView, ListModelMixin, GenericViewSet):
+class TodoAdminViewSet(
+    ConditionalGetMixin,
+    SparseFieldsetMixin,
+    StreamingListModelMixin,
+    RetrieveUpdateDestroyAPIView,
+    ListModelMixin,
+    GenericViewSet,
+):
+    authenticate_with_claims = True
     filter_backends = [
         DjangoFilterBackend,
         OrderingFilter,
     ]
     filterset_class = TodoFilter
+    modified_relations = [
+        "assignees__userprofile",
+        "creator__userprofile",
+        "request",
+        "video",
+    ]
     ordering = ["created"]
     ordering_fields = [
         "created",
         "status",
     ]
     pagination_class = ExtendedPagination
-    queryset = (
-        Todo.objects.select_related("creator__userprofile")
-        .select_related("request")
-        .select_related("video")
-        .prefetch_related(
-            Prefetch(
-                "assignees",
-                queryset=User.objects.select_related("userprofile"),
-            ),
-        )
-        .all()
-    )
+
+    def get_queryset(self):
+        return prune_todo_related(self, Todo.objects.all())
 
     def get_permissions(self):
         # Staff members can only delete Todos created by them.
@@ -88,15 +120,44 @@ class TodoAdminViewSet(RetrieveUpdateDestroyAPIView, ListModelMixin, GenericView
         return Response(output_serializer.data)
 
 
-class TodoAdminRequestVideoViewSet(ListCreateAPIView, GenericViewSet):
+class TodoAdminRequestVideoViewSet(
+    BulkWriteMixin,
+    ConditionalListMixin,
+    NestedParentsMixin,
+    SparseFieldsetMixin,
+    ListCreateAPIView,
+    GenericViewSet,
+):
+    authenticate_with_claims = True
+    bulk_delete_permission_classes = [IsStaffSelfOrAdmin]
+    bulk_result_serializer_class = TodoAdminBulkResultSerializer
+    bulk_serializer_class = TodoAdminBulkSerializer
     filter_backends = [OrderingFilter]
+    modified_relations = [
+        "assignees__userprofile",
+        "creator__userprofile",
+        "request",
+        "video",
+    ]
     ordering = ["created"]
     ordering_fields = [
         "created",
         "status",
     ]
+    parent_lookups = [
+        ("request", Request, "request_pk"),
+        ("video", Video, "video_pk"),
+    ]
     permission_classes = [IsStaffUser]
 
+    @extend_schema(
+        request=TodoAdminBulkSerializer,
+        responses=TodoAdminBulkResultSerializer,
+    )
+    @action(detail=False, methods=["post"], filter_backends=[])
+    def bulk(self, request, request_pk=None, video_pk=None):
+        return self.bulk_write(request)
+
     @extend_schema(
         request=TodoAdminCreateUpdateSerializer,
         responses=TodoAdminListRetrieveSerializer,
@@ -116,49 +177,29 @@ class TodoAdminRequestVideoViewSet(ListCreateAPIView, GenericViewSet):
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Todo.objects.none()
-        if self.kwargs.get("video_pk"):
-            return (
-                Todo.objects.select_related("creator__userprofile")
-                .select_related("request")
-                .select_related("video")
-                .prefetch_related(
-                    Prefetch(
-                        "assignees",
-                        queryset=User.objects.select_related("userprofile"),
-                    )
-                )
-                .filter(
-                    request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
-                    video=get_object_or_404(Video, pk=self.kwargs["video_pk"]),
-                )
-            )
-        return (
-            Todo.objects.select_related("creator__userprofile")
-            .select_related("request")
-            .select_related("video")
-            .prefetch_related(
-                Prefetch(
-                    "assignees",
-                    queryset=User.objects.select_related("userprofile"),
-                )
-            )
-            .filter(
-                request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
-            )
-        )
+        queryset = Todo.objects.filter(request=self.get_parent("request"))
+        if self.get_parent("video"):
+            queryset = queryset.filter(video=self.get_parent("video"))
+        return prune_todo_related(self, queryset)
 
     def get_serializer_class(self):
         if self.request.method == "GET":
             return TodoAdminListRetrieveSerializer
         return TodoAdminCreateUpdateSerializer
 
+    def perform_bulk_write(self, create, update, delete):
+        return bulk_write_todos(
+            request=self.get_parent("request"),
+            video=self.get_parent("video"),
+            creator=self.request.user,
+            create=create,
+            update=update,
+            delete=delete,
+        )
+
     def perform_create(self, serializer):
-        request = get_object_or_404(Request, pk=self.kwargs["request_pk"])
-        if self.kwargs.get("video_pk"):
-            video = get_object_or_404(
-                Video,
-                pk=self.kwargs["video_pk"],
-                request=get_object_or_404(Request, pk=self.kwargs["request_pk"]),
-            )
-            serializer.save(creator=self.request.user, request=request, video=video)
-        serializer.save(creator=self.request.user, request=request)
+        serializer.save(
+            creator=self.request.user,
+            request=self.get_parent("request"),
+            video=self.get_parent("video"),
+        )
@@ -1,6 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import SimpleRouter
 
+from api.v1.admin.statistics.views import StatisticsAdminView
 from api.v1.admin.todos.views import TodoAdminViewSet
 
 router = SimpleRouter(trailing_slash=False)
@@ -10,4 +11,5 @@ urlpatterns = [
     path("", include((router.urls, "todos"), namespace="todos")),
     path("", include(("api.v1.admin.requests.urls", "requests"), namespace="requests")),
     path("", include(("api.v1.admin.users.urls", "users"), namespace="users")),
+    path("statistics", StatisticsAdminView.as_view(), name="statistics"),
 ]
@@ -1,10 +1,10 @@
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
 
 from decouple import strtobool
 from django.contrib.auth.models import User
 from django.db.models import Value
 from django.db.models.functions import Concat
-from django.utils.timezone import localdate
+from django.utils.timezone import localdate, make_aware
 from django.utils.translation import gettext_lazy as _
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.types import OpenApiTypes
@@ -26,17 +26,22 @@ from api.v1.admin.users.serializers import (
     UserAdminWorkedOnSerializer,
 )
 from common.models import Ban as BanModel
+from common.rest_framework.mixins import StreamingListModelMixin
 from common.rest_framework.pagination import ExtendedPagination
 from common.rest_framework.permissions import (
     IsAdminUser,
     IsStaffSelfOrAdmin,
     IsStaffUser,
 )
-from video_requests.models import CrewMember, Request, Video
+from video_requests.models import Participation
 
 
 class UserAdminViewSet(
-    RetrieveModelMixin, UpdateModelMixin, ListModelMixin, GenericViewSet
+    StreamingListModelMixin,
+    RetrieveModelMixin,
+    UpdateModelMixin,
+    ListModelMixin,
+    GenericViewSet,
 ):
     filter_backends = [
         DjangoFilterBackend,
@@ -117,7 +122,6 @@ class UserAdminViewSet(
     @action(detail=True, filter_backends=[], pagination_class=None)
     def worked_on(self, request, pk=None):
         user = get_object_or_404(User, pk=pk)
-        worked_on = []
 
         # Get and validate all query parameters by trying to convert them to the corresponding type
         # if not the default value was used.
@@ -165,47 +169,37 @@ class UserAdminViewSet(
                 }
             )
 
-        date_range = [start_datetime_after, start_datetime_before]
-
-        if is_responsible:
-            for req in Request.objects.filter(
-                responsible=user,
-                start_datetime__date__range=date_range,
-            ):
-                worked_on.append(
-                    {
-                        "id": req.id,
-                        "title": req.title,
-                        "start_datetime": req.start_datetime,
-                        "position": _("Responsible"),
-                    }
-                )
-
-        for crew in CrewMember.objects.select_related("request").filter(
-            member=user,
-            request__start_datetime__date__range=date_range,
-        ):
-            worked_on.append(
-                {
-                    "id": crew.request.id,
-                    "title": crew.request.title,
-                    "start_datetime": crew.request.start_datetime,
-                    "position": crew.position,
-                }
+        # The dates are converted to a datetime range in the current time zone so the
+        # index of the participations can be used
+        participations = Participation.objects.filter(
+            user=user,
+            start_datetime__gte=make_aware(
+                datetime.combine(start_datetime_after, time.min)
+            ),
+            start_datetime__lt=make_aware(
+                datetime.combine(start_datetime_before + timedelta(days=1), time.min)
+            ),
+        )
+        if not is_responsible:
+            participations = participations.exclude(
+                role=Participation.Roles.RESPONSIBLE
             )
 
-        for video in Video.objects.select_related("request").filter(
-            editor=user,
-            request__start_datetime__date__range=date_range,
-        ):
-            worked_on.append(
-                {
-                    "id": video.request.id,
-                    "title": video.request.title,
-                    "start_datetime": video.request.start_datetime,
-                    "position": _("Editor"),
-                }
+        worked_on = [
+            {
+                "id": participation.request_id,
+                "title": participation.request.title,
+                "start_datetime": participation.start_datetime,
+                "position": (
+                    participation.position
+                    if participation.role == Participation.Roles.CREW
+                    else participation.get_role_display()
+                ),
+            }
+            for participation in participations.select_related("request").order_by(
+                "start_datetime", "pk"
             )
+        ]
 
         serializer = UserAdminWorkedOnSerializer(worked_on, many=True)
         return Response(serializer.data)
@@ -1,6 +1,7 @@
 from urllib.parse import urljoin, urlparse
 
 from django.conf import settings
+from django.contrib.auth.models import User
 from django.http import HttpResponse
 from django.utils.encoding import iri_to_uri
 from django.utils.translation import gettext_lazy as _
@@ -14,11 +15,24 @@ from rest_framework_simplejwt.serializers import (
     TokenObtainPairSerializer as SimpleJWTTokenObtainPairSerializer,
 )
 from rest_framework_simplejwt.serializers import TokenObtainSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenRefreshSerializer as SimpleJWTTokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, Token
 from social_core.exceptions import AuthException
 
 from common.social_core.helpers import decorate_request
 
 
+def set_authorization_claims(token: Token, user: User) -> None:
+    token["groups"] = sorted(user.group_names)
+    token["is_admin"] = user.is_admin
+    token["is_service_account"] = user.is_service_account
+    token["is_staff"] = user.is_staff
+    token["role"] = user.role
+
+
 class TokenBlacklistSerializer(SimpleJWTTokenBlacklistSerializer):
     def validate(self, attrs):
         refresh = self.token_class(attrs["refresh"])
@@ -34,9 +48,8 @@ class TokenObtainPairOAuth2Serializer(SimpleJWTTokenObtainPairSerializer):
     def get_token(cls, user):
         token = super().get_token(user)
         token["avatar"] = user.userprofile.avatar_url
-        token["groups"] = list(user.groups.values_list("name", flat=True))
         token["name"] = user.get_full_name_eastern_order()
-        token["role"] = user.role
+        set_authorization_claims(token, user)
         return token
 
     # This part is a heavily modified and stripped down
@@ -82,6 +95,20 @@ class TokenObtainPairOAuth2Serializer(SimpleJWTTokenObtainPairSerializer):
         return {"refresh": str(refresh), "access": str(refresh.access_token)}
 
 
+class TokenRefreshSerializer(SimpleJWTTokenRefreshSerializer):
+    # The access token gets the current authorization claims of the user so they
+    # are never older than the lifetime of the access token.
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data["access"])
+        user = User.objects.get(
+            **{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]}
+        )
+        set_authorization_claims(access, user)
+        data["access"] = str(access)
+        return data
+
+
 class TokenObtainResponseSerializer(Serializer):
     access = CharField(read_only=True)
     refresh = CharField(read_only=True)
@@ -1,28 +1,29 @@
 from rest_framework.filters import OrderingFilter
-from rest_framework.generics import get_object_or_404
 from rest_framework.viewsets import ModelViewSet
 
 from api.v1.requests.comments.serializers import (
     CommentCreateUpdateSerializer,
     CommentListRetrieveSerializer,
 )
+from common.rest_framework.mixins import ConditionalGetMixin, NestedParentsMixin
 from common.rest_framework.permissions import IsAuthenticated, IsSelf
 from video_requests.models import Comment, Request
 
 
-class CommentViewSet(ModelViewSet):
+class CommentViewSet(ConditionalGetMixin, NestedParentsMixin, ModelViewSet):
     filter_backends = [OrderingFilter]
+    modified_relations = ["author__userprofile"]
     ordering = ["created"]
     ordering_fields = ["author__first_name", "author__last_name", "created"]
+    parent_lookups = [("request", Request, "request_pk")]
+    parent_owner_field = "requester"
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Comment.objects.none()
         return Comment.objects.select_related("author__userprofile").filter(
             internal=False,
-            request=get_object_or_404(
-                Request, pk=self.kwargs["request_pk"], requester=self.request.user
-            ),
+            request=self.get_parent("request"),
         )
 
     def get_permissions(self):
@@ -40,7 +41,5 @@ class CommentViewSet(ModelViewSet):
         serializer.save(
             author=self.request.user,
             internal=False,
-            request=get_object_or_404(
-                Request, pk=self.kwargs["request_pk"], requester=self.request.user
-            ),
+            request=self.get_parent("request"),
         )
@@ -7,23 +7,26 @@ from api.v1.requests.ratings.serializers import (
     RatingCreateUpdateSerializer,
     RatingRetrieveSerializer,
 )
+from common.rest_framework.mixins import NestedParentsMixin
 from common.rest_framework.permissions import IsSelf
 from video_requests.models import Rating, Request, Video
 
 
-class RatingViewSet(ModelViewSet):
+class RatingViewSet(NestedParentsMixin, ModelViewSet):
+    parent_lookups = [
+        ("request", Request, "request_pk"),
+        ("video", Video, "video_pk"),
+    ]
+    parent_owner_field = "requester"
     permission_classes = [IsSelf]
 
     def get_object(self):
-        queryset = Rating.objects.filter(
-            video=get_object_or_404(Video, pk=self.kwargs["video_pk"]),
-            video__request=get_object_or_404(
-                Request, pk=self.kwargs["request_pk"], requester=self.request.user
-            ),
+        # The whole chain of parents is checked by the same query
+        obj = get_object_or_404(
+            Rating.objects.filter(**self.get_parent_filters()),
+            author=self.request.user,
         )
 
-        obj = get_object_or_404(queryset, author=self.request.user)
-
         self.check_object_permissions(self.request, obj)
 
         return obj
@@ -34,13 +37,7 @@ class RatingViewSet(ModelViewSet):
         return RatingCreateUpdateSerializer
 
     def perform_create(self, serializer):
-        video = get_object_or_404(
-            Video,
-            pk=self.kwargs["video_pk"],
-            request=get_object_or_404(
-                Request, pk=self.kwargs["request_pk"], requester=self.request.user
-            ),
-        )
+        video = self.get_parent("video")
 
         if video.status < Video.Statuses.PUBLISHED:
             # A video cannot be rated before being published (reached status 5).
@@ -1,5 +1,5 @@
 from drf_spectacular.utils import PolymorphicProxySerializer, extend_schema
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.mixins import CreateModelMixin
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -12,15 +12,25 @@ from api.v1.requests.requests.serializers import (
     RequestListSerializer,
     RequestRetrieveSerializer,
 )
+from common.rest_framework.filters import FullTextSearchFilter
+from common.rest_framework.mixins import (
+    ConditionalGetMixin,
+    StreamingListModelMixin,
+)
 from common.rest_framework.pagination import ExtendedPagination
 from common.rest_framework.permissions import IsSelf
 from video_requests.models import Request
 
 
-class RequestViewSet(CreateModelMixin, ReadOnlyModelViewSet):
+class RequestViewSet(
+    ConditionalGetMixin,
+    StreamingListModelMixin,
+    CreateModelMixin,
+    ReadOnlyModelViewSet,
+):
     filter_backends = [
         OrderingFilter,
-        SearchFilter,
+        FullTextSearchFilter,
     ]
     ordering = ["created"]
     ordering_fields = [
@@ -55,6 +65,15 @@ class RequestViewSet(CreateModelMixin, ReadOnlyModelViewSet):
             output_serializer.data, status=HTTP_201_CREATED, headers=headers
         )
 
+    def get_modified_relations(self):
+        if self.action == "list":
+            return []
+        return [
+            "requested_by__userprofile",
+            "requester__userprofile",
+            "responsible__userprofile",
+        ]
+
     def get_permissions(self):
         if self.request.method == "POST":
             return [AllowAny()]
@@ -1,31 +1,33 @@
-from django.db.models import Prefetch
+from django.db.models import F, Prefetch
 from rest_framework.filters import OrderingFilter
-from rest_framework.generics import get_object_or_404
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from api.v1.requests.videos.serializers import VideoListRetrieveSerializer
+from common.rest_framework.mixins import ConditionalGetMixin, NestedParentsMixin
 from common.rest_framework.permissions import IsSelf
 from video_requests.models import Rating, Request, Video
 
 
-class VideoViewSet(ReadOnlyModelViewSet):
+class VideoViewSet(ConditionalGetMixin, NestedParentsMixin, ReadOnlyModelViewSet):
     filter_backends = [OrderingFilter]
     ordering_fields = ["status", "title"]
     ordering = ["title"]
+    parent_lookups = [("request", Request, "request_pk")]
+    parent_owner_field = "requester"
     permission_classes = [IsSelf]
     serializer_class = VideoListRetrieveSerializer
 
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Video.objects.none()
-        return Video.objects.prefetch_related(
-            Prefetch(
-                "ratings",
-                queryset=Rating.objects.filter(author=self.request.user),
-                to_attr="user_ratings",
-            )
-        ).filter(
-            request=get_object_or_404(
-                Request, pk=self.kwargs["request_pk"], requester=self.request.user
+        return (
+            Video.objects.annotate(owner_id=F("request__requester_id"))
+            .prefetch_related(
+                Prefetch(
+                    "ratings",
+                    queryset=Rating.objects.filter(author=self.request.user),
+                    to_attr="user_ratings",
+                )
             )
+            .filter(request=self.get_parent("request"))
         )
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.7 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0003_alter_ban_creator"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userprofile",
+            name="updated",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
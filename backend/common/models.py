@@ -1,16 +1,21 @@
+from datetime import UTC, datetime
+
+from cacheops import invalidate_model, invalidate_obj
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
-from django.db.models import JSONField
+from django.db import models, transaction
+from django.db.models import Case, F, JSONField, OuterRef, Subquery, Value, When
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from jsonschema import FormatChecker
 from jsonschema import ValidationError as JsonValidationError
 from jsonschema import validate
 from phonenumber_field.modelfields import PhoneNumberField
 from simple_history.models import HistoricalRecords
+from simple_history.utils import get_history_manager_for_model
 
 from common.schemas import USER_PROFILE_AVATAR_SCHEMA
 
@@ -52,6 +57,8 @@ class UserProfile(models.Model):
         blank=True,
     )
     phone_number = PhoneNumberField(blank=True)
+    # The profile is saved with the user (see signals) so it is changed with both
+    updated = models.DateTimeField(auto_now=True)
 
     def clean(self):
         if not isinstance(self.avatar, dict):
@@ -91,18 +98,215 @@ class Ban(models.Model):
         return super().save(*args, **kwargs)
 
 
+class VersionConflict(Exception):
+    pass
+
+
+class AbstractVersionedModel(models.Model):
+    """
+    Optimistic concurrency control with a version number which is incremented on
+    every save. Plain saves are last-writer-wins but still increment the version so
+    the compare-and-swap writes below can detect them. The modification time is
+    updated together with the version (e.g. for conditional requests).
+    """
+
+    MAX_RETRIES = 5
+
+    version = models.PositiveIntegerField(default=0, editable=False)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            # The new value is returned by the database after the update
+            self.version = F("version") + 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {
+                    *kwargs["update_fields"],
+                    "version",
+                    "updated",
+                }
+        super().save(*args, **kwargs)
+
+    def compare_and_swap(self, fields: list[str]) -> bool:
+        """
+        Save the given fields (with history) only if the row was not modified since
+        the object was loaded.
+        """
+        model = type(self)
+        now = timezone.now()
+        with transaction.atomic():
+            updated = model._base_manager.filter(
+                pk=self.pk, version=self.version
+            ).update(
+                version=F("version") + 1,
+                updated=now,
+                **{field: getattr(self, field) for field in fields},
+            )
+            if updated:
+                self.version += 1
+                self.updated = now
+                get_history_manager_for_model(model).bulk_history_create(
+                    [self], update=True
+                )
+        if updated:
+            # Queryset updates are not invalidated by cacheops automatically
+            invalidate_obj(self)
+        return bool(updated)
+
+    @classmethod
+    def update_with_retry(cls, pk, change, fields: list[str]):
+        """
+        Load the object, apply the change and save the given fields with
+        compare-and-swap. If the object was modified meanwhile it is loaded again
+        and the change is repeated.
+        """
+        for attempt in range(cls.MAX_RETRIES):
+            obj = cls._base_manager.get(pk=pk)
+            change(obj)
+            if obj.compare_and_swap(fields):
+                return obj
+        raise VersionConflict(f"{cls.__name__} {pk} was modified concurrently.")
+
+    @classmethod
+    def lock_stale(cls, objs: list) -> set[int]:
+        """
+        Lock the rows of the objects until the end of the transaction and return the
+        primary key of those which were modified since they were loaded.
+        """
+        if not objs:
+            return set()
+        versions = dict(
+            cls._base_manager.select_for_update()
+            .filter(pk__in=[obj.pk for obj in objs])
+            .values_list("pk", "version")
+        )
+        return {obj.pk for obj in objs if versions.get(obj.pk) != obj.version}
+
+    @classmethod
+    def bulk_update_versioned(cls, objs: list, fields: list[str]) -> None:
+        """
+        Save the given fields of the objects (with history) in one query and increment
+        their version. The rows should be locked with lock_stale() beforehand.
+        """
+        if not objs:
+            return
+        now = timezone.now()
+        cls._base_manager.filter(pk__in=[obj.pk for obj in objs]).update(
+            version=F("version") + 1,
+            updated=now,
+            **{
+                field.attname: Case(
+                    *(
+                        When(
+                            pk=obj.pk,
+                            then=Value(getattr(obj, field.attname), output_field=field),
+                        )
+                        for obj in objs
+                    ),
+                    output_field=field,
+                )
+                for field in map(cls._meta.get_field, fields)
+            },
+        )
+        for obj in objs:
+            obj.version += 1
+            obj.updated = now
+        get_history_manager_for_model(cls).bulk_history_create(objs, update=True)
+        invalidate_model(cls)
+
+
+def get_history_value(value):
+    # The values are stored as JSON the same way as they were displayed before (the
+    # datetimes in UTC as they are loaded from the database)
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = value.astimezone(UTC)
+    if value is None or isinstance(value, (bool, int, float, str, dict, list)):
+        return value
+    return str(value)
+
+
+def set_history_changes(records) -> None:
+    """
+    Set the changes of the new historical records compared to the previous record
+    of the same object before they are saved. The previous records are loaded in one
+    query and the changes of records without a previous one are left empty.
+    """
+    records = [record for record in records if record.history_type != "+"]
+    if not records:
+        return
+    model = type(records[0])
+    latest = (
+        model._default_manager.filter(id=OuterRef("id"))
+        .order_by("-history_date", "-history_id")
+        .values("history_id")[:1]
+    )
+    previous_records = {
+        previous.id: previous
+        for previous in model._default_manager.filter(
+            id__in={record.id for record in records}, history_id=Subquery(latest)
+        )
+    }
+    for record in records:
+        if previous := previous_records.get(record.id):
+            record.history_changes = [
+                {
+                    "field": change.field,
+                    "new": get_history_value(change.new),
+                    "old": get_history_value(change.old),
+                }
+                for change in record.diff_against(previous).changes
+            ]
+        # Records created together with bulk_history_create() follow each other
+        previous_records[record.id] = record
+
+
+class HistoricalChangesManager(models.Manager):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        set_history_changes(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class HistoricalChangesModel(models.Model):
+    """
+    Base of the historical models which stores the changes compared to the previous
+    record when the record is created, so the history can be listed without
+    comparing every record with the previous one. No-op records have no changes.
+    """
+
+    history_changes = JSONField(
+        encoder=DjangoJSONEncoder, blank=True, null=True, editable=False
+    )
+
+    objects = HistoricalChangesManager()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            set_history_changes([self])
+        super().save(*args, **kwargs)
+
+
 class AbstractComment(models.Model):
     author = models.ForeignKey(User, on_delete=models.SET(get_sentinel_user))
     created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
     text = models.TextField()
     internal = models.BooleanField(default=False)
-    history = HistoricalRecords(inherit=True)
+    history = HistoricalRecords(
+        bases=[HistoricalChangesModel], excluded_fields=["updated"], inherit=True
+    )
 
     class Meta:
         abstract = True
 
-    def get_owner(self):
-        return self.author
+    def get_owner_id(self) -> int:
+        return self.author_id
 
 
 class AbstractRating(models.Model):
@@ -112,18 +316,19 @@ class AbstractRating(models.Model):
     )
     review = models.TextField(blank=True)
     created = models.DateTimeField(auto_now_add=True)
-    history = HistoricalRecords(inherit=True)
+    history = HistoricalRecords(bases=[HistoricalChangesModel], inherit=True)
 
     class Meta:
         abstract = True
 
-    def get_owner(self):
-        return self.author
+    def get_owner_id(self) -> int:
+        return self.author_id
 
 
 class AbstractTodo(models.Model):
     assignees = models.ManyToManyField(User, blank=True)
     created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
     creator = models.ForeignKey(
         User, on_delete=models.SET(get_sentinel_user), related_name="todo_creator"
     )
@@ -132,5 +337,5 @@ class AbstractTodo(models.Model):
     class Meta:
         abstract = True
 
-    def get_owner(self):
-        return self.creator
+    def get_owner_id(self) -> int:
+        return self.creator_id
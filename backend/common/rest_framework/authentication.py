@@ -0,0 +1,82 @@
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+AUTHORIZATION_CLAIMS = ["is_admin", "is_service_account", "is_staff", "role"]
+
+
+class ClaimsUser(TokenUser):
+    """
+    User built from the authorization claims of the access token without loading it
+    from the database. It can only be used for permission checks and comparing ids.
+    """
+
+    @cached_property
+    def id(self) -> int:
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def group_names(self) -> frozenset[str]:
+        return frozenset(self.token.get("groups", []))
+
+    @cached_property
+    def is_admin(self) -> bool:
+        return self.token["is_admin"]
+
+    @cached_property
+    def is_service_account(self) -> bool:
+        return self.token["is_service_account"]
+
+    @cached_property
+    def role(self) -> str:
+        return self.token["role"]
+
+    def __str__(self) -> str:
+        return f"ClaimsUser {self.id}"
+
+
+class JWTClaimsAuthentication(JWTAuthentication):
+    """
+    JWT authentication which builds the user from the authorization claims of the
+    access token for safe requests to views with authenticate_with_claims set. The
+    user is loaded from the database for other requests and for tokens issued
+    without the claims. Deactivated (and banned) users are rejected in both cases,
+    the claims are only trusted after a cached check of the is_active flag which is
+    invalidated when the user is saved.
+    """
+
+    def authenticate(self, request):
+        view = request.parser_context.get("view")
+        self.use_claims = request.method in SAFE_METHODS and getattr(
+            view, "authenticate_with_claims", False
+        )
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        if self.use_claims and all(
+            claim in validated_token
+            for claim in [api_settings.USER_ID_CLAIM, *AUTHORIZATION_CLAIMS]
+        ):
+            user = ClaimsUser(validated_token)
+            if not self.is_active(user.id):
+                raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+            return user
+        return super().get_user(validated_token)
+
+    def is_active(self, user_id: int) -> bool:
+        return (
+            self.user_model.objects.filter(
+                **{api_settings.USER_ID_FIELD: user_id}, is_active=True
+            )
+            .cache(ops=["exists"])
+            .exists()
+        )
+
+
+class JWTClaimsScheme(SimpleJWTScheme):
+    target_class = JWTClaimsAuthentication
@@ -0,0 +1,96 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connections
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Lower
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+from common.search import SEARCH_CONFIG, Unaccent
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Search in the search_fields of the view with PostgreSQL full-text search. The
+    maintained search document (search_vector and search_text fields) of the model is
+    used if it contains the same fields (see SEARCH_DOCUMENT_FIELDS of the model),
+    otherwise the document is built from the fields of the model by the query. Words
+    similar by trigrams are only matched if no stemmed word matches. The results are
+    ranked by relevance unless an ordering was requested. The default search is used
+    if the database is not PostgreSQL or the search fields are not supported.
+    """
+
+    search_rank_field = "search_rank"
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return super().filter_queryset(request, queryset, view)
+        document = self.get_search_document(queryset, search_fields)
+        if document is None:
+            return super().filter_queryset(request, queryset, view)
+
+        vector, text = document
+        search_text = " ".join(search_terms)
+        query = SearchQuery(search_text, config=SEARCH_CONFIG, search_type="websearch")
+        results = queryset.alias(search_document=vector).filter(search_document=query)
+        if results.exists():
+            queryset = results.annotate(
+                **{self.search_rank_field: SearchRank(vector, query)}
+            )
+        else:
+            normalized_text = Lower(Unaccent(Value(search_text)))
+            queryset = (
+                queryset.alias(search_document=text)
+                .filter(search_document__trigram_word_similar=normalized_text)
+                .annotate(
+                    **{
+                        self.search_rank_field: TrigramWordSimilarity(
+                            normalized_text, text
+                        )
+                    }
+                )
+            )
+
+        # The ordering of the view is kept for results with the same rank
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by(
+                f"-{self.search_rank_field}",
+                *(queryset.query.order_by or queryset.model._meta.ordering),
+            )
+        return queryset
+
+    @staticmethod
+    def get_search_document(queryset, search_fields) -> tuple | None:
+        """
+        Return the vector and the normalized text of the search document of the
+        search fields or None if full-text search is not supported for them.
+        """
+        if connections[queryset.db].vendor != "postgresql":
+            return None
+        model = queryset.model
+        if set(search_fields) == set(getattr(model, "SEARCH_DOCUMENT_FIELDS", [])):
+            return F("search_vector"), F("search_text")
+
+        # Only the text fields of the model can be searched without the maintained
+        # document (the lookup prefixes of SearchFilter are not supported either)
+        text_fields = {
+            field.name
+            for field in model._meta.concrete_fields
+            if field.get_internal_type() in ["CharField", "TextField"]
+        }
+        if not set(search_fields) <= text_fields:
+            return None
+        parts = [F(search_fields[0])]
+        for field in search_fields[1:]:
+            parts += [Value(" "), F(field)]
+        text = Concat(*parts) if len(parts) > 1 else parts[0]
+        return (
+            SearchVector(*search_fields, config=SEARCH_CONFIG),
+            Lower(Unaccent(text)),
+        )
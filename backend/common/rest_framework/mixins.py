@@ -0,0 +1,387 @@
+from datetime import datetime
+from hashlib import sha256
+from itertools import batched
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from drf_spectacular.openapi import AutoSchema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+# The mixins are described by comments instead of docstrings as the docstrings would
+# be used as the description of the views in the schema.
+
+
+class BulkWriteMixin:
+    # Create, update and delete many objects of the view in one request. Every item
+    # is validated by bulk_serializer_class first, then the objects are locked and
+    # perform_bulk_write() writes them in one transaction (using bulk operations).
+    # The created and updated objects are returned loaded with get_queryset().
+    #
+    # The views must implement perform_bulk_write(create, update, delete) which
+    # writes the objects and returns the created and updated ones. Update is a list
+    # of object and changed data pairs.
+
+    bulk_serializer_class = None
+    bulk_result_serializer_class = None
+    # Checked for the deleted objects in addition to the permissions of the view
+    bulk_delete_permission_classes = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "perform_bulk_write", None)):
+            raise ImproperlyConfigured(
+                f"{cls.__name__} should implement perform_bulk_write()."
+            )
+
+    def bulk_write(self, request):
+        serializer = self.bulk_serializer_class(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        create = serializer.validated_data.get("create", [])
+        update = serializer.validated_data.get("update", [])
+        delete = serializer.validated_data.get("delete", [])
+
+        with transaction.atomic():
+            objects = self.get_bulk_objects([item["id"] for item in update] + delete)
+            for pk in delete:
+                self.check_bulk_delete_permissions(request, objects[pk])
+            created, updated = self.perform_bulk_write(
+                create,
+                [
+                    (objects[item["id"]], {k: v for k, v in item.items() if k != "id"})
+                    for item in update
+                ],
+                [objects[pk] for pk in delete],
+            )
+
+        results = self.get_queryset().in_bulk([obj.pk for obj in [*created, *updated]])
+        result_serializer = self.bulk_result_serializer_class(
+            {
+                "created": [results[obj.pk] for obj in created],
+                "deleted": delete,
+                "updated": [results[obj.pk] for obj in updated],
+            },
+            context=self.get_serializer_context(),
+        )
+        return Response(result_serializer.data)
+
+    def get_bulk_objects(self, pks: list[int]) -> dict:
+        objects = self.get_queryset().select_for_update(of=("self",)).in_bulk(pks)
+        if missing := [pk for pk in pks if pk not in objects]:
+            raise ValidationError(
+                [
+                    PrimaryKeyRelatedField.default_error_messages[
+                        "does_not_exist"
+                    ].format(pk_value=pk)
+                    for pk in missing
+                ]
+            )
+        return objects
+
+    def check_bulk_delete_permissions(self, request, obj):
+        for permission in [
+            permission() for permission in self.bulk_delete_permission_classes
+        ]:
+            if not permission.has_object_permission(request, self, obj):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
+
+
+class ConditionalListMixin:
+    # Answer GET requests with 304 Not Modified if the client already has the current
+    # representation. The ETag is calculated from the number of objects, the sum of
+    # their primary keys (so a deletion followed by a creation is not missed) and
+    # their last modification time (the updated field), so the results are neither
+    # fetched nor serialized if the client's ETag matches. The number and the last
+    # modification time of the related objects included in the response
+    # (modified_relations, lookups of models with the updated field like videos or
+    # responsible__userprofile) are added as well. Lists are sent without
+    # Last-Modified as it is not changed by deleting an object.
+
+    modified_field = "updated"
+    modified_relations = []
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if not self.has_modified_field(queryset.model):
+            return super().list(request, *args, **kwargs)
+
+        # The rows are multiplied by the joins of the relations so distinct values
+        # are counted and summed
+        distinct = bool(self.get_modified_relations())
+        aggregates = {
+            "count": Count("pk", distinct=distinct),
+            "pk_sum": Sum("pk", distinct=distinct),
+            "last_modified": Max(self.modified_field),
+            **self.get_relation_aggregates(),
+        }
+        validators = queryset.order_by().aggregate(**aggregates)
+        return self.get_conditional_response(
+            request,
+            [validators[name] for name in aggregates],
+            lambda: super(ConditionalListMixin, self).list(request, *args, **kwargs),
+            last_modified=False,
+        )
+
+    def get_modified_relations(self):
+        return self.modified_relations
+
+    def get_relation_aggregates(self) -> dict:
+        aggregates = {}
+        for index, relation in enumerate(self.get_modified_relations()):
+            aggregates[f"relation_count_{index}"] = Count(relation, distinct=True)
+            aggregates[f"relation_last_modified_{index}"] = Max(
+                f"{relation}__{self.modified_field}"
+            )
+        return aggregates
+
+    def has_modified_field(self, model) -> bool:
+        return any(
+            field.name == self.modified_field for field in model._meta.concrete_fields
+        )
+
+    def get_conditional_response(
+        self, request, validators, get_response, last_modified=True
+    ):
+        etag = self.get_etag(request, validators)
+        timestamp = None
+        if last_modified:
+            latest = max(
+                (value for value in validators if isinstance(value, datetime)),
+                default=None,
+            )
+            timestamp = latest.timestamp() if latest else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            return response
+
+        response = get_response()
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    @staticmethod
+    def get_etag(request, validators) -> str:
+        # The response depends on the user (e.g. own ratings) and the requested format
+        value = "|".join(
+            [
+                str(request.user.pk),
+                request.get_full_path(),
+                request.accepted_renderer.media_type,
+                *(
+                    value.isoformat() if isinstance(value, datetime) else str(value)
+                    for value in validators
+                ),
+            ]
+        )
+        return quote_etag(sha256(value.encode()).hexdigest())
+
+
+class ConditionalGetMixin(ConditionalListMixin):
+    # Conditional list and retrieve (see ConditionalListMixin). The permissions are
+    # checked and the validators are calculated with the object loaded in one query
+    # without its related objects (but with the aggregates of modified_relations),
+    # the full object is only loaded if the response is not 304 Not Modified.
+
+    def retrieve(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if not self.has_modified_field(queryset.model):
+            return super().retrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(
+            queryset.select_related(None)
+            .prefetch_related(None)
+            .annotate(**self.get_relation_aggregates()),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        self.check_object_permissions(request, instance)
+
+        validators = [instance.pk, getattr(instance, self.modified_field)]
+        validators += [
+            getattr(instance, name) for name in self.get_relation_aggregates()
+        ]
+        return self.get_conditional_response(
+            request,
+            validators,
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs),
+        )
+
+
+class NestedParentsMixin:
+    # Resolve the parent objects of a nested view from the URL in one query and
+    # cache them on the view. parent_lookups lists the parents from the outermost
+    # one as (name, model, URL keyword argument) where the name is the foreign key
+    # pointing to the parent from the next level. Parents missing from the URL are
+    # None (they must be the innermost ones). The innermost parent is loaded with the
+    # outer ones selected and filtered by their keys, and by parent_owner_field (a
+    # lookup of the outermost parent) which must match the user if set.
+
+    parent_lookups = []
+    parent_owner_field = None
+
+    def get_parent(self, name):
+        if not hasattr(self, "_parents"):
+            self._parents = self.resolve_parents()
+        return self._parents[name]
+
+    def get_parent_filters(self, levels=None) -> dict:
+        # Lookups filtering the objects of the view (or the parent after the given
+        # levels) by every parent in the URL and the owner
+        if levels is None:
+            levels = self.get_url_parents()
+        filters, path = {}, ""
+        for name, model, kwarg in reversed(levels):
+            path += name
+            filters[f"{path}__pk"] = self.kwargs[kwarg]
+            path += "__"
+        if self.parent_owner_field:
+            filters[f"{path}{self.parent_owner_field}"] = self.request.user.pk
+        return filters
+
+    def get_url_parents(self) -> list:
+        return [level for level in self.parent_lookups if level[2] in self.kwargs]
+
+    def resolve_parents(self) -> dict:
+        parents = dict.fromkeys(name for name, model, kwarg in self.parent_lookups)
+        *outer, (name, model, kwarg) = self.get_url_parents()
+        related = "__".join(name for name, model, kwarg in reversed(outer))
+        queryset = model.objects.select_related(*([related] if related else []))
+        parent = get_object_or_404(
+            queryset, pk=self.kwargs[kwarg], **self.get_parent_filters(outer)
+        )
+        parents[name] = parent
+        for name, model, kwarg in reversed(outer):
+            parent = getattr(parent, name)
+            parents[name] = parent
+        return parents
+
+
+class SparseFieldsetSchema(AutoSchema):
+    def get_override_parameters(self):
+        parameters = super().get_override_parameters()
+        # Custom actions (e.g. history) do not use the serializer of the view
+        if self.method != "GET" or getattr(self.view, "action", None) not in [
+            None,
+            "list",
+            "retrieve",
+        ]:
+            return parameters
+        return [
+            *parameters,
+            OpenApiParameter(
+                self.view.fields_query_param,
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                description="Comma separated list of fields to return.",
+            ),
+            OpenApiParameter(
+                self.view.omit_query_param,
+                OpenApiTypes.STR,
+                OpenApiParameter.QUERY,
+                description="Comma separated list of fields to leave out.",
+            ),
+        ]
+
+
+class SparseFieldsetMixin:
+    # Return only the fields requested by the client (?fields=id,title) or leave out
+    # some of them (?omit=crew) in GET responses. The related objects of the removed
+    # fields are not fetched either if get_queryset adds them with prune_related.
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+    schema = SparseFieldsetSchema()
+
+    def get_query_param_set(self, name) -> set[str] | None:
+        value = self.request.query_params.get(name)
+        if value is None:
+            return None
+        return {field.strip() for field in value.split(",") if field.strip()}
+
+    def is_field_requested(self, name) -> bool:
+        if self.request.method != "GET":
+            return True
+        fields = self.get_query_param_set(self.fields_query_param)
+        omit = self.get_query_param_set(self.omit_query_param) or set()
+        return (fields is None or name in fields) and name not in omit
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self.request.method == "GET":
+            fields = getattr(serializer, "child", serializer).fields
+            for name in list(fields):
+                if not self.is_field_requested(name):
+                    fields.pop(name)
+        return serializer
+
+    def prune_related(self, queryset, select_related=None, prefetch_related=None):
+        """
+        Apply the select_related and prefetch_related lookups (mapped by the name of
+        the serializer field which needs them) only for the requested fields.
+        """
+        for name, lookups in (select_related or {}).items():
+            if self.is_field_requested(name):
+                queryset = queryset.select_related(*lookups)
+        for name, lookups in (prefetch_related or {}).items():
+            if self.is_field_requested(name):
+                queryset = queryset.prefetch_related(*lookups)
+        return queryset
+
+
+class StreamingListModelMixin:
+    # Stream the results as a JSON array if the client disabled the pagination.
+    # The queryset is fetched and serialized in chunks (prefetching only the related
+    # objects of the current chunk) so the memory usage does not grow with the number
+    # of results and the response starts before the last row is fetched.
+
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        if not self.should_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+        return StreamingHttpResponse(
+            self.stream_results(queryset, renderer),
+            content_type=renderer.media_type,
+        )
+
+    def should_stream(self, request) -> bool:
+        return (
+            self.paginator is not None
+            and hasattr(self.paginator, "is_disabled")
+            and self.paginator.is_disabled(request)
+            and isinstance(request.accepted_renderer, JSONRenderer)
+        )
+
+    def stream_results(self, queryset, renderer):
+        renderer_context = self.get_renderer_context()
+        separator = b""
+        yield b"["
+        for chunk in batched(
+            queryset.iterator(chunk_size=self.stream_chunk_size), self.stream_chunk_size
+        ):
+            data = self.get_serializer(chunk, many=True).data
+            rendered = renderer.render(data, renderer_context=renderer_context)
+            # Remove the brackets of the array to join the chunks
+            yield separator + rendered[1:-1]
+            separator = b","
+        yield b"]"
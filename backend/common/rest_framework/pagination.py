@@ -1,33 +1,262 @@
+import json
+from base64 import b64decode, b64encode
 from collections import OrderedDict
+from datetime import date, datetime, time
 
 from decouple import strtobool
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F, Model, OrderBy, Q
 from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CountCachingPaginator(Paginator):
+    """
+    Paginator which caches the number of results until the related tables are
+    modified (using cacheops) and estimates it from the PostgreSQL statistics for
+    large tables without filters if APPROXIMATE_COUNT_THRESHOLD is set.
+    """
+
+    count_exact = True
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        threshold = settings.APPROXIMATE_COUNT_THRESHOLD
+        if threshold and self.is_estimable(queryset):
+            estimate = self.estimate_count(queryset)
+            if estimate >= threshold:
+                self.count_exact = False
+                return estimate
+        return queryset.cache(ops=["count"]).count()
+
+    @staticmethod
+    def is_estimable(queryset) -> bool:
+        query = queryset.query
+        return (
+            connections[queryset.db].vendor == "postgresql"
+            and not query.where
+            and not query.distinct
+            and not query.combinator
+            and not query.is_sliced
+        )
+
+    @staticmethod
+    def estimate_count(queryset) -> int:
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # The estimate is -1 if the table was not analyzed yet
+        return max(int(row[0]), 0) if row else 0
 
 
 class ExtendedPagination(PageNumberPagination):
+    django_paginator_class = CountCachingPaginator
     page_size = 100
     page_size_query_param = "page_size"
 
     # Client can control if they want pagination using this query parameter.
     # Default is True. If False is passed in, data is returned without pagination.
     pagination_query_param = "pagination"
-    pagination_query_description = _("Return paginated response.")
+    pagination_query_description = _(
+        "Return paginated response. Pass cursor to use cursor pagination."
+    )
+
+    # Keyset pagination is used instead of page numbers if the pagination query
+    # parameter is "cursor" or a cursor is passed. It does not count the results.
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "The pagination cursor value. Pass pagination=cursor to get the first page."
+    )
+    invalid_cursor_message = _("Invalid cursor")
+    invalid_ordering_message = _("Cursor pagination is not supported for the ordering.")
+
+    cursor_mode = False
 
     def paginate_queryset(self, queryset, request, view=None):
         pagination = request.query_params.get(self.pagination_query_param, "true")
-        if not strtobool(pagination):
+        self.cursor_mode = (
+            pagination == "cursor" or self.cursor_query_param in request.query_params
+        )
+        if self.cursor_mode:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
+        if self.is_disabled(request):
             return None
 
         return super().paginate_queryset(queryset, request, view)
 
+    def is_disabled(self, request) -> bool:
+        pagination = request.query_params.get(self.pagination_query_param, "true")
+        return (
+            pagination != "cursor"
+            and self.cursor_query_param not in request.query_params
+            and not strtobool(pagination)
+        )
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        ordering = self.get_cursor_ordering(queryset)
+        position, reverse = self.decode_cursor(request, len(ordering))
+        if reverse:
+            ordering = [(name, not descending) for name, descending in ordering]
+
+        # NULL values are placed the same way as PostgreSQL does by default
+        queryset = queryset.order_by(
+            *(
+                (
+                    F(name).desc(nulls_first=True)
+                    if descending
+                    else F(name).asc(nulls_last=True)
+                )
+                for name, descending in ordering
+            )
+        )
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(ordering, position))
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            ordering = [(name, not descending) for name, descending in ordering]
+            results.reverse()
+
+        has_next = position is not None if reverse else has_more
+        has_previous = has_more if reverse else position is not None
+        self.next_cursor = (
+            self.encode_cursor(results[-1], ordering, False)
+            if has_next and results
+            else None
+        )
+        self.previous_cursor = (
+            self.encode_cursor(results[0], ordering, True)
+            if has_previous and results
+            else None
+        )
+        return results
+
+    def get_cursor_ordering(self, queryset) -> list[tuple[str, bool]]:
+        """
+        Return the names of the fields (or annotations) in the ordering of the
+        queryset and if they are descending. The position of a row can not be encoded
+        for other expressions so cursor pagination is rejected for them.
+        """
+        ordering = []
+        for field in queryset.query.order_by or queryset.model._meta.ordering:
+            if isinstance(field, str) and field != "?":
+                ordering.append((field.lstrip("-"), field.startswith("-")))
+            elif isinstance(field, F):
+                ordering.append((field.name, False))
+            elif isinstance(field, OrderBy) and isinstance(field.expression, F):
+                ordering.append((field.expression.name, field.descending))
+            else:
+                raise ValidationError(
+                    {self.pagination_query_param: [self.invalid_ordering_message]}
+                )
+        # The primary key is used as a tie-breaker between rows with the same values
+        if not any(name in ["id", "pk"] for name, descending in ordering):
+            ordering.append(("pk", False))
+        return ordering
+
+    @staticmethod
+    def get_keyset_filter(ordering: list[tuple[str, bool]], position: list) -> Q:
+        """
+        Filter the rows after the position in the given ordering, which is
+        (a > x) OR (a = x AND b > y) OR ... with NULL values placed last ascending.
+        """
+        condition, same = Q(pk__in=[]), Q()
+        for (name, descending), value in zip(ordering, position):
+            if value is None:
+                if descending:
+                    condition |= same & Q(**{f"{name}__isnull": False})
+                same &= Q(**{f"{name}__isnull": True})
+            else:
+                after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+                if not descending:
+                    after |= Q(**{f"{name}__isnull": True})
+                condition |= same & after
+                same &= Q(**{name: value})
+        return condition
+
+    def encode_cursor(self, obj, ordering: list[tuple[str, bool]], reverse: bool):
+        position = []
+        for name, descending in ordering:
+            value = obj
+            for attribute in name.split("__"):
+                value = getattr(value, attribute, None)
+            if isinstance(value, Model):
+                value = value.pk
+            elif isinstance(value, (date, datetime, time)):
+                value = value.isoformat()
+            elif value is not None and not isinstance(value, (bool, int, float, str)):
+                value = str(value)
+            position.append(value)
+
+        cursor = b64encode(json.dumps({"p": position, "r": reverse}).encode()).decode()
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, length: int) -> tuple[list | None, bool]:
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(b64decode(cursor.encode(), validate=True))
+            position, reverse = data["p"], bool(data["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != length:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_next_link(self):
+        if self.cursor_mode:
+            return self.next_cursor
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if self.cursor_mode:
+            return self.previous_cursor
+        return super().get_previous_link()
+
     def get_paginated_response(self, data):
+        if self.cursor_mode:
+            return Response(
+                OrderedDict(
+                    [
+                        (
+                            "links",
+                            OrderedDict(
+                                [
+                                    ("next", self.get_next_link()),
+                                    ("previous", self.get_previous_link()),
+                                ]
+                            ),
+                        ),
+                        ("results", data),
+                    ]
+                )
+            )
+
         return Response(
             OrderedDict(
                 [
                     ("count", self.page.paginator.count),
+                    ("count_exact", self.page.paginator.count_exact),
                     (
                         "links",
                         OrderedDict(
@@ -51,6 +280,10 @@ class ExtendedPagination(PageNumberPagination):
                     "type": "integer",
                     "example": 123,
                 },
+                "count_exact": {
+                    "type": "boolean",
+                    "example": True,
+                },
                 "links": {
                     "type": "object",
                     "properties": {
@@ -89,7 +322,21 @@ class ExtendedPagination(PageNumberPagination):
                 "in": "query",
                 "description": force_str(self.pagination_query_description),
                 "schema": {
-                    "type": "boolean",
+                    "oneOf": [
+                        {"type": "boolean"},
+                        {"type": "string", "enum": ["cursor"]},
+                    ],
+                },
+            },
+        )
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.cursor_query_description),
+                "schema": {
+                    "type": "string",
                 },
             },
         )
@@ -72,7 +72,7 @@ class IsServiceAccount(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         if isinstance(obj, Request):
-            return bool(obj.requested_by == request.user)
+            return bool(obj.requested_by_id == request.user.pk)
         else:
             return False
 
@@ -80,14 +80,14 @@ class IsServiceAccount(BasePermission):
 class IsSelf(IsAuthenticated):
     """
     Allows access only if the user is authenticated and the owner of the object.
-    Models must implement get_owner(). User objects are compared directly.
+    Models must implement get_owner_id(). User objects are compared by their id.
     """
 
     def has_object_permission(self, request, view, obj):
         if isinstance(obj, User):
-            return bool(obj == request.user)
-        if hasattr(obj, "get_owner"):
-            return bool(obj.get_owner() == request.user)
+            return bool(obj.pk == request.user.pk)
+        if hasattr(obj, "get_owner_id"):
+            return bool(obj.get_owner_id() == request.user.pk)
         return False
 
 
@@ -109,6 +109,6 @@ class IsStaffSelfOrAdmin(IsStaffUser, IsSelfOrAdmin):
     """
 
     def has_object_permission(self, request, view, obj):
-        if isinstance(obj, Request) and bool(obj.requested_by == request.user):
+        if isinstance(obj, Request) and bool(obj.requested_by_id == request.user.pk):
             return True
         return super().has_object_permission(request, view, obj)
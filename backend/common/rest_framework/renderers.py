@@ -0,0 +1,48 @@
+from functools import cached_property
+
+import orjson
+from django.utils.functional import Promise
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON using orjson. The output is the same as of the
+    JSONRenderer of REST framework, the types not supported by orjson (lazy
+    translations, decimals, phone numbers, etc.) are converted by its encoder.
+    Datetimes are serialized by orjson with UTC represented as Z like the encoder
+    does (naive datetimes are kept naive).
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        # orjson can only indent with 2 spaces and does not escape non-ASCII characters
+        if (
+            self.get_indent(accepted_media_type, renderer_context) is not None
+            or self.ensure_ascii
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.default, option=self.options)
+        # Escape the line and paragraph separators the same way as REST framework
+        # to output JSON that is a strict JavaScript subset.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+    @cached_property
+    def encoder(self):
+        return self.encoder_class()
+
+    def default(self, obj):
+        if isinstance(obj, (PhoneNumber, Promise)):
+            return str(obj)
+        return self.encoder.default(obj)
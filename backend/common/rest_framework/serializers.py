@@ -0,0 +1,28 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import IntegerField, ListField
+from rest_framework.serializers import Serializer
+
+
+class BulkWriteSerializer(Serializer):
+    """
+    Base serializer of batch writes. Subclasses should add the create and update
+    lists (with many=True serializers) where the items of update contain the id.
+    """
+
+    delete = ListField(child=IntegerField(), required=False)
+
+    def validate(self, attrs):
+        pks = [item["id"] for item in attrs.get("update", [])] + attrs.get("delete", [])
+        if len(pks) != len(set(pks)):
+            raise ValidationError(_("An object can be updated or deleted only once."))
+        return attrs
+
+
+class BulkWriteResultSerializer(Serializer):
+    """
+    Base serializer of the result of batch writes. Subclasses should add the created
+    and updated lists.
+    """
+
+    deleted = ListField(child=IntegerField(), read_only=True)
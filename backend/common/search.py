@@ -0,0 +1,10 @@
+from django.db.models import Func, TextField
+
+# Text search configuration created by the migrations: the Hungarian stemmer after
+# removing the accents with the unaccent extension
+SEARCH_CONFIG = "hungarian_unaccent"
+
+
+class Unaccent(Func):
+    function = "UNACCENT"
+    output_field = TextField()
@@ -1,5 +1,5 @@
 from django.contrib.auth.models import User
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -15,6 +15,13 @@ def create_or_save_user_profile(sender, instance, created, **kwargs):
         instance.userprofile.save()
 
 
+@receiver(m2m_changed, sender=User.groups.through)
+def m2m_changed_user_groups(sender, instance, action, reverse, **kwargs):
+    # Users changed from the side of the group are reloaded on their next request
+    if action.startswith("post_") and not reverse:
+        instance.clear_group_names()
+
+
 @receiver(post_save, sender=Ban)
 def post_save_ban(sender, instance, **kwargs):
     instance.receiver.is_active = False
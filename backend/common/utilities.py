@@ -27,20 +27,43 @@ def get_full_name_eastern_order(self) -> str:
     return full_name.strip()
 
 
+@property
+def group_names(self) -> frozenset[str]:
+    """
+    Names of the groups of the user. They are loaded once per user object (so once
+    per request for the authenticated user) or taken from the prefetched groups and
+    cleared when the groups of the user are changed.
+    """
+    if "_group_names" not in self.__dict__:
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "groups" in prefetched:
+            names = (group.name for group in prefetched["groups"])
+        else:
+            names = self.groups.values_list("name", flat=True)
+        self.__dict__["_group_names"] = frozenset(names)
+    return self.__dict__["_group_names"]
+
+
+def clear_group_names(self) -> None:
+    self.__dict__.pop("_group_names", None)
+
+
 @property
 def is_admin(self) -> bool:
     return self.is_staff and (
-        self.groups.filter(name=settings.ADMIN_GROUP).exists() or self.is_superuser
+        settings.ADMIN_GROUP in self.group_names or self.is_superuser
     )
 
 
 @property
 def is_service_account(self) -> bool:
-    return self.groups.filter(name=settings.SERVICE_ACCOUNTS_GROUP).exists()
+    return settings.SERVICE_ACCOUNTS_GROUP in self.group_names
 
 
 User.add_to_class("role", role)
 User.add_to_class("get_full_name_eastern_order", get_full_name_eastern_order)
+User.add_to_class("group_names", group_names)
+User.add_to_class("clear_group_names", clear_group_names)
 User.add_to_class("is_admin", is_admin)
 User.add_to_class("is_service_account", is_service_account)
 
@@ -109,7 +132,7 @@ def create_calendar_event(request_id):
         return "Missing credentials file for Google Calendar"
     request = Request.objects.get(pk=request_id)  # nosec B113
     service = get_google_calendar_service()
-    request.additional_data["calendar_id"] = (
+    calendar_id = (
         service.events()
         .insert(
             calendarId=settings.GOOGLE_CALENDAR_ID,
@@ -117,7 +140,12 @@ def create_calendar_event(request_id):
         )
         .execute()["id"]
     )
-    request.save()
+    # Only the calendar id is written so concurrent changes are not overwritten
+    Request.update_with_retry(
+        request.pk,
+        lambda obj: obj.additional_data.update(calendar_id=calendar_id),
+        ["additional_data"],
+    )
     return f"Calendar event for {request.title} was created successfully."
 
 
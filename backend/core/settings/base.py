@@ -146,6 +146,10 @@ CACHEOPS = {
     "*.*": {"timeout": 60 * 60},
 }
 
+# Paginated list responses estimate the number of results of unfiltered queries
+# on tables with at least this many rows instead of counting them (0 disables it).
+APPROXIMATE_COUNT_THRESHOLD = config("APPROXIMATE_COUNT_THRESHOLD", default=0, cast=int)
+
 # Celery
 # https://docs.celeryproject.org/en/stable/userguide/configuration.html
 
@@ -173,10 +177,17 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
 CELERY_BEAT_SCHEDULE = {
+    # Requests are updated by a task scheduled for the end of the event (before the
+    # next run), this schedules them and updates the ones which were missed.
     "update_request_status": {
         "task": "core.tasks.scheduled_update_request_status",
         "schedule": crontab(minute=10),
     },
+    # Only the months with changes since the previous run are recalculated
+    "update_statistics": {
+        "task": "core.tasks.scheduled_update_statistics",
+        "schedule": crontab(minute="*/15"),
+    },
     "daily_reminder_email": {
         "task": "core.tasks.scheduled_send_daily_reminder_email",
         "schedule": crontab(minute=0, hour=7),
@@ -223,10 +234,15 @@ SERVICE_ACCOUNTS_GROUP = config("SERVICE_ACCOUNTS_GROUP", default="Service Accou
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "common.rest_framework.authentication.JWTClaimsAuthentication",
         "rest_framework.authentication.TokenAuthentication",
     ],
-    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.rest_framework.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_RENDERER_CLASSES": ["common.rest_framework.renderers.ORJSONRenderer"],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_THROTTLE_CLASSES": ["rest_framework.throttling.AnonRateThrottle"],
     "DEFAULT_THROTTLE_RATES": {
@@ -246,6 +262,7 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(hours=6),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "api.v1.login.serializers.TokenRefreshSerializer",
 }
 
 # Internationalization
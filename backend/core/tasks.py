@@ -18,6 +18,13 @@ def scheduled_update_request_status():
         return out.getvalue()
 
 
+@shared_task
+def scheduled_update_statistics():
+    with StringIO() as out:
+        call_command("update_statistics", stdout=out)
+        return out.getvalue()
+
+
 @shared_task
 def scheduled_send_daily_reminder_email():
     with StringIO() as out:
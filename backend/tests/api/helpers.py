@@ -1,3 +1,5 @@
+import json
+
 from django.contrib.auth.models import User
 from model_bakery import baker
 from rest_framework.authtoken.models import Token
@@ -10,6 +12,11 @@ def assert_fields_exist(response, expected_fields):
     assert all(field in expected_fields for field in response)
 
 
+def get_streamed_data(response):
+    # Unpaginated lists are streamed so their content has to be collected
+    return json.loads(b"".join(response.streaming_content))
+
+
 def authorize(client, user):
     token = Token.objects.get_or_create(user=user)[0]
     client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
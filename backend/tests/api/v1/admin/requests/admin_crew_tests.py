@@ -1,6 +1,7 @@
 from random import randint
 
 import pytest
+from django.contrib.auth.models import User
 from model_bakery import baker
 from rest_framework.reverse import reverse
 from rest_framework.status import (
@@ -316,3 +317,72 @@ def test_create_update_crew_member_invalid_member(
 
     if response.status_code == HTTP_400_BAD_REQUEST:
         assert response.data["member"][0].code == "does_not_exist"
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", HTTP_200_OK),
+        ("staff_user", HTTP_200_OK),
+        ("basic_user", HTTP_403_FORBIDDEN),
+        ("service_account", HTTP_403_FORBIDDEN),
+        (None, HTTP_401_UNAUTHORIZED),
+    ],
+)
+def test_bulk_write_crew_members(api_client, expected, request, user):
+    video_request = baker.make("video_requests.Request")
+    crew_members = baker.make(
+        "video_requests.CrewMember", request=video_request, _quantity=3
+    )
+    members = baker.make(User, is_staff=True, _quantity=2)
+
+    do_login(api_client, request, user)
+
+    url = reverse(
+        "api:v1:admin:requests:request:crew-bulk",
+        kwargs={"request_pk": video_request.id},
+    )
+    data = {
+        "create": [{"member": member.id, "position": "Stábtag"} for member in members],
+        "update": [{"id": crew_members[0].id, "position": "Riporter"}],
+        "delete": [crew_members[1].id],
+    }
+    response = api_client.post(url, data, format="json")
+
+    assert response.status_code == expected
+
+    if is_success(response.status_code):
+        assert len(response.data["created"]) == 2
+        for crew in response.data["created"] + response.data["updated"]:
+            assert_response_keys(crew)
+        assert response.data["updated"][0]["position"] == "Riporter"
+        assert response.data["deleted"] == [crew_members[1].id]
+        assert CrewMember.objects.filter(request=video_request).count() == 4
+
+
+def test_bulk_write_crew_members_is_atomic(api_client, request):
+    video_request = baker.make("video_requests.Request")
+    crew_member = baker.make("video_requests.CrewMember", request=video_request)
+    other_crew_member = baker.make("video_requests.CrewMember")
+
+    do_login(api_client, request, "admin_user")
+
+    url = reverse(
+        "api:v1:admin:requests:request:crew-bulk",
+        kwargs={"request_pk": video_request.id},
+    )
+    data = {
+        "update": [{"id": crew_member.id, "position": "Riporter"}],
+        "delete": [other_crew_member.id],
+    }
+    response = api_client.post(url, data, format="json")
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    crew_member.refresh_from_db()
+    assert crew_member.position != "Riporter"
+    assert CrewMember.objects.filter(pk=other_crew_member.id).exists()
+
+    data = {"update": [{"id": crew_member.id}], "delete": [crew_member.id]}
+    response = api_client.post(url, data, format="json")
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
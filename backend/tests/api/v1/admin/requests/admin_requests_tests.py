@@ -1,9 +1,12 @@
 from copy import deepcopy
 from datetime import timedelta
 from itertools import combinations
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import localtime
 from model_bakery import baker
 from rest_framework.exceptions import ErrorDetail
@@ -19,8 +22,14 @@ from rest_framework.status import (
     is_success,
 )
 
-from tests.api.helpers import assert_fields_exist, do_login, get_response
-from video_requests.models import Comment, Video
+from tests.api.helpers import (
+    assert_fields_exist,
+    do_login,
+    get_response,
+    get_streamed_data,
+    login,
+)
+from video_requests.models import Comment, Request, Video
 
 pytestmark = pytest.mark.django_db
 
@@ -135,13 +144,16 @@ def test_list_requests(api_client, expected, pagination, request, user):
     if is_success(response.status_code):
         if pagination:
             assert_fields_exist(
-                response.data, ["count", "links", "results", "total_pages"]
+                response.data,
+                ["count", "count_exact", "links", "results", "total_pages"],
             )
             assert_fields_exist(response.data["links"], ["next", "previous"])
 
             assert response.data["count"] == len(video_requests)
 
-        response_data = response.data["results"] if pagination else response.data
+        response_data = (
+            response.data["results"] if pagination else get_streamed_data(response)
+        )
         assert len(response_data) == len(video_requests)
         for video_request in response_data:
             assert_list_response_keys(video_request)
@@ -730,3 +742,256 @@ def test_destroy_others_request(api_client, expected, request, scenario, user):
     response = api_client.delete(url)
 
     assert response.status_code == expected
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", HTTP_200_OK),
+        ("staff_user", HTTP_200_OK),
+        ("basic_user", HTTP_403_FORBIDDEN),
+        ("service_account", HTTP_403_FORBIDDEN),
+        (None, HTTP_401_UNAUTHORIZED),
+    ],
+)
+def test_retrieve_request_bundle(api_client, expected, request, user):
+    video_request = baker.make("video_requests.Request")
+    videos = baker.make("video_requests.Video", request=video_request, _quantity=2)
+    baker.make("video_requests.CrewMember", request=video_request, _quantity=2)
+    baker.make("video_requests.Comment", request=video_request, _quantity=3)
+    baker.make("video_requests.Todo", request=video_request, _quantity=2)
+
+    user = do_login(api_client, request, user)
+    if user:
+        baker.make("video_requests.Rating", video=videos[0], author=user)
+        baker.make("video_requests.Rating", video=videos[1])
+
+    url = reverse(
+        "api:v1:admin:requests:request-bundle", kwargs={"pk": video_request.id}
+    )
+    response = api_client.get(url)
+
+    assert response.status_code == expected
+
+    if is_success(response.status_code):
+        assert response.data["request"]["id"] == video_request.id
+        assert len(response.data["comments"]) == 3
+        assert len(response.data["crew"]) == 2
+        assert len(response.data["todos"]) == 2
+        assert len(response.data["videos"]) == 2
+        assert len(response.data["ratings"]) == 1
+        assert response.data["ratings"][0]["video"] == videos[0].id
+
+
+def test_retrieve_request_bundle_include(api_client, request):
+    video_request = baker.make("video_requests.Request")
+    baker.make("video_requests.Video", request=video_request, _quantity=2)
+    baker.make("video_requests.Comment", request=video_request, _quantity=3)
+
+    do_login(api_client, request, "admin_user")
+
+    url = reverse(
+        "api:v1:admin:requests:request-bundle", kwargs={"pk": video_request.id}
+    )
+    response = api_client.get(url, {"include": "videos,not_existing"})
+
+    assert response.status_code == HTTP_200_OK
+    assert set(response.data) == {"request", "videos"}
+    assert len(response.data["videos"]) == 2
+
+
+def test_retrieve_request_bundle_uses_fixed_number_of_queries(api_client, request):
+    user = do_login(api_client, request, "admin_user")
+
+    def get_bundle(count):
+        video_request = baker.make("video_requests.Request")
+        videos = baker.make(
+            "video_requests.Video", request=video_request, _quantity=count
+        )
+        for video in videos:
+            baker.make("video_requests.Rating", video=video, author=user)
+            todo = baker.make("video_requests.Todo", request=video_request, video=video)
+            todo.assignees.add(user)
+        baker.make("video_requests.Comment", request=video_request, _quantity=count)
+        baker.make("video_requests.CrewMember", request=video_request, _quantity=count)
+
+        url = reverse(
+            "api:v1:admin:requests:request-bundle", kwargs={"pk": video_request.id}
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        assert len(response.data["todos"]) == count
+        return len(queries)
+
+    assert get_bundle(1) == get_bundle(5)
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", HTTP_200_OK),
+        ("staff_user", HTTP_200_OK),
+        ("basic_user", HTTP_403_FORBIDDEN),
+        (None, HTTP_401_UNAUTHORIZED),
+    ],
+)
+def test_bulk_update_requests_by_filter(api_client, expected, request, user):
+    requested = baker.make(
+        "video_requests.Request", status=Request.Statuses.REQUESTED, _quantity=3
+    )
+    other = baker.make("video_requests.Request", status=Request.Statuses.DENIED)
+
+    do_login(api_client, request, user)
+
+    url = reverse("api:v1:admin:requests:request-bulk-update")
+    response = api_client.post(
+        url,
+        {
+            "additional_data": {"recording": {"path": "/test"}},
+            "filter": {"status": [Request.Statuses.REQUESTED]},
+        },
+        format="json",
+    )
+
+    assert response.status_code == expected
+
+    if is_success(response.status_code):
+        assert sorted(result["id"] for result in response.data) == sorted(
+            video_request.id for video_request in requested
+        )
+        assert all(result["success"] for result in response.data)
+        for video_request in requested:
+            video_request.refresh_from_db()
+            assert video_request.additional_data["recording"]["path"] == "/test"
+        other.refresh_from_db()
+        assert "recording" not in other.additional_data
+
+
+def test_bulk_update_requests_returns_result_per_request(api_client, request):
+    video_requests = baker.make(
+        "video_requests.Request",
+        start_datetime=localtime() - timedelta(hours=2),
+        end_datetime=localtime() - timedelta(hours=1),
+        _quantity=2,
+    )
+    invalid = baker.make("video_requests.Request", additional_data={})
+
+    user = do_login(api_client, request, "admin_user")
+
+    url = reverse("api:v1:admin:requests:request-bulk-update")
+    response = api_client.post(
+        url,
+        {
+            "additional_data": {"accepted": True},
+            "ids": [video_requests[0].id, 0, video_requests[1].id],
+        },
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert [result["id"] for result in response.data] == [
+        video_requests[0].id,
+        0,
+        video_requests[1].id,
+    ]
+    assert response.data[1] == {"errors": ["Not found."], "id": 0, "success": False}
+    for result in [response.data[0], response.data[2]]:
+        assert result["success"]
+        assert result["status"] == Request.Statuses.RECORDED
+
+    response = api_client.post(
+        url,
+        {"additional_data": {"accepted": "yes"}, "ids": [invalid.id]},
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert not response.data[0]["success"]
+    assert response.data[0]["errors"]
+    invalid.refresh_from_db()
+    assert invalid.additional_data == {}
+
+    # Both status and admin fields are saved as the admin made the change
+    response = api_client.post(
+        url,
+        {
+            "additional_data": {"status_by_admin": {"status": Request.Statuses.DONE}},
+            "ids": [video_requests[0].id],
+        },
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data[0]["status"] == Request.Statuses.DONE
+    video_requests[0].refresh_from_db()
+    assert video_requests[0].additional_data["status_by_admin"]["admin_id"] == user.id
+
+
+def test_bulk_update_requests_staff_cannot_set_status_by_admin(api_client, request):
+    video_request = baker.make("video_requests.Request")
+
+    do_login(api_client, request, "staff_user")
+
+    url = reverse("api:v1:admin:requests:request-bulk-update")
+    response = api_client.post(
+        url,
+        {
+            "additional_data": {
+                "accepted": True,
+                "status_by_admin": {"status": Request.Statuses.DONE},
+            },
+            "ids": [video_request.id],
+        },
+        format="json",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data[0]["success"]
+    assert response.data[0]["status"] == Request.Statuses.REQUESTED
+    video_request.refresh_from_db()
+    assert "accepted" not in video_request.additional_data
+    assert "status_by_admin" not in video_request.additional_data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"additional_data": {"accepted": True}},
+        {"additional_data": [], "ids": [1]},
+        {"additional_data": {}, "filter": {"status": ["invalid"]}},
+    ],
+)
+def test_bulk_update_requests_invalid_data(api_client, data, request):
+    do_login(api_client, request, "admin_user")
+
+    url = reverse("api:v1:admin:requests:request-bulk-update")
+    response = api_client.post(url, data, format="json")
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+@patch("video_requests.utilities.request_status_transition.apply_async")
+def test_create_request_schedules_status_transition(
+    mock_apply_async,
+    admin_user,
+    api_client,
+    django_capture_on_commit_callbacks,
+    request_create_data,
+):
+    login(api_client, admin_user)
+
+    data = request_create_data | {
+        "end_datetime": localtime() + timedelta(minutes=30),
+        "start_datetime": localtime() - timedelta(hours=1),
+    }
+    url = reverse("api:v1:admin:requests:request-list")
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(url, data)
+
+    assert response.status_code == HTTP_201_CREATED
+    video_request = Request.objects.get(pk=response.data["id"])
+    mock_apply_async.assert_called_once()
+    args, kwargs = mock_apply_async.call_args
+    assert args[0][0] == video_request.id
+    assert kwargs["eta"] == video_request.end_datetime
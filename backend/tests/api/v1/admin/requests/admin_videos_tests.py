@@ -1,7 +1,10 @@
+from datetime import timedelta
 from random import randint
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.utils.timezone import localtime
 from model_bakery import baker
 from rest_framework.reverse import reverse
 from rest_framework.status import (
@@ -15,8 +18,13 @@ from rest_framework.status import (
     is_success,
 )
 
-from tests.api.helpers import assert_fields_exist, do_login, get_response
-from video_requests.models import Video
+from tests.api.helpers import (
+    assert_fields_exist,
+    do_login,
+    get_response,
+    get_streamed_data,
+)
+from video_requests.models import Request, Video
 
 pytestmark = pytest.mark.django_db
 
@@ -525,13 +533,16 @@ def test_list_all_videos(api_client, expected, pagination, request, user):
     if is_success(response.status_code):
         if pagination:
             assert_fields_exist(
-                response.data, ["count", "links", "results", "total_pages"]
+                response.data,
+                ["count", "count_exact", "links", "results", "total_pages"],
             )
             assert_fields_exist(response.data["links"], ["next", "previous"])
 
             assert response.data["count"] == len(videos)
 
-        response_data = response.data["results"] if pagination else response.data
+        response_data = (
+            response.data["results"] if pagination else get_streamed_data(response)
+        )
 
         assert len(response_data) == len(videos)
         for video in response_data:
@@ -550,3 +561,90 @@ def test_list_all_videos(api_client, expected, pagination, request, user):
                     "title",
                 ],
             )
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", HTTP_200_OK),
+        ("staff_user", HTTP_200_OK),
+        ("basic_user", HTTP_403_FORBIDDEN),
+        ("service_account", HTTP_403_FORBIDDEN),
+        (None, HTTP_401_UNAUTHORIZED),
+    ],
+)
+def test_bulk_write_videos(api_client, expected, request, user):
+    video_request = baker.make(
+        "video_requests.Request",
+        additional_data={"accepted": True, "recording": {"path": "/test"}},
+        start_datetime=localtime() - timedelta(hours=2),
+        end_datetime=localtime() - timedelta(hours=1),
+    )
+    editor = baker.make(User, is_staff=True)
+    videos = baker.make("video_requests.Video", request=video_request, _quantity=2)
+
+    do_login(api_client, request, user)
+
+    url = reverse(
+        "api:v1:admin:requests:request:video-bulk",
+        kwargs={"request_pk": video_request.id},
+    )
+    data = {
+        "create": [{"title": f"Videó {i}", "editor": editor.id} for i in range(3)],
+        "update": [{"id": videos[0].id, "title": "Új cím", "editor": editor.id}],
+        "delete": [videos[1].id],
+    }
+    response = api_client.post(url, data, format="json")
+
+    assert response.status_code == expected
+
+    if is_success(response.status_code):
+        assert len(response.data["created"]) == 3
+        for video in response.data["created"] + response.data["updated"]:
+            assert_retrieve_response_keys(video)
+            assert video["status"] == Video.Statuses.IN_PROGRESS
+        assert response.data["updated"][0]["title"] == "Új cím"
+
+        video_request.refresh_from_db()
+        assert video_request.video_count == 4
+        assert video_request.status == Request.Statuses.UPLOADED
+        # Created, updated and status changed
+        assert Video.objects.get(pk=videos[0].id).history.count() == 3
+
+
+def test_bulk_write_videos_sort_aired_and_delete_once(api_client, request):
+    video_request = baker.make("video_requests.Request")
+    videos = baker.make("video_requests.Video", request=video_request, _quantity=3)
+    for video in videos[1:]:
+        baker.make("video_requests.Todo", request=video_request, video=video)
+        baker.make("video_requests.Rating", video=video)
+    video_request.refresh_from_db()
+    assert video_request.video_count == 3
+    assert video_request.open_todo_count == 2
+
+    do_login(api_client, request, "admin_user")
+
+    url = reverse(
+        "api:v1:admin:requests:request:video-bulk",
+        kwargs={"request_pk": video_request.id},
+    )
+    aired = ["2024-01-05", "2024-03-01", "2023-12-24"]
+    data = {
+        "create": [{"title": "Videó", "additional_data": {"aired": aired}}],
+        "update": [{"id": videos[0].id, "additional_data": {"aired": aired}}],
+        "delete": [video.id for video in videos[1:]],
+    }
+    with patch("video_requests.signals.update_search_documents") as mock:
+        response = api_client.post(url, data, format="json")
+
+    assert response.status_code == HTTP_200_OK
+    # The derived data of the request is not updated for every deleted video
+    mock.assert_not_called()
+
+    for video in Video.objects.filter(request=video_request):
+        assert video.additional_data["aired"] == sorted(aired, reverse=True)
+        assert video.last_aired == "2024-03-01"
+
+    video_request.refresh_from_db()
+    assert video_request.video_count == 2
+    assert video_request.open_todo_count == 0
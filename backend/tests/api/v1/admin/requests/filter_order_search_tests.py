@@ -2,12 +2,13 @@ from datetime import date, datetime, timedelta
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.utils.timezone import make_aware
 from model_bakery import baker
 from rest_framework.reverse import reverse
 from rest_framework.status import is_success
 
-from tests.api.helpers import login
+from tests.api.helpers import get_streamed_data, login
 from video_requests.models import Request, Video
 
 pytestmark = pytest.mark.django_db
@@ -347,7 +348,9 @@ def test_filter_requests(admin_user, api_client, filters, expected, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == expected
 
@@ -371,7 +374,9 @@ def test_filter_requests_multiple_status(admin_user, api_client, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == 2
 
@@ -482,8 +487,10 @@ def test_order_requests(
 
     assert is_success(response.status_code)
 
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
     for i, _ in enumerate(requests):
-        response_data = response.data["results"] if pagination else response.data
 
         assert response_data[i]["id"] == requests[expected[i] - 1].id
 
@@ -505,7 +512,9 @@ def test_search_requests(admin_user, api_client, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == 3
 
@@ -514,6 +523,86 @@ def test_search_requests(admin_user, api_client, pagination):
     assert response_data[2]["id"] == requests[2].id
 
 
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full-text search needs PostgreSQL"
+)
+def test_search_requests_full_text(admin_user, api_client):
+    requests = [
+        baker.make("video_requests.Request", title="Szakmai nap"),
+        baker.make("video_requests.Request", title="Gólyabál 2024"),
+        baker.make("video_requests.Request", title="Gólya bál"),
+    ]
+    baker.make("video_requests.Video", request=requests[0], title="Gólyabál előzetes")
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url, {"search": "golyabal"})
+
+    assert is_success(response.status_code)
+    # Accents are ignored, the title is ranked higher than the titles of the videos
+    # and similar words are not matched if there are matching words
+    assert [request["id"] for request in response.data["results"]] == [
+        requests[1].id,
+        requests[0].id,
+    ]
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full-text search needs PostgreSQL"
+)
+def test_search_requests_similar_words(admin_user, api_client):
+    requests = [
+        baker.make("video_requests.Request", title="Szakmai nap"),
+        baker.make("video_requests.Request", title="Gólya bál"),
+        baker.make("video_requests.Request", title="Gólyabál 2024"),
+    ]
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url, {"search": "golyabl"})
+
+    assert is_success(response.status_code)
+    # Similar words are matched if no words match and they are ranked by similarity
+    assert [request["id"] for request in response.data["results"]] == [
+        requests[2].id,
+        requests[1].id,
+    ]
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full-text search needs PostgreSQL"
+)
+@pytest.mark.parametrize("search", ["AAAA", "aaaa CCCC", "BBBB"])
+def test_search_requests_full_text_same_results(admin_user, api_client, search):
+    requests = [
+        baker.make("video_requests.Request", title="AAAA BBBB CCCC"),
+        baker.make("video_requests.Request", title="BBBB AAAA CCCC"),
+        baker.make("video_requests.Request", title="CCCC DDDD AAAA"),
+        baker.make("video_requests.Request", title="DDDD DDDD DDDD"),
+    ]
+    baker.make("video_requests.Video", request=requests[2], title="BBBB")
+    titles = {request.id: request.title for request in requests}
+    titles[requests[2].id] += " BBBB"
+    expected = [
+        request_id
+        for request_id, title in titles.items()
+        if all(term in title for term in search.upper().split())
+    ]
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url, {"search": search})
+
+    assert is_success(response.status_code)
+    # The results are the same as of the default search of the titles
+    assert sorted(request["id"] for request in response.data["results"]) == sorted(
+        expected
+    )
+
+
 """
 --------------------------------------------------
                      VIDEOS
@@ -716,7 +805,9 @@ def test_filter_all_videos(admin_user, api_client, filters, expected, pagination
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == expected
 
@@ -758,7 +849,9 @@ def test_filter_all_videos_multiple_status(admin_user, api_client, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == 2
 
@@ -864,8 +957,10 @@ def test_order_all_videos(admin_user, api_client, expected, ordering, pagination
 
     assert is_success(response.status_code)
 
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
     for i, _ in enumerate(videos):
-        response_data = response.data["results"] if pagination else response.data
 
         assert response_data[i]["id"] == videos[expected[i] - 1].id
 
@@ -901,10 +996,41 @@ def test_search_all_videos(admin_user, api_client, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == 3
 
     assert response_data[0]["id"] == videos[0].id
     assert response_data[1]["id"] == videos[3].id
     assert response_data[2]["id"] == videos[4].id
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full-text search needs PostgreSQL"
+)
+def test_search_requests_cursor_pagination(admin_user, api_client):
+    requests = [
+        baker.make("video_requests.Request", title="Gólyabál"),
+        baker.make("video_requests.Request", title="Gólyabál gólyabál gólyabál"),
+        baker.make("video_requests.Request", title="Gólyabál gólyabál"),
+        baker.make("video_requests.Request", title="Szakmai nap"),
+    ]
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(
+        url, {"page_size": 1, "pagination": "cursor", "search": "golyabal"}
+    )
+    ids = []
+    while True:
+        assert is_success(response.status_code)
+        ids += [request["id"] for request in response.data["results"]]
+        if not response.data["links"]["next"]:
+            break
+        response = api_client.get(response.data["links"]["next"])
+
+    # The pages are ordered by the search rank
+    assert ids == [requests[1].id, requests[2].id, requests[0].id]
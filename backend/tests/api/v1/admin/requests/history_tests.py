@@ -2,6 +2,8 @@ from datetime import timedelta, timezone
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import localtime
 from model_bakery import baker
 from rest_framework.reverse import reverse
@@ -12,7 +14,8 @@ from rest_framework.status import (
     is_success,
 )
 
-from tests.api.helpers import assert_fields_exist, do_login
+from tests.api.helpers import assert_fields_exist, do_login, login
+from video_requests.models import Request
 
 pytestmark = pytest.mark.django_db
 
@@ -116,7 +119,11 @@ def test_list_comment_history(api_client, expected, request, user):
 
         # Oldest history event
         assert_response(
-            response.data[1], ["text"], changes_1, {"text": original_text}, user
+            response.data[1],
+            ["text"],
+            changes_1,
+            {"text": original_text},
+            user,
         )
 
 
@@ -179,7 +186,11 @@ def test_list_rating_history(api_client, expected, request, user):
 
         # Oldest history event
         assert_response(
-            response.data[1], ["review"], changes_1, {"review": original_review}, user
+            response.data[1],
+            ["review"],
+            changes_1,
+            {"review": original_review},
+            user,
         )
 
 
@@ -370,3 +381,56 @@ def test_list_video_history(api_client, expected, request, user):
             {"title": original_data["title"]},
             user,
         )
+
+
+def test_list_history_paginated(admin_user, api_client):
+    video_request = baker.make("video_requests.Request")
+    for i in range(5):
+        video_request.title = f"Title {i}"
+        video_request.save()
+        # Saves without modifications are not listed
+        video_request.save()
+
+    login(api_client, admin_user)
+
+    url = reverse(
+        "api:v1:admin:requests:request-history", kwargs={"pk": video_request.id}
+    )
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url, {"page_size": 2})
+
+    assert response.status_code == HTTP_200_OK
+    assert response.data["count"] == 5
+    assert [history["changes"][0]["new"] for history in response.data["results"]] == [
+        "Title 4",
+        "Title 3",
+    ]
+    assert response.data["results"][0]["user"] is None
+    # The records are counted and loaded with their users, the changes are not
+    # calculated from the previous records
+    assert len([query for query in queries if "historicalrequest" in query["sql"]]) == 2
+
+    # The plain list is returned if no page is requested
+    response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data) == 5
+
+    response = api_client.get(url, {"page_size": 2, "pagination": False})
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data) == 5
+
+
+def test_history_changes_of_versioned_updates():
+    video_request = baker.make("video_requests.Request", title="Old title")
+
+    video_request.title = "New title"
+    assert video_request.compare_and_swap(["title"])
+    video_request.title = "Newer title"
+    Request.bulk_update_versioned([video_request], ["title"])
+
+    history = video_request.history.order_by("history_date", "history_id")
+    assert [record.history_changes for record in history] == [
+        None,
+        [{"field": "title", "new": "New title", "old": "Old title"}],
+        [{"field": "title", "new": "Newer title", "old": "New title"}],
+    ]
@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils.timezone import make_aware
+from model_bakery import baker
+from rest_framework.reverse import reverse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+)
+
+from tests.api.helpers import do_login, login
+from video_requests.models import MonthlyStatistic, Request, Video
+from video_requests.statistics import update_statistics
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def statistics_data(time_machine):
+    time_machine.move_to(make_aware(datetime(2023, 9, 20, 12)), tick=False)
+    editor, member = baker.make(User, _quantity=2)
+
+    start_datetime = make_aware(datetime(2023, 9, 10, 10))
+    video_request = baker.make(
+        "video_requests.Request",
+        start_datetime=start_datetime,
+        end_datetime=start_datetime + timedelta(hours=3),
+        status=Request.Statuses.ACCEPTED,
+    )
+    baker.make(
+        "video_requests.CrewMember", member=member, request=video_request, _quantity=2
+    )
+    video = baker.make(
+        "video_requests.Video",
+        editor=editor,
+        request=video_request,
+        status=Video.Statuses.PUBLISHED,
+    )
+    baker.make("video_requests.Rating", video=video, rating=5)
+    baker.make("video_requests.Rating", video=video, rating=2)
+
+    start_datetime = make_aware(datetime(2023, 10, 2, 18))
+    video_request = baker.make(
+        "video_requests.Request",
+        start_datetime=start_datetime,
+        end_datetime=start_datetime + timedelta(hours=1),
+        status=Request.Statuses.REQUESTED,
+    )
+    baker.make("video_requests.CrewMember", member=member, request=video_request)
+    baker.make("video_requests.Video", editor=editor, request=video_request)
+
+    call_command("update_statistics", stdout=StringIO())
+    return editor, member
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", HTTP_200_OK),
+        ("staff_user", HTTP_403_FORBIDDEN),
+        ("basic_user", HTTP_403_FORBIDDEN),
+        ("service_account", HTTP_403_FORBIDDEN),
+        (None, HTTP_401_UNAUTHORIZED),
+    ],
+)
+def test_statistics_permissions(api_client, expected, request, user):
+    do_login(api_client, request, user)
+
+    response = api_client.get(reverse("api:v1:admin:statistics"))
+
+    assert response.status_code == expected
+
+
+def test_statistics_by_month(admin_user, api_client, statistics_data):
+    editor, member = statistics_data
+    login(api_client, admin_user)
+
+    response = api_client.get(
+        reverse("api:v1:admin:statistics"),
+        {"start_datetime_after": "2023-09-15", "start_datetime_before": "2023-10-31"},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    september, october = response.data
+    assert september["period"] == "2023-09"
+    assert str(september["start_date"]) == "2023-09-01"
+    assert str(september["end_date"]) == "2023-09-30"
+    assert september["requests"] == [{"count": 1, "status": Request.Statuses.ACCEPTED}]
+    assert september["edited_videos"][0]["count"] == 1
+    assert september["edited_videos"][0]["user"]["id"] == editor.id
+    # The crew member had two positions on the same request
+    assert september["crew"][0]["count"] == 1
+    assert september["crew"][0]["hours"] == 3
+    assert september["crew"][0]["user"]["id"] == member.id
+    assert september["rating_count"] == 2
+    assert september["avg_rating"] == 3.5
+    assert september["published_video_count"] == 1
+    assert september["avg_turnaround_hours"] == 10 * 24 - 1
+
+    assert october["period"] == "2023-10"
+    assert october["crew"][0]["hours"] == 1
+    assert october["avg_rating"] is None
+    assert october["avg_turnaround_hours"] is None
+
+
+def test_statistics_by_semester(admin_user, api_client, statistics_data):
+    editor, member = statistics_data
+    login(api_client, admin_user)
+
+    response = api_client.get(
+        reverse("api:v1:admin:statistics"),
+        {"period": "semester", "start_datetime_before": "2023-12-31"},
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data) == 1
+    semester = response.data[0]
+    assert semester["period"] == "2023/24/1"
+    assert str(semester["start_date"]) == "2023-08-01"
+    assert str(semester["end_date"]) == "2024-01-31"
+    assert sorted(
+        (statistic["status"], statistic["count"]) for statistic in semester["requests"]
+    ) == [(Request.Statuses.REQUESTED, 1), (Request.Statuses.ACCEPTED, 1)]
+    assert semester["edited_videos"][0]["count"] == 2
+    assert semester["crew"][0]["count"] == 2
+    assert semester["crew"][0]["hours"] == 4
+
+
+def test_statistics_error(admin_user, api_client):
+    login(api_client, admin_user)
+    url = reverse("api:v1:admin:statistics")
+
+    response = api_client.get(url, {"period": "year"})
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+    response = api_client.get(url, {"start_datetime_after": "LoremIpsum"})
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+    response = api_client.get(
+        url,
+        {"start_datetime_after": "2023-10-01", "start_datetime_before": "2023-09-01"},
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_statistics_refreshed_incrementally(statistics_data, time_machine):
+    # The changes right before the previous refresh are checked again
+    time_machine.move_to(make_aware(datetime(2023, 11, 20, 12)), tick=False)
+    assert update_statistics() == 2
+    assert update_statistics() == 0
+
+    video_request = Request.objects.get(start_datetime__month=10)
+    video_request.start_datetime -= timedelta(days=30)
+    video_request.end_datetime -= timedelta(days=30)
+    video_request.save()
+
+    time_machine.move_to(make_aware(datetime(2023, 11, 20, 13)), tick=False)
+    # The request was moved from October to September
+    assert update_statistics() == 2
+    assert not MonthlyStatistic.objects.filter(month__month=10).exists()
+    assert (
+        MonthlyStatistic.objects.get(
+            month__month=9, metric=MonthlyStatistic.Metrics.CREW
+        ).total
+        == 4
+    )
+
+    # Every month the deleted request was in is refreshed
+    Request.objects.filter(start_datetime__month=9).delete()
+    assert update_statistics() == 2
+    assert not MonthlyStatistic.objects.exists()
@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.reverse import reverse
@@ -14,7 +18,12 @@ from rest_framework.status import (
     is_success,
 )
 
-from tests.api.helpers import assert_fields_exist, do_login, get_response
+from tests.api.helpers import (
+    assert_fields_exist,
+    do_login,
+    get_response,
+    get_streamed_data,
+)
 from video_requests.models import Todo
 
 pytestmark = pytest.mark.django_db
@@ -466,13 +475,16 @@ def test_list_all_todos(api_client, expected, pagination, request, user):
     if is_success(response.status_code):
         if pagination:
             assert_fields_exist(
-                response.data, ["count", "links", "results", "total_pages"]
+                response.data,
+                ["count", "count_exact", "links", "results", "total_pages"],
             )
             assert_fields_exist(response.data["links"], ["next", "previous"])
 
             assert response.data["count"] == len(todos)
 
-        response_data = response.data["results"] if pagination else response.data
+        response_data = (
+            response.data["results"] if pagination else get_streamed_data(response)
+        )
 
         assert len(response_data) == len(todos)
         for todo in response_data:
@@ -701,3 +713,165 @@ def test_update_todo_validation(api_client, expected, method, request, user):
         assert response.data["assignees"][0] == ErrorDetail(
             string='Invalid pk "42069" - object does not exist.', code="does_not_exist"
         )
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", HTTP_200_OK),
+        ("staff_user", HTTP_200_OK),
+        ("basic_user", HTTP_403_FORBIDDEN),
+        ("service_account", HTTP_403_FORBIDDEN),
+        (None, HTTP_401_UNAUTHORIZED),
+    ],
+)
+@pytest.mark.parametrize("video", [False, True])
+def test_bulk_write_todos(api_client, expected, request, user, video):
+    video_request = baker.make("video_requests.Request")
+    video = baker.make("video_requests.Video", request=video_request) if video else None
+    assignees = baker.make(User, is_staff=True, _quantity=2)
+
+    user = do_login(api_client, request, user)
+    todos = baker.make(
+        "video_requests.Todo",
+        creator=user,
+        request=video_request,
+        video=video,
+        _quantity=3,
+    )
+    todos[0].assignees.add(assignees[0])
+
+    if video:
+        url = reverse(
+            "api:v1:admin:requests:request:video:todo-bulk",
+            kwargs={"request_pk": video_request.id, "video_pk": video.id},
+        )
+    else:
+        url = reverse(
+            "api:v1:admin:requests:request:todo-bulk",
+            kwargs={"request_pk": video_request.id},
+        )
+    data = {
+        "create": [
+            {
+                "description": "Feladat",
+                "assignees": [assignee.id for assignee in assignees],
+            },
+            {"description": "Másik feladat"},
+        ],
+        "update": [
+            {
+                "id": todos[0].id,
+                "assignees": [assignees[1].id],
+                "status": Todo.Statuses.CLOSED,
+            }
+        ],
+        "delete": [todos[1].id],
+    }
+    with patch("video_requests.services.email_staff_todos_assigned.delay") as mock:
+        response = api_client.post(url, data, format="json")
+
+    assert response.status_code == expected
+
+    if is_success(response.status_code):
+        assert len(response.data["created"]) == 2
+        for todo in response.data["created"] + response.data["updated"]:
+            assert_response_keys(todo)
+            assert (todo["video"] or {}).get("id") == (video.id if video else None)
+        assert [
+            assignee["id"] for assignee in response.data["updated"][0]["assignees"]
+        ] == [assignees[1].id]
+
+        # The new assignees are notified with one task
+        mock.assert_called_once_with(
+            [
+                [response.data["created"][0]["id"], sorted(a.id for a in assignees)],
+                [todos[0].id, [assignees[1].id]],
+            ]
+        )
+
+        video_request.refresh_from_db()
+        assert video_request.open_todo_count == 3
+        assert not Todo.objects.filter(pk=todos[1].id).exists()
+
+
+def test_bulk_write_todos_update_assignees_only(api_client, request):
+    video_request = baker.make("video_requests.Request")
+    assignee = baker.make(User, is_staff=True)
+
+    user = do_login(api_client, request, "staff_user")
+    todo = baker.make("video_requests.Todo", creator=user, request=video_request)
+    updated = todo.updated
+
+    url = reverse(
+        "api:v1:admin:requests:request:todo-bulk",
+        kwargs={"request_pk": video_request.id},
+    )
+    data = {"update": [{"id": todo.id, "assignees": [assignee.id]}]}
+    with patch("video_requests.services.email_staff_todos_assigned.delay"):
+        response = api_client.post(url, data, format="json")
+
+    assert response.status_code == HTTP_200_OK
+    # The modification time is changed for the conditional requests
+    todo.refresh_from_db()
+    assert todo.updated > updated
+    assert list(todo.assignees.all()) == [assignee]
+
+
+def test_bulk_write_todos_delete_others_todo(api_client, request):
+    video_request = baker.make("video_requests.Request")
+    todo = baker.make("video_requests.Todo", request=video_request)
+
+    do_login(api_client, request, "staff_user")
+
+    url = reverse(
+        "api:v1:admin:requests:request:todo-bulk",
+        kwargs={"request_pk": video_request.id},
+    )
+    response = api_client.post(url, {"delete": [todo.id]}, format="json")
+
+    assert response.status_code == HTTP_403_FORBIDDEN
+    assert Todo.objects.filter(pk=todo.id).exists()
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_list_create_todos_on_video_of_other_request(
+    api_client, method, request, todo_data
+):
+    video = baker.make("video_requests.Video")
+    other_request = baker.make("video_requests.Request")
+
+    do_login(api_client, request, "staff_user")
+
+    url = reverse(
+        "api:v1:admin:requests:request:video:todo-list",
+        kwargs={"request_pk": other_request.id, "video_pk": video.id},
+    )
+    response = get_response(api_client, method, url, todo_data)
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert not Todo.objects.exists()
+
+
+def test_create_todo_on_video_resolves_parents_once(api_client, request, todo_data):
+    video = baker.make("video_requests.Video")
+
+    do_login(api_client, request, "staff_user")
+
+    url = reverse(
+        "api:v1:admin:requests:request:video:todo-list",
+        kwargs={"request_pk": video.request.id, "video_pk": video.id},
+    )
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.post(url, todo_data)
+
+    assert response.status_code == HTTP_201_CREATED
+    parent_queries = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "video_requests_video"' in query["sql"]
+    ]
+    # The video is loaded with its request in one query
+    assert len(parent_queries) == 1
+    assert 'INNER JOIN "video_requests_request"' in parent_queries[0]
@@ -6,7 +6,7 @@ from model_bakery import baker
 from rest_framework.reverse import reverse
 from rest_framework.status import is_success
 
-from tests.api.helpers import login
+from tests.api.helpers import get_streamed_data, login
 from video_requests.models import Todo
 
 pytestmark = pytest.mark.django_db
@@ -209,9 +209,15 @@ def test_filter_todos_by_status(admin_user, api_client, pagination):
     assert is_success(response_2.status_code)
     assert is_success(response_3.status_code)
 
-    response_data_1 = response_1.data["results"] if pagination else response_1.data
-    response_data_2 = response_2.data["results"] if pagination else response_2.data
-    response_data_3 = response_3.data["results"] if pagination else response_3.data
+    response_data_1 = (
+        response_1.data["results"] if pagination else get_streamed_data(response_1)
+    )
+    response_data_2 = (
+        response_2.data["results"] if pagination else get_streamed_data(response_2)
+    )
+    response_data_3 = (
+        response_3.data["results"] if pagination else get_streamed_data(response_3)
+    )
 
     assert len(response_data_1) == 3
     assert len(response_data_2) == 5
@@ -246,9 +252,15 @@ def test_filter_todos_by_assignees(admin_user, api_client, pagination):
     assert is_success(response_2.status_code)
     assert is_success(response_3.status_code)
 
-    response_data_1 = response_1.data["results"] if pagination else response_1.data
-    response_data_2 = response_2.data["results"] if pagination else response_2.data
-    response_data_3 = response_3.data["results"] if pagination else response_3.data
+    response_data_1 = (
+        response_1.data["results"] if pagination else get_streamed_data(response_1)
+    )
+    response_data_2 = (
+        response_2.data["results"] if pagination else get_streamed_data(response_2)
+    )
+    response_data_3 = (
+        response_3.data["results"] if pagination else get_streamed_data(response_3)
+    )
 
     assert len(response_data_1) == 5
     assert len(response_data_2) == 7
@@ -293,7 +305,9 @@ def test_order_todos(
 
     assert is_success(response.status_code)
 
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
     for i, _ in enumerate(todos):
-        response_data = response.data["results"] if pagination else response.data
 
         assert response_data[i]["id"] == todos[expected[i] - 1].id
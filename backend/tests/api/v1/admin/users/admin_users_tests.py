@@ -2,6 +2,8 @@ from datetime import date, datetime, timedelta
 
 import pytest
 from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import localtime, make_aware
 from model_bakery import baker
 from rest_framework.exceptions import ErrorDetail
@@ -18,7 +20,13 @@ from rest_framework.status import (
 )
 from social_django.models import UserSocialAuth
 
-from tests.api.helpers import assert_fields_exist, do_login, get_response, login
+from tests.api.helpers import (
+    assert_fields_exist,
+    do_login,
+    get_response,
+    get_streamed_data,
+    login,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -112,13 +120,16 @@ def test_list_users(api_client, expected, pagination, request, user):
     if is_success(response.status_code):
         if pagination:
             assert_fields_exist(
-                response.data, ["count", "links", "results", "total_pages"]
+                response.data,
+                ["count", "count_exact", "links", "results", "total_pages"],
             )
             assert_fields_exist(response.data["links"], ["next", "previous"])
 
             assert response.data["count"] == len(users) + 1
 
-        response_data = response.data["results"] if pagination else response.data
+        response_data = (
+            response.data["results"] if pagination else get_streamed_data(response)
+        )
         assert len(response_data) == len(users) + 1
         for user in response_data:
             assert_list_response_keys(user)
@@ -690,3 +701,32 @@ def test_user_worked_on(
                 and expected_find["position"] == video_request["position"]
                 for expected_find in should_find
             )
+
+
+def test_worked_on_single_query(admin_user, api_client):
+    video_requests = baker.make("video_requests.Request", _quantity=5)
+    for video_request in video_requests:
+        baker.make(
+            "video_requests.CrewMember", member=admin_user, request=video_request
+        )
+        baker.make("video_requests.Video", editor=admin_user, request=video_request)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:users:user-worked-on", kwargs={"pk": admin_user.id})
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url)
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data) == 10
+    assert (
+        len(
+            [
+                query
+                for query in queries
+                if "video_requests_participation" in query["sql"]
+            ]
+        )
+        == 1
+    )
+    assert not any("video_requests_crewmember" in query["sql"] for query in queries)
@@ -9,7 +9,7 @@ from rest_framework.exceptions import ErrorDetail
 from rest_framework.reverse import reverse
 from rest_framework.status import HTTP_400_BAD_REQUEST, is_success
 
-from tests.api.helpers import login
+from tests.api.helpers import get_streamed_data, login
 
 pytestmark = pytest.mark.django_db
 
@@ -49,7 +49,9 @@ def test_filter_users(admin_user, api_client, filters, expected, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == expected
 
@@ -123,8 +125,10 @@ def test_order_users(admin_user, api_client, expected, ordering, pagination):
 
     assert is_success(response.status_code)
 
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
     for i, _ in enumerate(users):
-        response_data = response.data["results"] if pagination else response.data
 
         assert response_data[i]["id"] == users[expected[i] - 1].id
 
@@ -172,7 +176,9 @@ def test_search_users(admin_user, api_client, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == 3
 
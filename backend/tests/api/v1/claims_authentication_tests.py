@@ -0,0 +1,140 @@
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework.reverse import reverse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+)
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.v1.login.serializers import TokenObtainPairOAuth2Serializer
+
+pytestmark = pytest.mark.django_db
+
+
+def login_with_claims(client, user):
+    token = TokenObtainPairOAuth2Serializer.get_token(user)
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(token.access_token)}")
+    return token
+
+
+def get_user_queries(queries):
+    # Queries of the authentication and the group checks (not the joins or the
+    # cached check of the is_active flag)
+    return [
+        query["sql"]
+        for query in queries.captured_queries
+        if (
+            'FROM "auth_user" WHERE' in query["sql"]
+            and not query["sql"].startswith("SELECT 1 AS")
+        )
+        or '"auth_group"' in query["sql"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "user,expected",
+    [
+        ("admin_user", {"is_admin": True, "is_staff": True, "role": "admin"}),
+        ("staff_user", {"is_admin": False, "is_staff": True, "role": "staff"}),
+        ("basic_user", {"is_admin": False, "is_staff": False, "role": "user"}),
+    ],
+)
+def test_token_contains_authorization_claims(expected, request, user):
+    user = request.getfixturevalue(user)
+    token = TokenObtainPairOAuth2Serializer.get_token(user).access_token
+
+    assert token["user_id"] == str(user.id)
+    assert not token["is_service_account"]
+    for claim, value in expected.items():
+        assert token[claim] == value
+
+
+def test_safe_request_does_not_load_user(api_client, staff_user):
+    baker.make("video_requests.Request", _quantity=3)
+    login_with_claims(api_client, staff_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url)
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 3
+    assert not get_user_queries(queries)
+
+
+@pytest.mark.parametrize("banned", [False, True])
+def test_inactive_user_is_rejected(admin_user, api_client, banned, staff_user):
+    login_with_claims(api_client, staff_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    assert api_client.get(url).status_code == HTTP_200_OK
+
+    if banned:
+        baker.make("common.Ban", creator=admin_user, receiver=staff_user)
+    else:
+        staff_user.is_active = False
+        staff_user.save()
+
+    # The token is still valid but the user is not accepted anymore
+    response = api_client.get(url)
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
+def test_claims_are_used_for_permissions(api_client, basic_user):
+    login_with_claims(api_client, basic_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url)
+
+    assert response.status_code == HTTP_403_FORBIDDEN
+
+
+def test_unsafe_request_loads_user(api_client, staff_user):
+    video_request = baker.make("video_requests.Request")
+    login_with_claims(api_client, staff_user)
+
+    url = reverse(
+        "api:v1:admin:requests:request:comment-list",
+        kwargs={"request_pk": video_request.id},
+    )
+    response = api_client.post(url, {"text": "Test", "internal": False})
+
+    assert response.status_code == HTTP_201_CREATED
+    assert response.data["author"]["id"] == staff_user.id
+
+
+def test_token_without_claims_loads_user(api_client, staff_user):
+    baker.make("video_requests.Request")
+    token = AccessToken.for_user(staff_user)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {str(token)}")
+
+    url = reverse("api:v1:admin:requests:request-list")
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url)
+
+    assert response.status_code == HTTP_200_OK
+    assert get_user_queries(queries)
+
+
+def test_refresh_updates_claims(api_client, staff_user):
+    token = TokenObtainPairOAuth2Serializer.get_token(staff_user)
+    assert token.access_token["role"] == "staff"
+
+    staff_user.groups.add(Group.objects.get_or_create(name=settings.ADMIN_GROUP)[0])
+
+    url = reverse("api:v1:login:refresh_jwt_token")
+    response = api_client.post(url, {"refresh": str(token)})
+
+    assert response.status_code == HTTP_200_OK
+    access = AccessToken(response.data["access"])
+    assert access["is_admin"]
+    assert access["role"] == "admin"
+    assert settings.ADMIN_GROUP in access["groups"]
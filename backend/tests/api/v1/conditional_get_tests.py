@@ -0,0 +1,211 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from model_bakery import baker
+from rest_framework.reverse import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+from tests.api.helpers import login
+from video_requests.models import Comment, Video
+
+pytestmark = pytest.mark.django_db
+
+
+def test_request_list_not_modified(admin_user, api_client):
+    video_request = baker.make("video_requests.Request")
+    baker.make("video_requests.Request", _quantity=5)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url)
+
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+    # Deleting a request would not change the last modification time
+    assert "Last-Modified" not in response
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    assert not response.content
+
+    # A different page is a different representation
+    response = api_client.get(url, {"page_size": 2}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+
+    # A new comment updates the comment counter of the request
+    baker.make("video_requests.Comment", request=video_request)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+def test_request_retrieve_not_modified(admin_user, api_client):
+    video_request = baker.make("video_requests.Request")
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-detail", args=(video_request.id,))
+    response = api_client.get(url)
+
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    baker.make("video_requests.CrewMember", request=video_request)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+
+
+def test_etag_depends_on_user(admin_user, api_client, staff_user):
+    baker.make("video_requests.Request", _quantity=2)
+    url = reverse("api:v1:admin:requests:request-list")
+
+    login(api_client, admin_user)
+    etag = api_client.get(url)["ETag"]
+
+    login(api_client, staff_user)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+def test_comment_list_not_modified_until_deleted(api_client, basic_user):
+    video_request = baker.make("video_requests.Request", requester=basic_user)
+    comments = baker.make(
+        "video_requests.Comment", request=video_request, internal=False, _quantity=3
+    )
+
+    login(api_client, basic_user)
+
+    url = reverse(
+        "api:v1:requests:request:comment-list", kwargs={"request_pk": video_request.id}
+    )
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    # Deleting an older comment does not change the last modification time
+    comments[0].delete()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data) == 2
+
+
+def test_comment_list_modified_if_replaced(api_client, basic_user):
+    video_request = baker.make("video_requests.Request", requester=basic_user)
+    comments = baker.make(
+        "video_requests.Comment", request=video_request, internal=False, _quantity=3
+    )
+
+    login(api_client, basic_user)
+
+    url = reverse(
+        "api:v1:requests:request:comment-list", kwargs={"request_pk": video_request.id}
+    )
+    etag = api_client.get(url)["ETag"]
+
+    # Neither the number of comments nor the last modification time is changed
+    comments[0].delete()
+    comment = baker.make(
+        "video_requests.Comment", request=video_request, internal=False
+    )
+    Comment.objects.filter(pk=comment.pk).update(updated=comments[2].updated)
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert comment.id in [item["id"] for item in response.data]
+
+
+def test_request_list_modified_if_user_renamed(admin_user, api_client, staff_user):
+    baker.make("video_requests.Request", responsible=staff_user)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    etag = api_client.get(url)["ETag"]
+
+    staff_user.last_name = "Renamed"
+    staff_user.save()
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+def test_request_retrieve_modified_if_video_changed(admin_user, api_client):
+    video_request = baker.make("video_requests.Request")
+    video = baker.make("video_requests.Video", request=video_request)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-detail", args=(video_request.id,))
+    response = api_client.get(url)
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+    assert not response.data["videos_edited"]
+
+    # Only the video is modified, not the request
+    Video.objects.filter(pk=video.pk).update(
+        status=Video.Statuses.EDITED, updated=timezone.now() + timedelta(seconds=1)
+    )
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_200_OK
+    assert response.data["videos_edited"]
+
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == HTTP_200_OK
+
+
+def test_request_list_modified_since_deleted(admin_user, api_client):
+    video_requests = baker.make("video_requests.Request", _quantity=3)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    last_modified = http_date((timezone.now() + timedelta(seconds=1)).timestamp())
+
+    video_requests[0].delete()
+
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == HTTP_200_OK
+    assert response.data["count"] == 2
+
+
+def test_request_retrieve_not_modified_without_loading_related(admin_user, api_client):
+    video_request = baker.make("video_requests.Request", requester=admin_user)
+    baker.make("video_requests.CrewMember", request=video_request, _quantity=2)
+    baker.make("video_requests.Video", request=video_request, _quantity=2)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-detail", args=(video_request.id,))
+    etag = api_client.get(url)["ETag"]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    # The request is loaded once with the aggregates of the related objects
+    assert (
+        len(
+            [
+                query
+                for query in queries
+                if 'FROM "video_requests_request"' in query["sql"]
+            ]
+        )
+        == 1
+    )
+    assert not [
+        query for query in queries if 'FROM "video_requests_crewmember"' in query["sql"]
+    ]
@@ -332,7 +332,9 @@ def test_create_comment_errors(
 
 
 @responses.activate
-def test_external_callback_on_status_changes(admin_user, api_client, settings):
+def test_external_callback_on_status_changes(
+    admin_user, api_client, django_capture_on_commit_callbacks, settings
+):
     settings.CELERY_TASK_ALWAYS_EAGER = True
 
     login(api_client, admin_user)
@@ -360,12 +362,14 @@ def test_external_callback_on_status_changes(admin_user, api_client, settings):
     )
 
     # Request changed from Requested to Accepted
-    api_client.patch(url, {"additional_data": {"accepted": True}})
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(url, {"additional_data": {"accepted": True}})
     assert response1.call_count == 1
     assert json.loads(response1.calls[0].request.body) == {"accept": True}
 
     # Request changed from Accepted to Denied
-    api_client.patch(url, {"additional_data": {"accepted": False}})
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(url, {"additional_data": {"accepted": False}})
     assert response1.call_count == 2
     assert json.loads(response1.calls[1].request.body) == {"accept": False}
 
@@ -374,12 +378,14 @@ def test_external_callback_on_status_changes(admin_user, api_client, settings):
     )
 
     # Request changed from Requested to Denied
-    api_client.patch(url, {"additional_data": {"accepted": False}})
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(url, {"additional_data": {"accepted": False}})
     assert response2.call_count == 1
     assert json.loads(response2.calls[0].request.body) == {"accept": False}
 
     # Request changed from Denied to Accepted
-    api_client.patch(url, {"additional_data": {"accepted": True}})
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(url, {"additional_data": {"accepted": True}})
     assert response2.call_count == 2
     assert json.loads(response2.calls[1].request.body) == {"accept": True}
 
@@ -387,7 +393,7 @@ def test_external_callback_on_status_changes(admin_user, api_client, settings):
 @responses.activate
 @pytest.mark.parametrize("accepted", [True, False])
 def test_external_callback_on_status_changes_redirect_and_result(
-    accepted, admin_user, api_client, settings
+    accepted, admin_user, api_client, django_capture_on_commit_callbacks, settings
 ):
     settings.CELERY_TASK_ALWAYS_EAGER = True
     settings.CELERY_TASK_STORE_EAGER_RESULT = True
@@ -417,7 +423,8 @@ def test_external_callback_on_status_changes_redirect_and_result(
     url = reverse(
         "api:v1:admin:requests:request-detail", kwargs={"pk": video_request.id}
     )
-    api_client.patch(url, {"additional_data": {"accepted": accepted}})
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(url, {"additional_data": {"accepted": accepted}})
 
     assert mock_head_redirect.call_count == 1
     assert mock_head.call_count == 1
@@ -441,7 +448,9 @@ def test_external_callback_on_status_changes_redirect_and_result(
 
 
 @responses.activate
-def test_external_callback_retry(admin_user, api_client, settings):
+def test_external_callback_retry(
+    admin_user, api_client, django_capture_on_commit_callbacks, settings
+):
     settings.CELERY_TASK_ALWAYS_EAGER = True
     settings.CELERY_TASK_STORE_EAGER_RESULT = True
 
@@ -460,7 +469,8 @@ def test_external_callback_retry(admin_user, api_client, settings):
     url = reverse(
         "api:v1:admin:requests:request-detail", kwargs={"pk": video_request.id}
     )
-    api_client.patch(url, {"additional_data": {"accepted": True}})
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(url, {"additional_data": {"accepted": True}})
 
     assert mock_post.call_count == 11
 
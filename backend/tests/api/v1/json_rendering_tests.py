@@ -0,0 +1,103 @@
+import json
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from io import BytesIO
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.timezone import localtime
+from django.utils.translation import gettext_lazy as _
+from model_bakery import baker
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.reverse import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+from common.rest_framework.parsers import ORJSONParser
+from common.rest_framework.renderers import ORJSONRenderer
+from tests.api.helpers import login
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {
+            "aware": localtime(),
+            "decimal": Decimal("1.5"),
+            "lazy": _("Cameraman"),
+            "utc": datetime(2026, 1, 1, 12, tzinfo=UTC),
+        },
+        {
+            "date": date(2026, 1, 1),
+            "microseconds": datetime(2026, 1, 1, 12, 30, 0, 5, tzinfo=UTC),
+            "naive": datetime(2026, 1, 1, 12, 30),
+            "time": time(12, 30, 15),
+            "zero_offset": datetime(2026, 1, 1, tzinfo=ZoneInfo("Europe/London")),
+        },
+        {1: "non string key", "nested": [{"duration": timedelta(minutes=1)}]},
+        ["line separator", "ékezetes"],
+    ],
+)
+def test_renderer_output_matches_json_renderer(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_phone_number():
+    # The JSONRenderer of REST framework cannot render phone numbers
+    rendered = ORJSONRenderer().render(
+        {"phone_number": PhoneNumber.from_string("+36701234567")}
+    )
+    assert rendered == b'{"phone_number":"+36701234567"}'
+
+
+def test_renderer_escapes_line_separators():
+    rendered = ORJSONRenderer().render({"text": "a b c"})
+    assert rendered == b'{"text":"a\\u2028b\\u2029c"}'
+
+
+def test_renderer_indent():
+    rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+    assert rendered == b'{\n    "a": 1\n}'
+
+
+def test_parser():
+    parser = ORJSONParser()
+    assert parser.parse(BytesIO('{"title": "Teszt"}'.encode())) == {"title": "Teszt"}
+    assert parser.parse(
+        BytesIO('{"title": "Teszt"}'.encode("utf-16")),
+        parser_context={"encoding": "utf-16"},
+    ) == {"title": "Teszt"}
+
+    for invalid in [b"{", b'{"value": NaN}']:
+        with pytest.raises(ParseError):
+            parser.parse(BytesIO(invalid))
+
+
+def test_admin_request_list_is_rendered(admin_user, api_client):
+    video_request = baker.make("video_requests.Request", title="Gólyabál – 2026")
+    baker.make("video_requests.CrewMember", request=video_request)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url, {"pagination": False})
+
+    assert response.status_code == HTTP_200_OK
+    assert response["Content-Type"] == "application/json"
+    data = json.loads(b"".join(response.streaming_content))
+    assert data[0]["id"] == video_request.id
+    assert data[0]["title"] == "Gólyabál – 2026"
+    assert len(data[0]["crew"]) == 1
+
+
+def test_invalid_json_body(admin_user, api_client):
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.post(url, "{", content_type="application/json")
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert "JSON parse error" in response.data["detail"]
@@ -1,17 +1,26 @@
+from unittest.mock import patch
 from urllib.parse import parse_qs, urlparse
 
 import pytest
+from django.apps import apps
+from django.db.models import F
+from django.db.models.functions import Lower
 from model_bakery import baker
+from rest_framework.exceptions import ValidationError
 from rest_framework.reverse import reverse
-from rest_framework.status import is_success
+from rest_framework.status import HTTP_404_NOT_FOUND, is_success
 
-from tests.api.helpers import assert_fields_exist, login
+from common.rest_framework.pagination import CountCachingPaginator, ExtendedPagination
+from tests.api.helpers import assert_fields_exist, get_streamed_data, login
+from video_requests.models import Request
 
 pytestmark = pytest.mark.django_db
 
 
 def assert_pagination_fields(expected, response, video_requests_len):
-    assert_fields_exist(response.data, ["count", "links", "results", "total_pages"])
+    assert_fields_exist(
+        response.data, ["count", "count_exact", "links", "results", "total_pages"]
+    )
     assert_fields_exist(response.data["links"], ["next", "previous"])
 
     assert response.data["count"] == video_requests_len
@@ -42,7 +51,8 @@ def test_pagination(admin_user, api_client, expected, parameters):
     assert is_success(response.status_code)
 
     if not expected:
-        assert len(response.data) == len(video_requests)
+        assert response.streaming
+        assert len(get_streamed_data(response)) == len(video_requests)
         return
 
     assert_pagination_fields(expected, response, len(video_requests))
@@ -74,3 +84,161 @@ def test_pagination(admin_user, api_client, expected, parameters):
             return
 
     assert response.data["links"]["next"] is None
+
+
+@pytest.mark.parametrize(
+    "threshold,expected_count,expected_exact",
+    [(0, 3, True), (1000, 3, True), (500, 900, False)],
+)
+def test_pagination_approximate_count(
+    admin_user, api_client, expected_count, expected_exact, settings, threshold
+):
+    settings.APPROXIMATE_COUNT_THRESHOLD = threshold
+    baker.make("video_requests.Request", _quantity=3)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    with (
+        patch.object(CountCachingPaginator, "is_estimable", return_value=True),
+        patch.object(CountCachingPaginator, "estimate_count", return_value=900),
+    ):
+        response = api_client.get(url)
+
+    assert is_success(response.status_code)
+    assert response.data["count"] == expected_count
+    assert response.data["count_exact"] == expected_exact
+    assert len(response.data["results"]) == 3
+
+
+def walk_cursor_pages(api_client, url, parameters, direction):
+    pages = []
+    response = api_client.get(url, parameters)
+    while True:
+        assert is_success(response.status_code)
+        assert_fields_exist(response.data, ["links", "results"])
+        assert "count" not in response.data
+        pages.append([item["id"] for item in response.data["results"]])
+        if not response.data["links"][direction]:
+            return url, pages
+        url, parameters = response.data["links"][direction], {}
+        response = api_client.get(url)
+
+
+@pytest.mark.parametrize(
+    "url,model,ordering",
+    [
+        ("api:v1:admin:requests:request-list", "video_requests.Request", "created"),
+        ("api:v1:admin:requests:request-list", "video_requests.Request", "-status"),
+        (
+            "api:v1:admin:requests:request-list",
+            "video_requests.Request",
+            "responsible__last_name",
+        ),
+        (
+            "api:v1:admin:requests:request-list",
+            "video_requests.Request",
+            "-responsible__last_name",
+        ),
+        ("api:v1:admin:requests:video-list", "video_requests.Video", "-avg_rating"),
+        ("api:v1:admin:requests:video-list", "video_requests.Video", "status"),
+        ("api:v1:admin:todos:todo-list", "video_requests.Todo", "-status"),
+        ("api:v1:admin:users:user-list", "auth.User", "is_staff"),
+    ],
+)
+def test_cursor_pagination(admin_user, api_client, model, ordering, url):
+    requests = baker.make(
+        "video_requests.Request", status=iter([1, 2, 3] * 15), _quantity=45
+    )
+    baker.make(
+        "video_requests.Request",
+        responsible=iter(baker.make("auth.User", _quantity=15)),
+        _quantity=15,
+    )
+    videos = baker.make(
+        "video_requests.Video", request=iter(requests), _quantity=len(requests)
+    )
+    baker.make(
+        "video_requests.Rating",
+        rating=iter([1, 5] * 10),
+        video=iter(videos[:20]),
+        _quantity=20,
+    )
+    baker.make("video_requests.Todo", status=iter([1, 2] * 20), _quantity=40)
+
+    login(api_client, admin_user)
+
+    url = reverse(url)
+    parameters = {"ordering": ordering, "page_size": 7, "pagination": "cursor"}
+    last_url, pages = walk_cursor_pages(api_client, url, parameters, "next")
+
+    # The rows are in the requested order with the primary key as a tie-breaker
+    name, descending = ordering.lstrip("-"), ordering.startswith("-")
+    expected_ids = list(
+        apps.get_model(model)
+        .objects.order_by(
+            (
+                F(name).desc(nulls_first=True)
+                if descending
+                else F(name).asc(nulls_last=True)
+            ),
+            "pk",
+        )
+        .values_list("pk", flat=True)
+    )
+    assert len(pages) > 2
+    assert [item for page in pages for item in page] == expected_ids
+
+    # Going backwards from the last page returns the same pages
+    _, previous_pages = walk_cursor_pages(api_client, last_url, {}, "previous")
+    assert previous_pages == pages[::-1]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 500])
+def test_pagination_disabled_streams_in_chunks(admin_user, api_client, chunk_size):
+    videos = baker.make("video_requests.Video", _quantity=20)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:video-list")
+    with patch(
+        "api.v1.admin.requests.videos.views.VideoAdminSearchListAPIView.stream_chunk_size",
+        chunk_size,
+    ):
+        response = api_client.get(url, {"pagination": False})
+
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    assert sorted(video["id"] for video in get_streamed_data(response)) == [
+        video.id for video in videos
+    ]
+
+
+def test_cursor_pagination_invalid_cursor(admin_user, api_client):
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url, {"cursor": "invalid"})
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    "ordering,expected",
+    [
+        (["-title"], [("title", True), ("pk", False)]),
+        ([F("title").desc(), "-id"], [("title", True), ("id", True)]),
+        ([F("title")], [("title", False), ("pk", False)]),
+        ([Lower("title").asc()], None),
+        (["?"], None),
+    ],
+)
+def test_cursor_ordering(expected, ordering):
+    queryset = Request.objects.order_by(*ordering)
+
+    if expected is None:
+        with pytest.raises(ValidationError):
+            ExtendedPagination().get_cursor_ordering(queryset)
+        return
+
+    assert ExtendedPagination().get_cursor_ordering(queryset) == expected
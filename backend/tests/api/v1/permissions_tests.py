@@ -0,0 +1,59 @@
+import pytest
+from django.db.models import F
+from model_bakery import baker
+from rest_framework.test import APIRequestFactory
+
+from common.rest_framework.permissions import IsSelf, IsStaffSelfOrAdmin
+from video_requests.models import Comment, Rating, Request, Todo, Video
+
+pytestmark = pytest.mark.django_db
+
+
+def get_request(user):
+    request = APIRequestFactory().get("/")
+    request.user = user
+    return request
+
+
+def assert_only_owner_allowed(obj, owner, other):
+    assert IsSelf().has_object_permission(get_request(owner), None, obj)
+    assert not IsSelf().has_object_permission(get_request(other), None, obj)
+
+
+@pytest.mark.parametrize(
+    "model,owner_field", [(Comment, "author"), (Rating, "author"), (Todo, "creator")]
+)
+def test_is_self_compares_owner_id(
+    basic_user, django_assert_num_queries, model, owner_field, staff_user
+):
+    pk = baker.make(model, **{owner_field: basic_user}).pk
+    obj = model.objects.get(pk=pk)
+
+    with django_assert_num_queries(0):
+        assert_only_owner_allowed(obj, basic_user, staff_user)
+
+
+def test_is_self_request_and_video(basic_user, django_assert_num_queries, staff_user):
+    video_request = baker.make("video_requests.Request", requester=basic_user)
+    video_pk = baker.make("video_requests.Video", request=video_request).pk
+    video_request = Request.objects.get(pk=video_request.pk)
+    video = Video.objects.annotate(owner_id=F("request__requester_id")).get(pk=video_pk)
+
+    with django_assert_num_queries(0):
+        assert_only_owner_allowed(video_request, basic_user, staff_user)
+        assert_only_owner_allowed(video, basic_user, staff_user)
+
+    # Without the annotation only the request is loaded
+    video = Video.objects.get(pk=video_pk)
+    with django_assert_num_queries(1):
+        assert_only_owner_allowed(video, basic_user, staff_user)
+
+
+def test_is_staff_self_or_admin_requested_by(django_assert_num_queries, staff_user):
+    pk = baker.make("video_requests.Request", requested_by=staff_user).pk
+    video_request = Request.objects.get(pk=pk)
+
+    with django_assert_num_queries(0):
+        assert IsStaffSelfOrAdmin().has_object_permission(
+            get_request(staff_user), None, video_request
+        )
@@ -1,5 +1,6 @@
 from datetime import date, datetime, timedelta
 from itertools import combinations
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -19,7 +20,7 @@ from rest_framework.status import (
 )
 
 from common.models import get_anonymous_user
-from tests.api.helpers import assert_fields_exist, do_login, login
+from tests.api.helpers import assert_fields_exist, do_login, get_streamed_data, login
 from video_requests.models import Comment, Request
 
 pytestmark = pytest.mark.django_db
@@ -123,13 +124,16 @@ def test_list_requests(api_client, expected, pagination, request, user):
     if is_success(response.status_code):
         if pagination:
             assert_fields_exist(
-                response.data, ["count", "links", "results", "total_pages"]
+                response.data,
+                ["count", "count_exact", "links", "results", "total_pages"],
             )
             assert_fields_exist(response.data["links"], ["next", "previous"])
 
             assert response.data["count"] == len(video_requests)
 
-        response_data = response.data["results"] if pagination else response.data
+        response_data = (
+            response.data["results"] if pagination else get_streamed_data(response)
+        )
         assert len(response_data) == len(video_requests)
         for request in response_data:
             assert_list_response_keys(request)
@@ -483,8 +487,10 @@ def test_order_requests(
 
     assert is_success(response.status_code)
 
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
     for i, _ in enumerate(requests):
-        response_data = response.data["results"] if pagination else response.data
 
         assert response_data[i]["id"] == requests[expected[i] - 1].id
 
@@ -531,7 +537,9 @@ def test_search_requests(api_client, basic_user, pagination):
 
     assert is_success(response.status_code)
 
-    response_data = response.data["results"] if pagination else response.data
+    response_data = (
+        response.data["results"] if pagination else get_streamed_data(response)
+    )
 
     assert len(response_data) == 5
 
@@ -540,3 +548,29 @@ def test_search_requests(api_client, basic_user, pagination):
     assert response_data[2]["id"] == requests[2].id
     assert response_data[3]["id"] == requests[6].id
     assert response_data[4]["id"] == requests[7].id
+
+
+@patch("video_requests.utilities.request_status_transition.apply_async")
+def test_create_request_schedules_status_transition(
+    mock_apply_async,
+    api_client,
+    basic_user,
+    django_capture_on_commit_callbacks,
+    request_create_data,
+):
+    login(api_client, basic_user)
+
+    data = request_create_data | {
+        "end_datetime": localtime() + timedelta(minutes=40),
+        "start_datetime": localtime() + timedelta(minutes=10),
+    }
+    url = reverse("api:v1:requests:request-list")
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(url, data)
+
+    assert response.status_code == HTTP_201_CREATED
+    video_request = Request.objects.get(pk=response.data["id"])
+    mock_apply_async.assert_called_once()
+    args, kwargs = mock_apply_async.call_args
+    assert args[0][0] == video_request.id
+    assert kwargs["eta"] == video_request.end_datetime
@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework.reverse import reverse
+from rest_framework.status import HTTP_200_OK
+
+from tests.api.helpers import login
+
+pytestmark = pytest.mark.django_db
+
+
+def test_request_retrieve_fields(admin_user, api_client):
+    video_request = baker.make("video_requests.Request")
+    baker.make("video_requests.CrewMember", request=video_request)
+    baker.make("video_requests.Video", request=video_request)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-detail", args=(video_request.id,))
+    with CaptureQueriesContext(connection) as full:
+        response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert "crew" in response.data
+
+    with CaptureQueriesContext(connection) as sparse:
+        response = api_client.get(url, {"fields": "id,title,status"})
+    assert response.status_code == HTTP_200_OK
+    assert set(response.data) == {"id", "title", "status"}
+
+    # The crew and videos are not prefetched
+    assert len(sparse) == len(full) - 2
+
+
+def test_request_list_omit(admin_user, api_client):
+    video_requests = baker.make("video_requests.Request", _quantity=3)
+    for video_request in video_requests:
+        baker.make("video_requests.CrewMember", request=video_request)
+
+    login(api_client, admin_user)
+
+    url = reverse("api:v1:admin:requests:request-list")
+    response = api_client.get(url, {"omit": "crew,responsible"})
+
+    assert response.status_code == HTTP_200_OK
+    assert len(response.data["results"]) == 3
+    for result in response.data["results"]:
+        assert "crew" not in result
+        assert "responsible" not in result
+        assert "title" in result
+
+
+def test_unknown_fields_are_ignored(admin_user, api_client):
+    video_request = baker.make("video_requests.Request")
+
+    login(api_client, admin_user)
+
+    baker.make("video_requests.Video", request=video_request)
+    url = reverse(
+        "api:v1:admin:requests:request:video-list",
+        kwargs={"request_pk": video_request.id},
+    )
+    response = api_client.get(url, {"fields": "id,not_existing"})
+
+    assert response.status_code == HTTP_200_OK
+    assert [set(video) for video in response.data] == [{"id"}]
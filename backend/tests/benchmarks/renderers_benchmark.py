@@ -0,0 +1,81 @@
+"""
+Compare the JSONRenderer of REST framework and the ORJSONRenderer on data shaped like
+the admin request list. Run it from the backend directory:
+
+    python -m tests.benchmarks.renderers_benchmark --count 1000 --repeat 20
+"""
+
+import argparse
+import os
+import timeit
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.test")
+django.setup()
+
+from django.utils.translation import gettext_lazy as _  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from common.rest_framework.renderers import ORJSONRenderer  # noqa: E402
+
+
+def get_user(pk: int) -> dict:
+    return {
+        "id": pk,
+        "first_name": "Gábor",
+        "last_name": f"Kovács {pk}",
+        "avatar_url": f"https://example.com/avatars/{pk}.png",
+    }
+
+
+def get_data(count: int) -> list[dict]:
+    start = datetime(2026, 1, 1, 12, tzinfo=UTC)
+    return [
+        {
+            "id": pk,
+            "title": f"Gólyabál – {pk}",
+            "created": start - timedelta(days=pk, microseconds=pk),
+            "start_datetime": start + timedelta(days=pk),
+            "end_datetime": start + timedelta(days=pk, hours=4),
+            "deadline": (start + timedelta(weeks=3)).date(),
+            "status": pk % 10,
+            "status_by_admin": _("Requested"),
+            "video_count": pk % 5,
+            "avg_rating": Decimal("4.5"),
+            "responsible": get_user(pk),
+            "crew": [
+                {"id": pk * 10 + i, "member": get_user(i), "position": "Operatőr"}
+                for i in range(3)
+            ],
+            "additional_data": {"accepted": True, "recording": {"path": "/mnt"}},
+        }
+        for pk in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=1000, help="number of requests")
+    parser.add_argument("--repeat", type=int, default=20, help="number of renders")
+    args = parser.parse_args()
+
+    data = get_data(args.count)
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    results = {}
+    for renderer_class in [JSONRenderer, ORJSONRenderer]:
+        # A new renderer is created for every response like in the views
+        timer = timeit.Timer(lambda: renderer_class().render(data))
+        results[renderer_class] = min(timer.repeat(repeat=5, number=args.repeat))
+        print(
+            f"{renderer_class.__name__}: "
+            f"{results[renderer_class] / args.repeat * 1000:.2f} ms per render"
+        )
+    print(f"Speedup: {results[JSONRenderer] / results[ORJSONRenderer]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
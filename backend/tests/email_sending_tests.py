@@ -29,6 +29,7 @@ from video_requests.emails import (
     email_crew_request_modified,
     email_production_manager_unfinished_requests,
     email_responsible_overdue_request,
+    email_staff_todos_assigned,
     email_staff_weekly_tasks,
 )
 from video_requests.models import Request, Todo, Video
@@ -168,7 +169,8 @@ class EmailSendingTestCase(APITestCase):
             "api:v1:admin:requests:request:video-detail",
             kwargs={"request_pk": request.id, "pk": video.id},
         )
-        response = self.client.patch(url, data)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], Video.Statuses.PUBLISHED)
 
@@ -212,7 +214,8 @@ class EmailSendingTestCase(APITestCase):
             "api:v1:admin:requests:request:video-detail",
             kwargs={"request_pk": request.id, "pk": video.id},
         )
-        response = self.client.patch(url, data)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], Video.Statuses.PUBLISHED)
 
@@ -252,7 +255,8 @@ class EmailSendingTestCase(APITestCase):
             "api:v1:admin:requests:request:video-detail",
             kwargs={"request_pk": request.id, "pk": video.id},
         )
-        response = self.client.patch(url, data)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], Video.Statuses.PUBLISHED)
 
@@ -291,7 +295,8 @@ class EmailSendingTestCase(APITestCase):
             "api:v1:admin:requests:request:video-detail",
             kwargs={"request_pk": request.id, "pk": video.id},
         )
-        response = self.client.patch(url, data)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], Video.Statuses.PUBLISHED)
 
@@ -1066,3 +1071,26 @@ class EmailSendingTestCase(APITestCase):
         self.assertEqual(
             mail.outbox[0].subject, "Kapcsolatfelvétel | Budavári Schönherz Stúdió"
         )
+
+    def test_todos_assigned_emails_sent_in_one_task(self):
+        video_request = create_request(100, self.normal_user)
+        video = create_video(101, video_request)
+        request_todo = baker.make("video_requests.Todo", request=video_request)
+        video_todo = baker.make(
+            "video_requests.Todo", request=video_request, video=video
+        )
+
+        email_staff_todos_assigned(
+            [
+                [request_todo.id, [self.staff_user.id, self.normal_user.id]],
+                [video_todo.id, [self.pr_responsible.id]],
+            ]
+        )
+
+        # Only staff members are notified
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, [self.staff_user.email])
+        self.assertIn(video_request.title, mail.outbox[0].body)
+        self.assertEqual(mail.outbox[1].to, [self.pr_responsible.email])
+        self.assertIn(video.title, mail.outbox[1].body)
+        self.assertEqual(mail.outbox[1].subject, "Feladatot rendeltek hozzád")
@@ -1,8 +1,13 @@
+from unittest.mock import patch
+
 import pytest
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, User
 from django.core.exceptions import ValidationError
 from model_bakery import baker
 
+from common.models import Ban
+from video_requests.models import Request, Video
+
 
 @pytest.mark.django_db
 class TestUserProfileClean:
@@ -27,3 +32,131 @@ class TestUserProfileClean:
             "gravatar": "https://example.com/avatar.png",
         }
         profile.clean()  # Should not raise
+
+
+@pytest.mark.django_db
+class TestUserGroupNames:
+    def test_groups_are_loaded_once(self, django_assert_num_queries, settings):
+        user = baker.make(User, is_staff=True)
+        user.groups.add(baker.make(Group, name=settings.ADMIN_GROUP))
+        user = User.objects.get(pk=user.pk)
+
+        with django_assert_num_queries(1):
+            assert user.is_admin
+            assert not user.is_service_account
+            assert user.role == "admin"
+
+    def test_prefetched_groups_are_used(self, django_assert_num_queries, settings):
+        baker.make(User, is_staff=True, _quantity=3)
+
+        with django_assert_num_queries(2):
+            users = list(User.objects.prefetch_related("groups"))
+            assert [user.role for user in users] == ["staff"] * 3
+
+    def test_cleared_when_groups_change(self, settings):
+        user = baker.make(User, is_staff=True)
+        assert not user.is_admin
+
+        user.groups.add(baker.make(Group, name=settings.ADMIN_GROUP))
+        assert user.is_admin
+
+        user.groups.clear()
+        assert not user.is_admin
+
+    def test_cleared_when_banned(self, settings):
+        user = baker.make(User, is_staff=True)
+        user.groups.add(baker.make(Group, name=settings.SERVICE_ACCOUNTS_GROUP))
+        assert user.is_service_account
+
+        Ban.objects.create(receiver=user, creator=baker.make(User))
+        assert not user.is_service_account
+
+
+@pytest.mark.django_db
+class TestTrackedFields:
+    def test_changes_are_tracked_until_saved(self):
+        request = baker.make(Request, title="Title")
+        request = Request.objects.get(pk=request.pk)
+        assert not request.has_changed("title")
+
+        request.title = "New title"
+        assert request.has_changed("title")
+        assert not request.has_changed("end_datetime")
+
+        request.save()
+        assert not request.has_changed("title")
+
+    def test_deferred_fields_are_changed(self):
+        request = baker.make(Request)
+        request = Request.objects.defer("title").get(pk=request.pk)
+        assert request.has_changed("title")
+        assert not request.has_changed("end_datetime")
+
+    @patch("video_requests.signals.update_search_documents")
+    @patch("video_requests.signals.update_video_search_documents")
+    def test_search_documents_are_updated_if_title_changed(
+        self, update_video_search_documents, update_search_documents
+    ):
+        video = baker.make(Video)
+        assert update_video_search_documents.call_count == 1
+        # The request and the video are created
+        assert update_search_documents.call_count == 2
+
+        video = Video.objects.get(pk=video.pk)
+        video.status = Video.Statuses.IN_PROGRESS
+        video.save()
+        request = Request.objects.get(pk=video.request_id)
+        request.place = "New place"
+        request.save()
+        assert update_video_search_documents.call_count == 1
+        assert update_search_documents.call_count == 2
+
+        video.title = "New title"
+        video.save()
+        request.title = "New title"
+        request.save()
+        assert update_video_search_documents.call_count == 2
+        assert update_search_documents.call_count == 4
+
+
+@pytest.mark.django_db
+class TestCascadeDelete:
+    def test_children_of_deleted_request_do_not_update_it(
+        self, django_assert_num_queries
+    ):
+        request = baker.make(Request)
+        for video in baker.make(Video, request=request, _quantity=2):
+            baker.make("video_requests.Rating", video=video)
+            baker.make("video_requests.Todo", request=request, video=video)
+        baker.make("video_requests.Comment", request=request, _quantity=2)
+        baker.make("video_requests.CrewMember", request=request, _quantity=2)
+        request = Request.objects.get(pk=request.pk)
+
+        # The children are collected, deleted and their history is saved
+        with django_assert_num_queries(29) as queries:
+            request.delete()
+
+        # The counters, the ratings and the statuses of the objects being deleted are
+        # not loaded and updated for every child
+        assert not [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(("SELECT", "UPDATE"))
+            and "video_requests_request" in query["sql"]
+        ]
+
+    def test_deleted_video_updates_request(self):
+        request = baker.make(Request)
+        video = baker.make(Video, request=request)
+        baker.make("video_requests.Rating", video=video)
+        baker.make("video_requests.Todo", request=request, video=video)
+        request.refresh_from_db()
+        assert request.video_count == 1
+        assert request.open_todo_count == 1
+
+        video.delete()
+
+        request.refresh_from_db()
+        assert request.video_count == 0
+        # The todos of the video are deleted by cascade but the request is kept
+        assert request.open_todo_count == 0
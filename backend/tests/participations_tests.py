@@ -0,0 +1,110 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from model_bakery import baker
+
+from video_requests.models import Participation
+
+pytestmark = pytest.mark.django_db
+
+
+def get_participations(user):
+    return sorted(
+        Participation.objects.filter(user=user).values_list(
+            "request_id", "role", "position", "start_datetime"
+        )
+    )
+
+
+def test_participations_follow_request_changes():
+    user = baker.make(User)
+    video_request = baker.make("video_requests.Request", responsible=user)
+    assert get_participations(user) == [
+        (video_request.id, "responsible", "", video_request.start_datetime)
+    ]
+
+    video_request.start_datetime -= timedelta(days=3)
+    video_request.save()
+    assert get_participations(user) == [
+        (video_request.id, "responsible", "", video_request.start_datetime)
+    ]
+
+    video_request.responsible = baker.make(User)
+    video_request.save()
+    assert get_participations(user) == []
+
+
+@patch("video_requests.signals.update_participations")
+def test_participations_not_rebuilt_for_other_changes(update_participations):
+    video_request = baker.make("video_requests.Request", responsible=baker.make(User))
+    video = baker.make("video_requests.Video", request=video_request)
+    # Only the new request is rebuilt as the video has no editor
+    assert update_participations.call_count == 1
+
+    video_request.title = "New title"
+    video_request.save()
+    video.title = "New title"
+    video.save()
+    video.delete()
+    assert update_participations.call_count == 1
+
+    video_request.end_datetime += timedelta(hours=1)
+    video_request.save()
+    assert update_participations.call_count == 2
+
+
+def test_participations_follow_crew_and_video_changes():
+    user = baker.make(User)
+    video_request = baker.make("video_requests.Request")
+    start_datetime = video_request.start_datetime
+
+    crew_member = baker.make(
+        "video_requests.CrewMember", member=user, request=video_request, position="A"
+    )
+    video = baker.make("video_requests.Video", request=video_request)
+    assert get_participations(user) == [(video_request.id, "crew", "A", start_datetime)]
+
+    video.editor = user
+    video.save()
+    crew_member.position = "B"
+    crew_member.save()
+    assert get_participations(user) == [
+        (video_request.id, "crew", "B", start_datetime),
+        (video_request.id, "editor", "", start_datetime),
+    ]
+
+    crew_member.delete()
+    video.delete()
+    assert get_participations(user) == []
+
+
+def test_participations_deleted_with_request_and_user():
+    user = baker.make(User)
+    video_request = baker.make("video_requests.Request", responsible=user)
+    baker.make("video_requests.CrewMember", member=user, request=video_request)
+    baker.make("video_requests.Video", editor=user, request=video_request)
+    assert len(get_participations(user)) == 3
+
+    video_request.delete()
+    assert not Participation.objects.exists()
+
+    video_request = baker.make("video_requests.Request")
+    baker.make("video_requests.CrewMember", member=user, request=video_request)
+    baker.make("video_requests.CrewMember", request=video_request)
+    user.delete()
+    assert Participation.objects.get().request_id == video_request.id
+
+
+def test_update_participations_command():
+    user = baker.make(User)
+    video_request = baker.make("video_requests.Request", responsible=user)
+    baker.make("video_requests.CrewMember", member=user, request=video_request)
+    expected = get_participations(user)
+
+    Participation.objects.all().delete()
+    call_command("update_participations", stdout=StringIO())
+    assert get_participations(user) == expected
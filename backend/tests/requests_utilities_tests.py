@@ -1,9 +1,13 @@
 from datetime import datetime, timedelta
 from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import time_machine
 from django.core.management import call_command
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import localtime
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -11,9 +15,12 @@ from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.utils import make_utc
 
+from api.v1.admin.requests.requests.serializers import RequestAdminUpdateSerializer
+from api.v1.admin.requests.videos.serializers import VideoAdminCreateUpdateSerializer
 from tests.helpers.users_test_utils import create_user
 from tests.helpers.video_requests_test_utils import create_request, create_video
 from video_requests.models import Request, Video
+from video_requests.utilities import request_status_transition
 
 
 def get_test_data():
@@ -615,10 +622,11 @@ class RequestsUtilitiesTestCase(APITestCase):
         request.save()
 
         # Publish video
-        response = self.client.patch(
-            f"{self.url}/{request.id}/videos/{video_id}",
-            {"additional_data": {"publishing": {"website": "https://example.com"}}},
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f"{self.url}/{request.id}/videos/{video_id}",
+                {"additional_data": {"publishing": {"website": "https://example.com"}}},
+            )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["status"], Video.Statuses.PUBLISHED)
 
@@ -852,3 +860,226 @@ class RequestsUtilitiesTestCase(APITestCase):
             "Additional properties are not allowed ('randomKey' was unexpected)",
             response.data["additional_data"][0],
         )
+
+    def _create_recorded_requests(self, first_id, count):
+        requests = []
+        for request_id in range(first_id, first_id + count):
+            request = create_request(
+                request_id,
+                self.user,
+                Request.Statuses.ACCEPTED,
+                start="2020-11-20T10:00:00+0100",
+                end="2020-11-20T14:00:00+0100",
+            )
+            request.additional_data = {
+                "accepted": True,
+                "recording": {"path": "N:/test_path"},
+            }
+            request.save()
+            create_video(
+                request_id * 10, request, Video.Statuses.PENDING, editor=self.user
+            )
+            create_video(request_id * 10 + 1, request, Video.Statuses.PENDING)
+            requests.append(request)
+        return requests
+
+    @time_machine.travel("2020-11-21 10:20:30 +0100")
+    def test_update_request_status_command_uses_fixed_number_of_queries(self):
+        requests = self._create_recorded_requests(100, 2)
+        with CaptureQueriesContext(connection) as few_requests, StringIO() as out:
+            call_command("update_request_status", stdout=out)
+            self.assertEqual(
+                out.getvalue(), "2 requests was checked for valid status.\n"
+            )
+
+        requests += self._create_recorded_requests(200, 6)
+        with CaptureQueriesContext(connection) as many_requests, StringIO() as out:
+            call_command("update_request_status", stdout=out)
+            self.assertEqual(
+                out.getvalue(), "6 requests was checked for valid status.\n"
+            )
+
+        self.assertEqual(len(few_requests), len(many_requests))
+
+        for request in requests:
+            request.refresh_from_db()
+            self.assertEqual(request.status, Request.Statuses.UPLOADED)
+            self.assertEqual(request.history.count(), 3)
+            self.assertEqual(
+                Video.objects.get(pk=request.id * 10).status,
+                Video.Statuses.IN_PROGRESS,
+            )
+            self.assertEqual(
+                Video.objects.get(pk=request.id * 10 + 1).status,
+                Video.Statuses.PENDING,
+            )
+
+    def _create_uploaded_request(self, request_id, video_count):
+        request = create_request(
+            request_id,
+            self.user,
+            Request.Statuses.UPLOADED,
+            start="2020-11-20T10:00:00+0100",
+            end="2020-11-20T14:00:00+0100",
+        )
+        request.additional_data = {
+            "accepted": True,
+            "recording": {"path": "N:/test_path"},
+        }
+        request.save()
+        for video_id in range(request_id * 100, request_id * 100 + video_count):
+            create_video(video_id, request, Video.Statuses.IN_PROGRESS, self.user)
+        return request
+
+    def _edit_first_video(self, request):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                f"{self.url}/{request.id}/videos/{request.id * 100}",
+                {"additional_data": {"editing_done": True}},
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], Video.Statuses.EDITED)
+        return queries
+
+    def test_video_update_saves_only_changed_statuses(self):
+        few_videos = self._create_uploaded_request(100, 2)
+        many_videos = self._create_uploaded_request(200, 10)
+        history_counts = {
+            request.id: request.history.count() for request in [few_videos, many_videos]
+        }
+
+        self.assertEqual(
+            len(self._edit_first_video(few_videos)),
+            len(self._edit_first_video(many_videos)),
+        )
+
+        for request in [few_videos, many_videos]:
+            request.refresh_from_db()
+            self.assertEqual(request.status, Request.Statuses.UPLOADED)
+            self.assertEqual(request.history.count(), history_counts[request.id])
+            self.assertEqual(
+                request.videos.filter(status=Video.Statuses.EDITED).count(), 1
+            )
+
+    def test_additional_data_merged_into_current_data(self):
+        request = create_request(100, self.user)
+        video = create_video(1000, request)
+        # The objects are loaded before the concurrent writes
+        stale_request = Request.objects.get(pk=request.pk)
+        stale_video = Video.objects.get(pk=video.pk)
+        Request.update_with_retry(
+            request.pk,
+            lambda obj: obj.additional_data.update(
+                status_by_admin={"status": Request.Statuses.DONE}
+            ),
+            ["additional_data"],
+        )
+        Video.update_with_retry(
+            video.pk,
+            lambda obj: obj.additional_data.update(
+                publishing={"email_sent_to_user": True}
+            ),
+            ["additional_data"],
+        )
+
+        context = {"request": SimpleNamespace(user=self.user)}
+        for serializer in [
+            RequestAdminUpdateSerializer(
+                stale_request,
+                data={"additional_data": {"recording": {"path": "/test"}}},
+                partial=True,
+                context=context,
+            ),
+            VideoAdminCreateUpdateSerializer(
+                stale_video,
+                data={"additional_data": {"length": 120}},
+                partial=True,
+                context=context,
+            ),
+        ]:
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        request.refresh_from_db()
+        self.assertEqual(
+            request.additional_data["status_by_admin"]["status"],
+            Request.Statuses.DONE,
+        )
+        self.assertEqual(request.additional_data["recording"]["path"], "/test")
+        video.refresh_from_db()
+        self.assertTrue(video.additional_data["publishing"]["email_sent_to_user"])
+        self.assertEqual(video.additional_data["length"], 120)
+
+    @patch("video_requests.utilities.request_status_transition.apply_async")
+    def test_status_transition_rescheduled_when_end_datetime_changes(
+        self, mock_apply_async
+    ):
+        with self.captureOnCommitCallbacks(execute=True):
+            request = create_request(100, self.user)
+        # The event ends after the next run of the update_request_status command
+        mock_apply_async.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                f"{self.url}/{request.id}", {"title": "Changed title"}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_apply_async.assert_not_called()
+
+        end_datetime = localtime() + timedelta(minutes=30)
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.patch(
+                f"{self.url}/{request.id}", {"end_datetime": end_datetime}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            # The task is only sent after the transaction is committed
+            mock_apply_async.assert_not_called()
+        for callback in callbacks:
+            callback()
+        mock_apply_async.assert_called_once_with(
+            (request.id, end_datetime.isoformat()), eta=end_datetime
+        )
+
+    @time_machine.travel("2020-11-21 10:20:30 +0100")
+    @patch("video_requests.utilities.request_status_transition.apply_async")
+    def test_update_request_status_command_schedules_transitions(
+        self, mock_apply_async
+    ):
+        soon = create_request(
+            100,
+            self.user,
+            Request.Statuses.ACCEPTED,
+            start="2020-11-21T09:00:00+0100",
+            end="2020-11-21T11:00:00+0100",
+        )
+        create_request(
+            101,
+            self.user,
+            Request.Statuses.ACCEPTED,
+            start="2020-11-21T09:00:00+0100",
+            end="2020-11-21T12:00:00+0100",
+        )
+
+        with self.captureOnCommitCallbacks(execute=True), StringIO() as out:
+            call_command("update_request_status", stdout=out)
+            self.assertEqual(
+                out.getvalue(),
+                "0 requests was checked for valid status.\n"
+                "1 status transitions were scheduled.\n",
+            )
+        soon.refresh_from_db()
+        mock_apply_async.assert_called_once_with(
+            (soon.id, soon.end_datetime.isoformat()), eta=soon.end_datetime
+        )
+
+    @time_machine.travel("2020-11-21 10:20:30 +0100")
+    def test_status_transition_skipped_when_end_datetime_changed(self):
+        request = self._create_recorded_requests(100, 1)[0]
+
+        request_status_transition(request.id, "2020-11-20T12:00:00+01:00")
+        request.refresh_from_db()
+        self.assertEqual(request.status, Request.Statuses.ACCEPTED)
+
+        request_status_transition(request.id, request.end_datetime.isoformat())
+        request.refresh_from_db()
+        self.assertEqual(request.status, Request.Statuses.UPLOADED)
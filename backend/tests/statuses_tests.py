@@ -0,0 +1,208 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+from django.utils.timezone import localtime
+from model_bakery import baker
+
+from video_requests.models import Request, Video
+from video_requests.statuses import (
+    NotifySchEvents,
+    RequestSnapshot,
+    VideoPublished,
+    VideoSnapshot,
+    derive_statuses,
+    evaluate,
+)
+from video_requests.utilities import bulk_update_request_status, status_unit_of_work
+
+NOW = localtime()
+
+SCH_EVENTS_DATA = {
+    "accepted": True,
+    "external": {"sch_events_callback_url": "https://example.com"},
+}
+
+PUBLISHED_VIDEO_DATA = {
+    "editing_done": True,
+    "coding": {"website": True},
+    "publishing": {"website": "https://example.com"},
+}
+
+
+def make_request(
+    additional_data, videos=(), status=Request.Statuses.REQUESTED, is_staff=False
+):
+    return RequestSnapshot(
+        id=1,
+        status=status,
+        additional_data=additional_data,
+        end_datetime=NOW - timedelta(hours=1),
+        requester_is_staff=is_staff,
+        videos=tuple(videos),
+    )
+
+
+def make_video(id, additional_data=None, status=Video.Statuses.PENDING, editor=True):
+    return VideoSnapshot(
+        id=id,
+        status=status,
+        additional_data=additional_data or {},
+        has_editor=editor,
+    )
+
+
+class TestDeriveStatuses:
+    def test_request_and_videos_follow_the_flow(self):
+        request = make_request(
+            {"accepted": True, "recording": {"path": "/test"}},
+            [make_video(1, {"editing_done": True}), make_video(2, editor=False)],
+        )
+        result = derive_statuses(request, NOW)
+
+        assert result.request_status == Request.Statuses.UPLOADED
+        assert result.video_statuses == {
+            1: Video.Statuses.EDITED,
+            2: Video.Statuses.PENDING,
+        }
+        assert result.changed_videos == {1: Video.Statuses.EDITED}
+        assert result.side_effects == []
+
+    def test_status_by_admin_overwrites_everything(self):
+        request = make_request(
+            {"accepted": True, "status_by_admin": {"status": Request.Statuses.DONE}},
+            [make_video(1, {"status_by_admin": {"status": Video.Statuses.DONE}})],
+        )
+        result = derive_statuses(request, NOW)
+
+        assert result.request_status == Request.Statuses.DONE
+        assert result.video_statuses == {1: Video.Statuses.DONE}
+        assert result.side_effects == []
+
+    def test_published_video_returns_side_effect_once(self):
+        request = make_request(
+            {"accepted": True, "recording": {"path": "/test"}},
+            [make_video(1, PUBLISHED_VIDEO_DATA)],
+            status=Request.Statuses.UPLOADED,
+        )
+        result = derive_statuses(request, NOW)
+        assert result.video_statuses == {1: Video.Statuses.PUBLISHED}
+        assert result.side_effects == [
+            VideoPublished(request_id=1, video_id=1, notify_requester=True)
+        ]
+
+        request = make_request(
+            request.additional_data,
+            [make_video(1, PUBLISHED_VIDEO_DATA, status=Video.Statuses.PUBLISHED)],
+            status=Request.Statuses.EDITED,
+            is_staff=True,
+        )
+        assert derive_statuses(request, NOW).side_effects == []
+
+    def test_sch_events_notification_side_effect(self):
+        request = make_request(
+            {
+                "accepted": False,
+                "external": {"sch_events_callback_url": "https://example.com"},
+            }
+        )
+        result = derive_statuses(request, NOW)
+
+        assert result.request_status == Request.Statuses.DENIED
+        assert result.side_effects == [NotifySchEvents(request_id=1)]
+
+    def test_changed_video_uses_current_request_status(self):
+        request = make_request(
+            {"accepted": True},
+            [make_video(1, {"editing_done": True}), make_video(2)],
+            status=Request.Statuses.UPLOADED,
+        )
+        result = derive_statuses(request, NOW, changed_video_ids={2})
+
+        assert result.request_status == Request.Statuses.RECORDED
+        assert result.video_statuses == {
+            1: Video.Statuses.PENDING,
+            2: Video.Statuses.IN_PROGRESS,
+        }
+
+
+def test_evaluate_derives_every_request():
+    requests = [
+        make_request({}),
+        make_request({"accepted": True}, [make_video(1)]),
+        make_request({"accepted": True, "canceled": True}),
+    ]
+    results = evaluate(requests, NOW)
+
+    assert [result.request_status for result in results] == [
+        Request.Statuses.REQUESTED,
+        Request.Statuses.RECORDED,
+        Request.Statuses.CANCELED,
+    ]
+    assert [result.request_changed for result in results] == [False, True, True]
+
+
+def make_requested_request():
+    video_request = baker.make("video_requests.Request")
+    # The status is not derived by the signals
+    Request.objects.filter(pk=video_request.pk).update(
+        additional_data=SCH_EVENTS_DATA, status=Request.Statuses.REQUESTED
+    )
+    return video_request
+
+
+@pytest.mark.django_db
+@patch("video_requests.utilities.notify_sch_event_management_system.delay")
+def test_side_effects_dispatched_on_commit(
+    mock_delay, django_capture_on_commit_callbacks
+):
+    video_request = make_requested_request()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with transaction.atomic():
+            bulk_update_request_status(Request.objects.filter(pk=video_request.pk))
+        mock_delay.assert_not_called()
+
+    assert len(callbacks) == 1
+    callbacks[0]()
+    mock_delay.assert_called_once_with(video_request.pk)
+
+
+@pytest.mark.django_db
+@patch("video_requests.utilities.notify_sch_event_management_system.delay")
+def test_side_effects_not_dispatched_on_rollback(
+    mock_delay, django_capture_on_commit_callbacks
+):
+    video_request = make_requested_request()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(RuntimeError), transaction.atomic():
+            bulk_update_request_status(Request.objects.filter(pk=video_request.pk))
+            raise RuntimeError
+
+    assert not callbacks
+    mock_delay.assert_not_called()
+    video_request.refresh_from_db()
+    assert video_request.status == Request.Statuses.REQUESTED
+
+
+@pytest.mark.django_db
+@patch("video_requests.utilities.notify_sch_event_management_system.delay")
+def test_unit_of_work_side_effects_dispatched_on_commit(
+    mock_delay, django_capture_on_commit_callbacks
+):
+    video_request = make_requested_request()
+    video_request.refresh_from_db()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with transaction.atomic():
+            with status_unit_of_work() as unit_of_work:
+                unit_of_work.add_request(video_request)
+            # The statuses are saved when the unit of work is closed
+            assert video_request.status == Request.Statuses.ACCEPTED
+        mock_delay.assert_not_called()
+
+    assert len(callbacks) == 1
+    callbacks[0]()
+    mock_delay.assert_called_once_with(video_request.pk)
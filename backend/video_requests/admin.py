@@ -1,6 +1,5 @@
 from django.contrib import admin
 from django.contrib.admin import ModelAdmin
-from django.db.models import Avg, Count
 from django.urls import reverse
 from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
@@ -24,12 +23,9 @@ class RequestHistoryAdmin(SimpleHistoryAdmin):
     readonly_fields = ["requested_by"]
     search_fields = ["title"]
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).annotate(num_of_videos=Count("videos"))
-
     @admin.display(description="Number of Videos")
     def num_of_videos(self, obj):
-        return obj.num_of_videos
+        return obj.video_count
 
     @admin.display(description="Requester")
     def requester_link(self, obj):
@@ -63,9 +59,6 @@ class VideoHistoryAdmin(SimpleHistoryAdmin):
     list_display = ["id", "title", "status", "request_link", "avg_rating"]
     search_fields = ["title"]
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).annotate(avg_rating=Avg("ratings__rating"))
-
     @admin.display(description="Request")
     def request_link(self, obj):
         url = reverse("admin:video_requests_request_change", args=(obj.request.id,))
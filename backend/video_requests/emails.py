@@ -1,7 +1,7 @@
 from celery import shared_task
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 
 from common.utilities import get_editor_in_chief, get_production_manager
@@ -62,9 +62,11 @@ def email_user_video_published(video_id):
 
     msg.attach_alternative(msg_html, TEXT_HTML)
     msg.send()
-    video.refresh_from_db()
-    video.additional_data["publishing"]["email_sent_to_user"] = True
-    video.save()
+    Video.update_with_retry(
+        video.id,
+        lambda obj: obj.additional_data["publishing"].update(email_sent_to_user=True),
+        ["additional_data"],
+    )
     return f"Video published e-mail was sent to {video.request.requester.email} successfully."
 
 
@@ -207,10 +209,7 @@ def email_crew_request_modified(
     return f"Request modified notification e-mail was sent to {[crew_members_email_addresses, editor_in_chief_email_address, responsible_email_address]} successfully."
 
 
-@shared_task
-def email_staff_todo_assigned(todo_id, user_ids):
-    todo = Todo.objects.get(pk=todo_id)
-
+def get_staff_todo_assigned_message(todo, assignees_email_address):
     assignment_type = "video" if todo.video else "request"
     title = todo.video.title if todo.video else todo.request.title
 
@@ -221,10 +220,6 @@ def email_staff_todo_assigned(todo_id, user_ids):
 
     subject = "Feladatot rendeltek hozzád"
 
-    assignees_email_address = [
-        user.email for user in User.objects.filter(id__in=user_ids, is_staff=True)
-    ]
-
     msg = EmailMultiAlternatives(
         subject=subject,
         body=msg_plain,
@@ -232,10 +227,58 @@ def email_staff_todo_assigned(todo_id, user_ids):
     )
 
     msg.attach_alternative(msg_html, TEXT_HTML)
+    return msg
+
+
+@shared_task
+def email_staff_todo_assigned(todo_id, user_ids):
+    todo = Todo.objects.get(pk=todo_id)
+
+    assignees_email_address = [
+        user.email for user in User.objects.filter(id__in=user_ids, is_staff=True)
+    ]
+
+    msg = get_staff_todo_assigned_message(todo, assignees_email_address)
     msg.send()
     return f"Todo assignment notification was sent to {assignees_email_address} successfully."
 
 
+@shared_task
+def email_staff_todos_assigned(assignments):
+    """
+    Send the notifications of many todo assignments (a list of todo id and user ids
+    pairs) over one connection.
+    """
+    todos = Todo.objects.select_related("request", "video").in_bulk(
+        [todo_id for todo_id, user_ids in assignments]
+    )
+    email_addresses = dict(
+        User.objects.filter(
+            id__in={
+                user_id for todo_id, user_ids in assignments for user_id in user_ids
+            },
+            is_staff=True,
+        ).values_list("id", "email")
+    )
+
+    messages = []
+    for todo_id, user_ids in assignments:
+        assignees_email_address = [
+            email_addresses[user_id]
+            for user_id in user_ids
+            if user_id in email_addresses
+        ]
+        if todo_id in todos and assignees_email_address:
+            messages.append(
+                get_staff_todo_assigned_message(todos[todo_id], assignees_email_address)
+            )
+
+    get_connection().send_messages(messages)
+    return (
+        f"Todo assignment notification was sent for {len(messages)} todos successfully."
+    )
+
+
 def email_production_manager_unfinished_requests(requests):
     context = {"requests": requests}
 
@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+from video_requests.models import Request
+from video_requests.utilities import recalculate_request_counters
+
+
+class Command(BaseCommand):
+    help = "Recalculate the number of videos, comments and open todos of requests"
+
+    def handle(self, *args, **options):
+        updated = recalculate_request_counters(Request.objects.all())
+        self.stdout.write(
+            self.style.SUCCESS(f"Counters of {updated} requests were recalculated.")
+        )
@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+from video_requests.models import Video
+from video_requests.utilities import recalculate_video_ratings
+
+
+class Command(BaseCommand):
+    help = "Recalculate the number, the sum and the average of the ratings of videos"
+
+    def handle(self, *args, **options):
+        updated = recalculate_video_ratings(Video.objects.all())
+        self.stdout.write(
+            self.style.SUCCESS(f"Ratings of {updated} videos were recalculated.")
+        )
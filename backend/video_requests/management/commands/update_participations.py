@@ -0,0 +1,12 @@
+from django.core.management import BaseCommand
+
+from video_requests.models import Request
+from video_requests.utilities import update_participations
+
+
+class Command(BaseCommand):
+    help = "Rebuild the participations of users in requests"
+
+    def handle(self, *args, **options):
+        update_participations(Request.objects.all())
+        self.stdout.write(self.style.SUCCESS("Participations were updated."))
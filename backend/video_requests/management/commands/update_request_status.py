@@ -2,20 +2,38 @@ from django.core.management import BaseCommand
 from django.utils.timezone import localtime
 
 from video_requests.models import Request
-from video_requests.utilities import update_request_status
+from video_requests.utilities import (
+    STATUS_TRANSITION_WINDOW,
+    bulk_update_request_status,
+    schedule_request_status_transition,
+)
 
 
 class Command(BaseCommand):
     help = "Update status of requests which should be recorded by this time"
 
     def handle(self, *args, **options):
-        to_update = Request.objects.filter(
-            status=Request.Statuses.ACCEPTED, end_datetime__lte=localtime()
+        now = localtime()
+        to_update = bulk_update_request_status(
+            Request.objects.filter(
+                status=Request.Statuses.ACCEPTED, end_datetime__lte=now
+            )
+        )
+        # The requests which end before the next run are updated by scheduled tasks
+        scheduled = sum(
+            schedule_request_status_transition(request)
+            for request in Request.objects.filter(
+                status=Request.Statuses.ACCEPTED,
+                end_datetime__gt=now,
+                end_datetime__lte=now + STATUS_TRANSITION_WINDOW,
+            )
         )
-        for request in to_update:
-            update_request_status(request)
         self.stdout.write(
             self.style.SUCCESS(
-                f"{to_update.count()} requests was checked for valid status."
+                f"{len(to_update)} requests was checked for valid status."
             )
         )
+        if scheduled:
+            self.stdout.write(
+                self.style.SUCCESS(f"{scheduled} status transitions were scheduled.")
+            )
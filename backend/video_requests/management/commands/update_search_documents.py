@@ -0,0 +1,16 @@
+from django.core.management import BaseCommand
+
+from video_requests.models import Request, Video
+from video_requests.utilities import (
+    update_search_documents,
+    update_video_search_documents,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents of requests and videos"
+
+    def handle(self, *args, **options):
+        update_video_search_documents(Video.objects.all())
+        update_search_documents(Request.objects.all())
+        self.stdout.write(self.style.SUCCESS("Search documents were updated."))
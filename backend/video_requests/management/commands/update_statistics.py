@@ -0,0 +1,21 @@
+from django.core.management import BaseCommand
+
+from video_requests.statistics import update_statistics
+
+
+class Command(BaseCommand):
+    help = "Refresh the monthly statistics of the months changed since the last run"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-f",
+            "--full",
+            action="store_true",
+            help="Recalculate the statistics of every month.",
+        )
+
+    def handle(self, *args, **options):
+        refreshed = update_statistics(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Statistics of {refreshed} months were refreshed.")
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.7 on 2026-10-17 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0008_add_todo_status_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="request",
+            name="version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
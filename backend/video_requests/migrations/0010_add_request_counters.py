@@ -0,0 +1,56 @@
+# Generated by Django 6.0.7 on 2026-10-17 22:48
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_per_request(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.filter(request=OuterRef("pk"))
+            .order_by()
+            .values("request")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def set_request_counters(apps, schema_editor):
+    Comment = apps.get_model("video_requests", "Comment")
+    Request = apps.get_model("video_requests", "Request")
+    Todo = apps.get_model("video_requests", "Todo")
+    Video = apps.get_model("video_requests", "Video")
+    Request.objects.update(
+        video_count=count_per_request(Video.objects.all()),
+        comment_count=count_per_request(Comment.objects.all()),
+        open_todo_count=count_per_request(Todo.objects.filter(status=1)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0009_add_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="request",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="request",
+            name="open_todo_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="request",
+            name="video_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(set_request_counters, migrations.RunPython.noop),
+    ]
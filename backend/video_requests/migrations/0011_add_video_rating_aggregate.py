@@ -0,0 +1,66 @@
+# Generated by Django 6.0.7 on 2026-10-17 22:59
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def aggregate_per_video(queryset, aggregate):
+    return Coalesce(
+        Subquery(
+            queryset.filter(video=OuterRef("pk"))
+            .order_by()
+            .values("video")
+            .annotate(value=aggregate)
+            .values("value")
+        ),
+        0,
+    )
+
+
+def set_video_ratings(apps, schema_editor):
+    Rating = apps.get_model("video_requests", "Rating")
+    Video = apps.get_model("video_requests", "Video")
+    Video.objects.update(
+        rating_count=aggregate_per_video(Rating.objects.all(), Count("pk")),
+        rating_sum=aggregate_per_video(Rating.objects.all(), Sum("rating")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0010_add_request_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="avg_rating",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    django.db.models.functions.comparison.Cast(
+                        "rating_sum", models.FloatField()
+                    ),
+                    "/",
+                    django.db.models.functions.comparison.NullIf("rating_count", 0),
+                ),
+                output_field=models.FloatField(null=True),
+            ),
+        ),
+        migrations.RunPython(set_video_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 6.0.7 on 2026-10-17 23:06
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations, models
+
+VIDEO_TITLES = """
+    COALESCE(
+        (
+            SELECT STRING_AGG(v.title, ' ')
+            FROM video_requests_video v
+            WHERE v.request_id = video_requests_request.id
+        ),
+        ''
+    )
+"""
+
+
+def create_search_documents(apps, schema_editor):
+    # The search documents are only used on PostgreSQL
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE TEXT SEARCH CONFIGURATION hungarian_unaccent (COPY = hungarian)"
+    )
+    schema_editor.execute(
+        "ALTER TEXT SEARCH CONFIGURATION hungarian_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, hungarian_stem"
+    )
+    schema_editor.execute(
+        "UPDATE video_requests_video SET "
+        "search_text = LOWER(UNACCENT(title)), "
+        "search_vector = SETWEIGHT(TO_TSVECTOR('hungarian_unaccent', title), 'A')"
+    )
+    schema_editor.execute(
+        "UPDATE video_requests_request SET "
+        f"search_text = LOWER(UNACCENT(title || ' ' || {VIDEO_TITLES})), "
+        "search_vector = SETWEIGHT(TO_TSVECTOR('hungarian_unaccent', title), 'A') || "
+        f"SETWEIGHT(TO_TSVECTOR('hungarian_unaccent', {VIDEO_TITLES}), 'B')"
+    )
+
+
+def drop_search_documents(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS hungarian_unaccent")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0011_add_video_rating_aggregate"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.AddField(
+            model_name="request",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="request",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_documents, drop_search_documents),
+    ]
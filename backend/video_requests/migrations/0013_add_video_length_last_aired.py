@@ -0,0 +1,45 @@
+# Generated by Django 6.0.7 on 2026-10-17 23:11
+
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0012_add_search_documents"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="last_aired",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=django.db.models.fields.json.KeyTextTransform(
+                    0,
+                    django.db.models.fields.json.KeyTransform(
+                        "aired", "additional_data"
+                    ),
+                ),
+                output_field=models.CharField(max_length=10, null=True),
+            ),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="length",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=django.db.models.functions.comparison.Cast(
+                    django.db.models.fields.json.KeyTextTransform(
+                        "length", "additional_data"
+                    ),
+                    models.FloatField(),
+                ),
+                output_field=models.FloatField(null=True),
+            ),
+        ),
+    ]
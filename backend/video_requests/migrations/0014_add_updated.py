@@ -0,0 +1,33 @@
+# Generated by Django 6.0.7 on 2026-10-17 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0013_add_video_length_last_aired"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="updated",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="request",
+            name="updated",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="todo",
+            name="updated",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="updated",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
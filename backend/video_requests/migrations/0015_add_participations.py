@@ -0,0 +1,119 @@
+# Generated by Django 6.0.7 on 2026-10-18 00:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_participations(apps, schema_editor):
+    CrewMember = apps.get_model("video_requests", "CrewMember")
+    Participation = apps.get_model("video_requests", "Participation")
+    Request = apps.get_model("video_requests", "Request")
+    Video = apps.get_model("video_requests", "Video")
+    rows = [
+        (user_id, request_id, "responsible", "", start_datetime, end_datetime)
+        for user_id, request_id, start_datetime, end_datetime in Request.objects.filter(
+            responsible__isnull=False
+        ).values_list("responsible_id", "pk", "start_datetime", "end_datetime")
+    ]
+    rows += [
+        (user_id, request_id, "crew", position, start_datetime, end_datetime)
+        for user_id, request_id, position, start_datetime, end_datetime in (
+            CrewMember.objects.values_list(
+                "member_id",
+                "request_id",
+                "position",
+                "request__start_datetime",
+                "request__end_datetime",
+            )
+        )
+    ]
+    rows += [
+        (user_id, request_id, "editor", "", start_datetime, end_datetime)
+        for user_id, request_id, start_datetime, end_datetime in Video.objects.filter(
+            editor__isnull=False
+        ).values_list(
+            "editor_id",
+            "request_id",
+            "request__start_datetime",
+            "request__end_datetime",
+        )
+    ]
+    Participation.objects.bulk_create(
+        [
+            Participation(
+                user_id=user_id,
+                request_id=request_id,
+                role=role,
+                position=position,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+            )
+            for user_id, request_id, role, position, start_datetime, end_datetime in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0014_add_updated"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Participation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[
+                            ("responsible", "Responsible"),
+                            ("crew", "Crew"),
+                            ("editor", "Editor"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("position", models.CharField(blank=True, max_length=20)),
+                ("start_datetime", models.DateTimeField()),
+                ("end_datetime", models.DateTimeField()),
+                (
+                    "request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participations",
+                        to="video_requests.request",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participations",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "start_datetime"],
+                        name="video_reque_user_id_e48941_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_participations, migrations.RunPython.noop),
+    ]
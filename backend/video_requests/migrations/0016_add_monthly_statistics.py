@@ -0,0 +1,53 @@
+# Generated by Django 6.0.7 on 2026-10-18 00:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0015_add_participations"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyStatistic",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField()),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[
+                            ("requests", "Requests"),
+                            ("edited_videos", "Edited videos"),
+                            ("crew", "Crew"),
+                            ("ratings", "Ratings"),
+                            ("turnaround", "Turnaround"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("key", models.PositiveIntegerField(default=0)),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("total", models.FloatField(default=0)),
+                ("refreshed", models.DateTimeField()),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("month", "metric", "key"),
+                        name="unique_monthly_statistic",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 6.0.7 on 2026-10-18 00:47
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+HISTORICAL_MODELS = [
+    "HistoricalComment",
+    "HistoricalRating",
+    "HistoricalRequest",
+    "HistoricalVideo",
+]
+
+
+def get_history_value(value):
+    if value is None or isinstance(value, (bool, int, float, str, dict, list)):
+        return value
+    return str(value)
+
+
+def set_history_changes(apps, schema_editor):
+    for model_name in HISTORICAL_MODELS:
+        model = apps.get_model("video_requests", model_name)
+        fields = sorted(
+            (
+                field
+                for field in model._meta.concrete_fields
+                if field.editable and not field.name.startswith("history_")
+            ),
+            key=lambda field: field.name,
+        )
+        previous, records = {}, []
+        for record in model.objects.order_by(
+            "id", "history_date", "history_id"
+        ).iterator():
+            if record.history_type != "+" and record.id in previous:
+                record.history_changes = [
+                    {
+                        "field": field.name,
+                        "new": get_history_value(field.value_from_object(record)),
+                        "old": get_history_value(
+                            field.value_from_object(previous[record.id])
+                        ),
+                    }
+                    for field in fields
+                    if field.value_from_object(record)
+                    != field.value_from_object(previous[record.id])
+                ]
+                records.append(record)
+            previous[record.id] = record
+        model.objects.bulk_update(records, ["history_changes"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0016_add_monthly_statistics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalcomment",
+            name="history_changes",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalrating",
+            name="history_changes",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalrequest",
+            name="history_changes",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalvideo",
+            name="history_changes",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(set_history_changes, migrations.RunPython.noop),
+    ]
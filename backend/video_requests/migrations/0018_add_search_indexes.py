@@ -0,0 +1,46 @@
+# Generated by Django 6.0.7 on 2026-10-18 02:41
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_requests", "0017_add_history_changes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="request",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="request_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="request",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "search_text", name="gin_trgm_ops"
+                ),
+                name="request_search_text_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="video_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "search_text", name="gin_trgm_ops"
+                ),
+                name="video_search_text_idx",
+            ),
+        ),
+    ]
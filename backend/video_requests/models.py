@@ -2,10 +2,14 @@ from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
-from django.db.models import Avg, JSONField
+from django.db import models, transaction
+from django.db.models import JSONField
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast, NullIf
 from django.utils.translation import gettext_lazy as _
 from jsonschema import FormatChecker
 from jsonschema import ValidationError as JsonValidationError
@@ -16,6 +20,8 @@ from common.models import (
     AbstractComment,
     AbstractRating,
     AbstractTodo,
+    AbstractVersionedModel,
+    HistoricalChangesModel,
     get_sentinel_user,
 )
 from video_requests.schemas import (
@@ -38,12 +44,73 @@ def validate_video_additional_data(value):
         raise ValidationError(e)
 
 
-class AnnotatedManager(models.Manager):
-    def get_queryset(self):
-        return super().get_queryset().annotate(avg_rating=Avg("ratings__rating"))
+class AtomicSaveMixin:
+    """
+    Save the object in a transaction, so the counters of the related objects (which
+    are updated by post_save signals) are saved together with the object.
+    """
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class MaintainedFieldsMixin:
+    """
+    The maintained fields (e.g. counters) are updated in the database by signals and
+    may be outdated in memory, so they are not written by save().
+    """
+
+    MAINTAINED_FIELDS = []
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.name not in self.MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class TrackedFieldsMixin:
+    """
+    Remember the values of the tracked fields when the object is loaded or saved, so
+    the post_save signals can tell whether they were changed. Deferred fields are
+    considered changed as their original value is unknown.
+    """
+
+    TRACKED_FIELDS = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._original_values = self._get_tracked_values()
+
+    def _get_tracked_values(self) -> dict:
+        values = {}
+        for name in self.TRACKED_FIELDS:
+            attname = self._meta.get_field(name).attname
+            if attname in self.__dict__:
+                values[name] = self.__dict__[attname]
+        return values
+
+    def has_changed(self, *fields: str) -> bool:
+        current = self._get_tracked_values()
+        return any(
+            field not in self._original_values
+            or current.get(field, self._original_values[field])
+            != self._original_values[field]
+            for field in fields
+        )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._original_values = self._get_tracked_values()
 
-class Request(models.Model):
+
+class Request(TrackedFieldsMixin, MaintainedFieldsMixin, AbstractVersionedModel):
     class Statuses(models.IntegerChoices):
         DENIED = 0, _("Elutasítva")
         REQUESTED = 1, _("Felkérés")
@@ -87,7 +154,46 @@ class Request(models.Model):
         default=dict,
         blank=True,
     )
-    history = HistoricalRecords()
+    # Maintained by signals of the related models, use the recalculate_request_counters
+    # command to repair them
+    video_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+    open_todo_count = models.PositiveIntegerField(default=0, editable=False)
+    # The full-text search document of the title and the titles of the videos, it is
+    # maintained by signals on PostgreSQL (see update_search_documents)
+    search_text = models.TextField(blank=True, default="", editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # The search fields of the views which can use the search document
+    SEARCH_DOCUMENT_FIELDS = ["title", "videos__title"]
+
+    MAINTAINED_FIELDS = [
+        "video_count",
+        "comment_count",
+        "open_todo_count",
+        "search_text",
+        "search_vector",
+    ]
+
+    history = HistoricalRecords(
+        bases=[HistoricalChangesModel],
+        excluded_fields=["version", "updated", *MAINTAINED_FIELDS],
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="request_search_vector_idx"),
+            GinIndex(
+                OpClass("search_text", name="gin_trgm_ops"),
+                name="request_search_text_idx",
+            ),
+        ]
+
+    TRACKED_FIELDS = ["end_datetime", "responsible", "start_datetime", "title"]
+
+    @property
+    def end_datetime_changed(self) -> bool:
+        return self.has_changed("end_datetime")
 
     @property
     def url(self) -> str:
@@ -107,8 +213,8 @@ class Request(models.Model):
                 {"deadline": [_("Must be later than the end of the event.")]}
             )
 
-    def get_owner(self):
-        return self.requester
+    def get_owner_id(self) -> int:
+        return self.requester_id
 
     def save(self, *args, **kwargs):
         if not self.deadline:
@@ -129,7 +235,9 @@ class CrewMember(models.Model):
         return f"{self.request.title} || {self.member.get_full_name_eastern_order()} - {self.position}"
 
 
-class Video(models.Model):
+class Video(
+    AtomicSaveMixin, TrackedFieldsMixin, MaintainedFieldsMixin, AbstractVersionedModel
+):
     class Statuses(models.IntegerChoices):
         PENDING = 1, _("Vágásra vár")
         IN_PROGRESS = 2, _("Vágás alatt")
@@ -154,13 +262,73 @@ class Video(models.Model):
         default=dict,
         blank=True,
     )
-    history = HistoricalRecords()
-    objects = AnnotatedManager()
+    # Generated from the additional data for filtering and ordering using indexes.
+    # The aired dates are sorted in descending order, so the first one is the last
+    # (it is stored as an ISO date string as casting to date is not immutable).
+    length = models.GeneratedField(
+        expression=Cast(
+            KeyTextTransform("length", "additional_data"), models.FloatField()
+        ),
+        output_field=models.FloatField(null=True),
+        db_persist=True,
+        db_index=True,
+    )
+    last_aired = models.GeneratedField(
+        expression=KeyTextTransform(0, KeyTransform("aired", "additional_data")),
+        output_field=models.CharField(max_length=10, null=True),
+        db_persist=True,
+        db_index=True,
+    )
+    # Maintained by signals of Rating, use the recalculate_video_ratings command to
+    # repair them
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    avg_rating = models.GeneratedField(
+        expression=Cast("rating_sum", models.FloatField()) / NullIf("rating_count", 0),
+        output_field=models.FloatField(null=True),
+        db_persist=True,
+        db_index=True,
+    )
+
+    # The full-text search document of the title, it is maintained by signals on
+    # PostgreSQL (see update_search_documents)
+    search_text = models.TextField(blank=True, default="", editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # The search fields of the views which can use the search document
+    SEARCH_DOCUMENT_FIELDS = ["title"]
+
+    MAINTAINED_FIELDS = ["rating_count", "rating_sum", "search_text", "search_vector"]
+    TRACKED_FIELDS = ["editor", "title"]
+
+    history = HistoricalRecords(
+        bases=[HistoricalChangesModel],
+        excluded_fields=[
+            "version",
+            "updated",
+            "avg_rating",
+            "last_aired",
+            "length",
+            *MAINTAINED_FIELDS,
+        ],
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="video_search_vector_idx"),
+            GinIndex(
+                OpClass("search_text", name="gin_trgm_ops"),
+                name="video_search_text_idx",
+            ),
+        ]
 
     __original_aired = None
 
-    def get_owner(self):
-        return self.request.requester
+    def get_owner_id(self) -> int:
+        # The owner can be annotated by the queryset to avoid loading the request
+        if hasattr(self, "owner_id"):
+            return self.owner_id
+        return self.request.requester_id
 
     @property
     def published_url(self) -> str:
@@ -171,19 +339,23 @@ class Video(models.Model):
         super().__init__(*args, **kwargs)
         self.__original_aired = self.additional_data.get("aired", None)
 
-    def save(self, *args, **kwargs):
-        aired = self.additional_data.get("aired", None)
-        if aired and aired != self.__original_aired:
+    def sort_aired(self) -> None:
+        # The last_aired field is generated from the first aired date
+        if aired := self.additional_data.get("aired", None):
             aired.sort(
                 key=lambda date: datetime.strptime(date, "%Y-%m-%d"), reverse=True
             )
+
+    def save(self, *args, **kwargs):
+        if self.additional_data.get("aired", None) != self.__original_aired:
+            self.sort_aired()
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.request.title} || {self.title}"
 
 
-class Comment(AbstractComment):
+class Comment(AtomicSaveMixin, AbstractComment):
     request = models.ForeignKey(
         Request, on_delete=models.CASCADE, related_name="comments"
     )
@@ -192,14 +364,28 @@ class Comment(AbstractComment):
         return f"{self.request.title} || {self.text} - {self.author.get_full_name_eastern_order()}"
 
 
-class Rating(AbstractRating):
+class Rating(AtomicSaveMixin, AbstractRating):
     video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name="ratings")
 
+    __original_rating = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__original_rating = self.__dict__.get("rating")
+
+    @property
+    def original_rating(self) -> int | None:
+        return self.__original_rating
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.__original_rating = self.rating
+
     def __str__(self):
         return f"{self.video.title} || {self.author.get_full_name_eastern_order()} ({self.rating})"
 
 
-class Todo(AbstractTodo):
+class Todo(AtomicSaveMixin, AbstractTodo):
     class Statuses(models.IntegerChoices):
         OPEN = 1, _("Nyitva")
         CLOSED = 2, _("Lezárva")
@@ -213,5 +399,86 @@ class Todo(AbstractTodo):
         choices=Statuses, default=Statuses.OPEN, db_index=True
     )
 
+    __original_status = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__original_status = self.__dict__.get("status")
+
+    @property
+    def was_open(self) -> bool:
+        return self.__original_status == self.Statuses.OPEN
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.__original_status = self.status
+
     def __str__(self):
         return f"Todo || {self.request.title} - {self.description[0:25]}[...]"
+
+
+class Participation(models.Model):
+    """
+    The work of a user on a request (as the responsible, a crew member or the editor
+    of a video). It is maintained by signals (see update_participations) so the
+    requests a user worked on can be listed and aggregated by date with one index
+    scan, use the update_participations command to rebuild it.
+    """
+
+    class Roles(models.TextChoices):
+        RESPONSIBLE = "responsible", _("Responsible")
+        CREW = "crew", _("Crew")
+        EDITOR = "editor", _("Editor")
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="participations"
+    )
+    request = models.ForeignKey(
+        Request, on_delete=models.CASCADE, related_name="participations"
+    )
+    role = models.CharField(max_length=20, choices=Roles)
+    # The position of the crew member, empty for other roles
+    position = models.CharField(max_length=20, blank=True)
+    # Copied from the request to filter and order without joining it
+    start_datetime = models.DateTimeField()
+    end_datetime = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "start_datetime"])]
+
+    def __str__(self):
+        return f"{self.request.title} || {self.user.get_full_name_eastern_order()} - {self.role}"
+
+
+class MonthlyStatistic(models.Model):
+    """
+    Precomputed statistics of the requests which started in a month (see
+    video_requests.statistics). The key is the status for the number of requests,
+    the user for the edited videos and the crew and 0 otherwise. The total is the
+    sum of the ratings or the hours (of the crew and until the videos were
+    published).
+    """
+
+    class Metrics(models.TextChoices):
+        REQUESTS = "requests", _("Requests")
+        EDITED_VIDEOS = "edited_videos", _("Edited videos")
+        CREW = "crew", _("Crew")
+        RATINGS = "ratings", _("Ratings")
+        TURNAROUND = "turnaround", _("Turnaround")
+
+    month = models.DateField()
+    metric = models.CharField(max_length=20, choices=Metrics)
+    key = models.PositiveIntegerField(default=0)
+    count = models.PositiveIntegerField(default=0)
+    total = models.FloatField(default=0)
+    refreshed = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["month", "metric", "key"], name="unique_monthly_statistic"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} || {self.metric} - {self.key}"
@@ -1,7 +1,198 @@
+from cacheops import invalidate_model
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from simple_history.utils import get_history_manager_for_model
 
-from video_requests.models import Comment, Request
+from video_requests.emails import email_staff_todos_assigned
+from video_requests.models import Comment, CrewMember, Request, Todo, Video
+from video_requests.utilities import (
+    bulk_delete,
+    status_unit_of_work,
+    touch,
+    update_participations,
+    update_request_counters,
+    update_search_documents,
+    update_video_search_documents,
+)
 
 
 def create_comment(*, author: User, text: str, request: Request) -> Comment:
     return Comment.objects.create(author=author, text=text, request=request)
+
+
+def get_changed_fields(update: list[tuple[object, dict]]) -> list[str]:
+    return sorted({field for obj, data in update for field in data})
+
+
+def bulk_write_crew_members(
+    *,
+    request: Request,
+    create: list[dict],
+    update: list[tuple[CrewMember, dict]],
+    delete: list[CrewMember],
+) -> tuple[list[CrewMember], list[CrewMember]]:
+    """
+    Create, update and delete the crew members of the request with bulk operations.
+    Signals are not sent by bulk_create() and bulk_update() (and ignored by
+    bulk_delete()) so the request is touched and its participations are rebuilt only
+    once.
+    """
+    with transaction.atomic():
+        created = CrewMember.objects.bulk_create(
+            [CrewMember(request=request, **data) for data in create]
+        )
+        for crew_member, data in update:
+            for field, value in data.items():
+                setattr(crew_member, field, value)
+        if fields := get_changed_fields(update):
+            CrewMember.objects.bulk_update([obj for obj, data in update], fields)
+        bulk_delete(CrewMember.objects.filter(pk__in=[obj.pk for obj in delete]))
+
+        invalidate_model(CrewMember)
+        touch([request])
+        update_participations(Request.objects.filter(pk=request.pk))
+    return created, [obj for obj, data in update]
+
+
+def bulk_write_videos(
+    *,
+    request: Request,
+    create: list[dict],
+    update: list[tuple[Video, dict]],
+    delete: list[Video],
+) -> tuple[list[Video], list[Video]]:
+    """
+    Create, update and delete the videos of the request with bulk operations. The
+    status of the request and its videos is recalculated once at the end.
+    """
+    with transaction.atomic(), status_unit_of_work() as unit_of_work:
+        created = [Video(request=request, **data) for data in create]
+        # The aired dates are sorted by save() otherwise
+        for video in created:
+            video.sort_aired()
+        created = Video.objects.bulk_create(created)
+        if created:
+            get_history_manager_for_model(Video).bulk_history_create(created)
+            update_request_counters(created[0], video_count=len(created))
+
+        for video, data in update:
+            video.request = request
+            for field, value in data.items():
+                setattr(video, field, value)
+            if "additional_data" in data:
+                video.sort_aired()
+        if fields := get_changed_fields(update):
+            Video.bulk_update_versioned([obj for obj, data in update], fields)
+
+        if delete:
+            # The open todos of the videos are deleted by cascade
+            open_todo_count = Todo.objects.filter(
+                video__in=delete, status=Todo.Statuses.OPEN
+            ).count()
+            bulk_delete(Video.objects.filter(pk__in=[obj.pk for obj in delete]))
+            update_request_counters(
+                delete[0], video_count=-len(delete), open_todo_count=-open_todo_count
+            )
+            unit_of_work.add_request(request)
+
+        written = [*created, *(obj for obj, data in update)]
+        update_video_search_documents(
+            Video.objects.filter(pk__in=[video.pk for video in written])
+        )
+        update_search_documents(Request.objects.filter(pk=request.pk))
+        update_participations(Request.objects.filter(pk=request.pk))
+        for video in written:
+            unit_of_work.add_video(video)
+    return created, [obj for obj, data in update]
+
+
+def bulk_write_todos(
+    *,
+    request: Request,
+    video: Video | None,
+    creator: User,
+    create: list[dict],
+    update: list[tuple[Todo, dict]],
+    delete: list[Todo],
+) -> tuple[list[Todo], list[Todo]]:
+    """
+    Create, update and delete the todos of the request (or video) with bulk
+    operations. The new assignees of every todo are notified with one task.
+    """
+    through = Todo.assignees.through
+    assignments = []
+    with transaction.atomic():
+        created = Todo.objects.bulk_create(
+            [
+                Todo(
+                    creator=creator,
+                    request=request,
+                    video=video,
+                    **{
+                        field: value
+                        for field, value in data.items()
+                        if field != "assignees"
+                    },
+                )
+                for data in create
+            ]
+        )
+        new_assignees = [
+            (todo, {user.pk for user in data.get("assignees", [])})
+            for todo, data in zip(created, create)
+        ]
+
+        now = timezone.now()
+        for todo, data in update:
+            for field, value in data.items():
+                if field != "assignees":
+                    setattr(todo, field, value)
+            # The todo is saved even if only its assignees were changed
+            todo.updated = now
+            if "assignees" in data:
+                current = {user.pk for user in todo.assignees.all()}
+                assignees = {user.pk for user in data["assignees"]}
+                through.objects.filter(
+                    todo=todo, user_id__in=current - assignees
+                ).delete()
+                new_assignees.append((todo, assignees - current))
+        if update:
+            Todo.objects.bulk_update(
+                [obj for obj, data in update],
+                [
+                    "updated",
+                    *(
+                        field
+                        for field in get_changed_fields(update)
+                        if field != "assignees"
+                    ),
+                ],
+            )
+
+        through.objects.bulk_create(
+            [
+                through(todo_id=todo.pk, user_id=user_id)
+                for todo, user_ids in new_assignees
+                for user_id in user_ids
+            ]
+        )
+        assignments = [
+            [todo.pk, sorted(user_ids)] for todo, user_ids in new_assignees if user_ids
+        ]
+
+        # Signals are not sent by bulk_create() and bulk_update()
+        open_todo_count = sum(todo.status == Todo.Statuses.OPEN for todo in created)
+        open_todo_count += sum(
+            int(todo.status == Todo.Statuses.OPEN) - int(todo.was_open)
+            for todo, data in update
+        )
+        open_todo_count -= sum(todo.was_open for todo in delete)
+        if written := [*created, *(obj for obj, data in update), *delete]:
+            update_request_counters(written[0], open_todo_count=open_todo_count)
+        bulk_delete(Todo.objects.filter(pk__in=[obj.pk for obj in delete]))
+        invalidate_model(Todo)
+
+    if assignments:
+        email_staff_todos_assigned.delay(assignments)
+    return created, [obj for obj, data in update]
@@ -1,14 +1,182 @@
-from django.db.models.signals import m2m_changed, post_delete
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from video_requests.emails import email_staff_todo_assigned
-from video_requests.models import Todo, Video
-from video_requests.utilities import update_request_status
+from video_requests.models import Comment, CrewMember, Rating, Request, Todo, Video
+from video_requests.utilities import (
+    is_bulk_delete,
+    schedule_request_status_transition,
+    touch,
+    update_participations,
+    update_request_counters,
+    update_request_status,
+    update_search_documents,
+    update_video_rating,
+    update_video_search_documents,
+)
+
+
+def is_deleted_by_cascade(sender, instance, origin, parent=None) -> bool:
+    # The derived data of the objects being deleted with the instance (e.g. the
+    # counters of its request) must not be updated, the participations of deleted
+    # requests and users are deleted by the database so they must not be rebuilt either.
+    # If the parent is given, only the deletion of the parent model is a cascade (e.g.
+    # the request of a todo is kept when its video is deleted).
+    if origin is None or origin is instance:
+        return False
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if parent is not None:
+        return issubclass(model, parent)
+    return model is not sender
+
+
+@receiver(post_delete, sender=Video)
+def update_request_status_after_video_delete(sender, instance, origin, **kwargs):
+    if not is_bulk_delete() and not is_deleted_by_cascade(sender, instance, origin):
+        update_request_status(instance.request)
+
+
+@receiver(post_save, sender=Video)
+def update_request_counters_after_video_save(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        update_request_counters(instance, video_count=1)
+
+
+@receiver(post_delete, sender=Video)
+def update_request_counters_after_video_delete(sender, instance, origin, **kwargs):
+    if not is_bulk_delete() and not is_deleted_by_cascade(sender, instance, origin):
+        update_request_counters(instance, video_count=-1)
+
+
+@receiver(post_save, sender=Video)
+def update_search_documents_after_video_save(sender, instance, created, raw, **kwargs):
+    if not raw and (created or instance.has_changed("title")):
+        update_video_search_documents(Video.objects.filter(pk=instance.pk))
+        update_search_documents(Request.objects.filter(pk=instance.request_id))
 
 
 @receiver(post_delete, sender=Video)
-def update_request_status_after_video_delete(sender, instance, **kwargs):
-    update_request_status(instance.request)
+def update_search_documents_after_video_delete(sender, instance, origin, **kwargs):
+    if not is_bulk_delete() and not is_deleted_by_cascade(sender, instance, origin):
+        update_search_documents(Request.objects.filter(pk=instance.request_id))
+
+
+@receiver(post_save, sender=Video)
+def update_participations_after_video_save(sender, instance, created, raw, **kwargs):
+    if not raw and (instance.has_changed("editor") or (created and instance.editor_id)):
+        update_participations(Request.objects.filter(pk=instance.request_id))
+
+
+@receiver(post_delete, sender=Video)
+def update_participations_after_video_delete(sender, instance, origin, **kwargs):
+    if (
+        instance.editor_id
+        and not is_bulk_delete()
+        and not is_deleted_by_cascade(sender, instance, origin)
+    ):
+        update_participations(Request.objects.filter(pk=instance.request_id))
+
+
+@receiver(post_save, sender=Comment)
+def update_request_counters_after_comment_save(
+    sender, instance, created, raw, **kwargs
+):
+    if created and not raw:
+        update_request_counters(instance, comment_count=1)
+
+
+@receiver(post_delete, sender=Comment)
+def update_request_counters_after_comment_delete(sender, instance, origin, **kwargs):
+    if not is_deleted_by_cascade(sender, instance, origin):
+        update_request_counters(instance, comment_count=-1)
+
+
+@receiver(post_save, sender=Todo)
+def update_request_counters_after_todo_save(sender, instance, created, raw, **kwargs):
+    if not raw:
+        is_open = instance.status == Todo.Statuses.OPEN
+        was_open = not created and instance.was_open
+        update_request_counters(instance, open_todo_count=int(is_open) - int(was_open))
+
+
+@receiver(post_delete, sender=Todo)
+def update_request_counters_after_todo_delete(sender, instance, origin, **kwargs):
+    if (
+        instance.was_open
+        and not is_bulk_delete()
+        and not is_deleted_by_cascade(sender, instance, origin, parent=Request)
+    ):
+        update_request_counters(instance, open_todo_count=-1)
+
+
+@receiver(post_save, sender=Rating)
+def update_video_rating_after_rating_save(sender, instance, created, raw, **kwargs):
+    if not raw:
+        if created:
+            update_video_rating(instance, rating_count=1, rating_sum=instance.rating)
+        else:
+            update_video_rating(
+                instance,
+                rating_count=0,
+                rating_sum=instance.rating - instance.original_rating,
+            )
+
+
+@receiver(post_delete, sender=Rating)
+def update_video_rating_after_rating_delete(sender, instance, origin, **kwargs):
+    if not is_bulk_delete() and not is_deleted_by_cascade(sender, instance, origin):
+        update_video_rating(
+            instance, rating_count=-1, rating_sum=-instance.original_rating
+        )
+
+
+@receiver(post_save, sender=Request)
+def update_search_document_after_request_save(sender, instance, created, raw, **kwargs):
+    if not raw and (created or instance.has_changed("title")):
+        update_search_documents(Request.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Request)
+def schedule_status_transition_after_request_save(
+    sender, instance, created, raw, **kwargs
+):
+    # The tracked values of objects created with their fields set in __init__ are
+    # the same as the saved ones
+    if not raw and (created or instance.end_datetime_changed):
+        schedule_request_status_transition(instance)
+
+
+@receiver(post_save, sender=Request)
+def update_participations_after_request_save(sender, instance, created, raw, **kwargs):
+    if not raw and (
+        created or instance.has_changed("end_datetime", "responsible", "start_datetime")
+    ):
+        update_participations(Request.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=CrewMember)
+@receiver(post_delete, sender=CrewMember)
+def update_participations_after_crew_change(
+    sender, instance, raw=False, origin=None, **kwargs
+):
+    if (
+        not raw
+        and not is_bulk_delete()
+        and not is_deleted_by_cascade(sender, instance, origin)
+    ):
+        update_participations(Request.objects.filter(pk=instance.request_id))
+
+
+@receiver(post_save, sender=CrewMember)
+@receiver(post_delete, sender=CrewMember)
+def touch_request_after_crew_change(sender, instance, raw=False, origin=None, **kwargs):
+    if (
+        not raw
+        and not is_bulk_delete()
+        and not is_deleted_by_cascade(sender, instance, origin, parent=Request)
+    ):
+        touch([instance.request])
 
 
 def send_notification_to_new_assignees(
@@ -19,4 +187,15 @@ def send_notification_to_new_assignees(
         email_staff_todo_assigned.delay(instance.id, list(pk_set))
 
 
+def touch_todos_after_assignees_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if action in ["post_add", "post_remove", "post_clear"]:
+        if not reverse:
+            touch([instance])
+        elif pk_set:
+            touch(Todo.objects.filter(pk__in=pk_set))
+
+
 m2m_changed.connect(send_notification_to_new_assignees, sender=Todo.assignees.through)
+m2m_changed.connect(touch_todos_after_assignees_change, sender=Todo.assignees.through)
@@ -0,0 +1,188 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+
+from cacheops import invalidate_model
+from django.db import transaction
+from django.db.models import Count, Max, Min, OuterRef, Subquery, Sum
+from django.utils import timezone
+from django.utils.timezone import localtime, make_aware
+
+from video_requests.models import MonthlyStatistic, Participation, Request, Video
+
+# The changes are looked up with an overlap so the rows committed by transactions
+# which were still running during the previous refresh are not missed
+REFRESH_OVERLAP = timedelta(minutes=10)
+
+
+def get_month(value: datetime) -> date:
+    return localtime(value).date().replace(day=1)
+
+
+def get_next_month(month: date) -> date:
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def get_month_range(month: date) -> tuple[datetime, datetime]:
+    return (
+        make_aware(datetime.combine(month, time.min)),
+        make_aware(datetime.combine(get_next_month(month), time.min)),
+    )
+
+
+def get_semester(month: date) -> tuple[str, date, date]:
+    """
+    Return the name, the first and the last day of the semester of the month. The
+    autumn semester lasts from August to January and the spring semester from
+    February to July, they are named like 2023/24/1 and 2023/24/2.
+    """
+    if month.month >= 8:
+        year, number = month.year, 1
+    elif month.month == 1:
+        year, number = month.year - 1, 1
+    else:
+        year, number = month.year - 1, 2
+    if number == 1:
+        start, end = date(year, 8, 1), date(year + 1, 1, 31)
+    else:
+        start, end = date(year + 1, 2, 1), date(year + 1, 7, 31)
+    return f"{year}/{(year + 1) % 100:02d}/{number}", start, end
+
+
+def get_changed_months(since: datetime) -> set[date]:
+    """
+    Return the months of the requests which were created, modified or deleted (or
+    whose crew, videos or ratings were changed) since the given time.
+    """
+    changed_requests = Request.history.filter(history_date__gte=since)
+    changed_videos = Video.history.filter(history_date__gte=since)
+    start_datetimes = [
+        *Request.objects.filter(updated__gte=since).values_list(
+            "start_datetime", flat=True
+        ),
+        *Request.objects.filter(
+            pk__in=Video.objects.filter(updated__gte=since).values("request_id")
+        ).values_list("start_datetime", flat=True),
+        *Request.objects.filter(pk__in=changed_videos.values("request_id")).values_list(
+            "start_datetime", flat=True
+        ),
+        # The earlier start of moved and deleted requests is only in their history
+        *Request.history.filter(id__in=changed_requests.values("id")).values_list(
+            "start_datetime", flat=True
+        ),
+    ]
+    return {get_month(start_datetime) for start_datetime in start_datetimes}
+
+
+def calculate_statistics(month: date, refreshed: datetime) -> list[MonthlyStatistic]:
+    start, end = get_month_range(month)
+    requests = Request.objects.filter(start_datetime__gte=start, start_datetime__lt=end)
+    participations = Participation.objects.filter(
+        start_datetime__gte=start, start_datetime__lt=end
+    )
+    videos = Video.objects.filter(request__in=requests)
+    statistics = []
+
+    def add(metric: str, key: int = 0, count: int = 0, total: float = 0) -> None:
+        if count:
+            statistics.append(
+                MonthlyStatistic(
+                    month=month,
+                    metric=metric,
+                    key=key,
+                    count=count,
+                    total=total,
+                    refreshed=refreshed,
+                )
+            )
+
+    for status, count in (
+        requests.order_by().values_list("status").annotate(count=Count("pk"))
+    ):
+        add(MonthlyStatistic.Metrics.REQUESTS, status, count)
+
+    for user_id, count in (
+        participations.filter(role=Participation.Roles.EDITOR)
+        .order_by()
+        .values_list("user_id")
+        .annotate(count=Count("pk"))
+    ):
+        add(MonthlyStatistic.Metrics.EDITED_VIDEOS, user_id, count)
+
+    # A crew member with more positions worked on the request only once
+    crew = defaultdict(dict)
+    for user_id, request_id, start_datetime, end_datetime in participations.filter(
+        role=Participation.Roles.CREW
+    ).values_list("user_id", "request_id", "start_datetime", "end_datetime"):
+        crew[user_id][request_id] = end_datetime - start_datetime
+    for user_id, durations in crew.items():
+        add(
+            MonthlyStatistic.Metrics.CREW,
+            user_id,
+            len(durations),
+            sum(durations.values(), timedelta()) / timedelta(hours=1),
+        )
+
+    ratings = videos.aggregate(count=Sum("rating_count"), total=Sum("rating_sum"))
+    add(MonthlyStatistic.Metrics.RATINGS, 0, ratings["count"], ratings["total"])
+
+    published_at = Subquery(
+        Video.history.filter(id=OuterRef("pk"), status__gte=Video.Statuses.PUBLISHED)
+        .order_by()
+        .values("id")
+        .annotate(published=Min("history_date"))
+        .values("published")
+    )
+    turnarounds = [
+        published - end_datetime
+        for published, end_datetime in videos.filter(
+            status__gte=Video.Statuses.PUBLISHED
+        )
+        .annotate(published=published_at)
+        .filter(published__isnull=False)
+        .values_list("published", "request__end_datetime")
+    ]
+    add(
+        MonthlyStatistic.Metrics.TURNAROUND,
+        0,
+        len(turnarounds),
+        sum(turnarounds, timedelta()) / timedelta(hours=1),
+    )
+    return statistics
+
+
+def refresh_statistics(months: Iterable[date]) -> int:
+    """Recalculate the statistics of the months and return their number."""
+    refreshed, months = timezone.now(), sorted(set(months))
+    with transaction.atomic():
+        for month in months:
+            MonthlyStatistic.objects.filter(month=month).delete()
+            MonthlyStatistic.objects.bulk_create(calculate_statistics(month, refreshed))
+    # Bulk operations are not invalidated by cacheops automatically
+    invalidate_model(MonthlyStatistic)
+    return len(months)
+
+
+def update_statistics(full: bool = False) -> int:
+    """
+    Recalculate the statistics of the months which were changed since the previous
+    refresh (or all of them) and return the number of refreshed months.
+    """
+    since = (
+        None
+        if full
+        else MonthlyStatistic.objects.aggregate(refreshed=Max("refreshed"))["refreshed"]
+    )
+    if since is None:
+        months = {
+            get_month(start_datetime)
+            for start_datetime in Request.objects.values_list(
+                "start_datetime", flat=True
+            )
+        }
+        months.update(
+            MonthlyStatistic.objects.values_list("month", flat=True).distinct()
+        )
+    else:
+        months = get_changed_months(since - REFRESH_OVERLAP)
+    return refresh_statistics(months)
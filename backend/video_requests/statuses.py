@@ -0,0 +1,284 @@
+"""
+Status derivation of requests and videos.
+
+Nothing in this module touches the database or dispatches tasks. The functions work on
+plain snapshots and return the target statuses together with the side effects which
+should be carried out by the caller after the statuses are saved.
+"""
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from video_requests.models import Request, Video
+
+
+@dataclass(frozen=True)
+class VideoSnapshot:
+    id: int
+    status: int
+    additional_data: dict
+    has_editor: bool
+
+
+@dataclass(frozen=True)
+class RequestSnapshot:
+    id: int
+    status: int
+    additional_data: dict
+    end_datetime: datetime
+    requester_is_staff: bool
+    videos: tuple[VideoSnapshot, ...] = ()
+
+
+@dataclass(frozen=True)
+class NotifySchEvents:
+    """The SCH event management system should be notified about the decision."""
+
+    request_id: int
+
+
+@dataclass(frozen=True)
+class VideoPublished:
+    """The video was published, it should be shared and the requester notified."""
+
+    request_id: int
+    video_id: int
+    notify_requester: bool
+
+
+@dataclass
+class StatusResult:
+    request_id: int
+    original_request_status: int
+    request_status: int
+    original_video_statuses: dict[int, int]
+    video_statuses: dict[int, int]
+    side_effects: list[NotifySchEvents | VideoPublished] = field(default_factory=list)
+
+    @property
+    def request_changed(self) -> bool:
+        return self.request_status != self.original_request_status
+
+    @property
+    def changed_videos(self) -> dict[int, int]:
+        return {
+            video_id: status
+            for video_id, status in self.video_statuses.items()
+            if status != self.original_video_statuses[video_id]
+        }
+
+
+def is_set_by_admin(additional_data: dict) -> bool:
+    return bool(additional_data.get("status_by_admin", {}).get("status"))
+
+
+def derive_video_status(video: VideoSnapshot, request_status: int) -> tuple[int, bool]:
+    """
+    Return the status of the video and whether it has reached the published state
+    following the normal flow (a status set by admin never counts as published).
+    """
+    additional_data = video.additional_data
+
+    # Check if the status is set by admin (overwrites everything)
+    if is_set_by_admin(additional_data):
+        return additional_data["status_by_admin"]["status"], False
+
+    # If the event was recorded and the video has an editor
+    status = Video.Statuses.PENDING
+    if request_status >= Request.Statuses.UPLOADED and video.has_editor:
+        status = Video.Statuses.IN_PROGRESS
+
+    # Check if the editing_done field is True
+    if (
+        status == Video.Statuses.IN_PROGRESS
+        and additional_data.get("editing_done") is True
+    ):
+        status = Video.Statuses.EDITED
+
+    # Check if the video is coded on the website
+    if (
+        status == Video.Statuses.EDITED
+        and additional_data.get("coding", {}).get("website") is True
+    ):
+        status = Video.Statuses.CODED
+
+    # Check if the video is published on the website
+    if status == Video.Statuses.CODED and additional_data.get("publishing", {}).get(
+        "website"
+    ):
+        status = Video.Statuses.PUBLISHED
+
+    # Check if the HQ export has been moved to its place
+    if (
+        status == Video.Statuses.PUBLISHED
+        and additional_data.get("archiving", {}).get("hq_archive") is True
+    ):
+        status = Video.Statuses.DONE
+
+    return status, status >= Video.Statuses.PUBLISHED
+
+
+def is_sch_events_notification_needed(
+    request: RequestSnapshot, accepted_status: int
+) -> bool:
+    return bool(
+        request.additional_data.get("external", {}).get("sch_events_callback_url")
+    ) and (
+        request.status == Request.Statuses.REQUESTED
+        or (
+            request.status == Request.Statuses.DENIED
+            and accepted_status == Request.Statuses.ACCEPTED
+        )
+        or (
+            request.status >= Request.Statuses.ACCEPTED
+            and accepted_status == Request.Statuses.DENIED
+        )
+    )
+
+
+def derive_post_production_status(
+    status: int, request: RequestSnapshot, video_statuses: dict[int, int]
+) -> int:
+    additional_data = request.additional_data
+
+    # If all videos are edited set the request status
+    if (
+        status == Request.Statuses.UPLOADED
+        and request.videos
+        and all(
+            video_statuses[video.id] >= Video.Statuses.EDITED
+            for video in request.videos
+        )
+    ):
+        status = Request.Statuses.EDITED
+
+    # If all videos are done and the recording is copied to Google Drive set the status
+    if (
+        status == Request.Statuses.EDITED
+        and all(
+            video_statuses[video.id] == Video.Statuses.DONE for video in request.videos
+        )
+        and additional_data["recording"].get("copied_to_gdrive") is True
+    ):
+        status = Request.Statuses.ARCHIVED
+
+    # If the recording is removed set the status
+    if (
+        status == Request.Statuses.ARCHIVED
+        and additional_data["recording"].get("removed") is True
+    ):
+        status = Request.Statuses.DONE
+
+    return status
+
+
+def derive_statuses(
+    request: RequestSnapshot,
+    now: datetime,
+    changed_video_ids: Collection[int] = (),
+) -> StatusResult:
+    """
+    Calculate the status of the request and its videos.
+
+    When changed_video_ids is empty the request itself was modified, so every video is
+    derived again from the new status of the request. Otherwise only the listed videos
+    were modified: they are derived from the current status of the request first and
+    the other videos are only updated if the request reaches the uploaded state.
+    """
+    additional_data = request.additional_data
+    video_statuses = {video.id: video.status for video in request.videos}
+    side_effects = []
+
+    def apply(video: VideoSnapshot, request_status: int) -> None:
+        status, published = derive_video_status(video, request_status)
+        if published and video_statuses[video.id] < Video.Statuses.PUBLISHED:
+            side_effects.append(
+                VideoPublished(
+                    request_id=request.id,
+                    video_id=video.id,
+                    notify_requester=not (
+                        video.additional_data["publishing"].get(
+                            "email_sent_to_user", False
+                        )
+                        or request.requester_is_staff
+                    ),
+                )
+            )
+        video_statuses[video.id] = status
+
+    for video in request.videos:
+        if video.id in changed_video_ids:
+            apply(video, request.status)
+
+    # Check if the status is set by admin (overwrites everything)
+    if is_set_by_admin(additional_data):
+        status = additional_data["status_by_admin"]["status"]
+
+    # If status is not set by admin follow the flow and check if all required data are provided.
+    else:
+        status = Request.Statuses.REQUESTED
+
+        # Check if request is accepted else consider as denied
+        if "accepted" in additional_data:
+            status = (
+                Request.Statuses.ACCEPTED
+                if additional_data["accepted"] is True
+                else Request.Statuses.DENIED
+            )
+            if is_sch_events_notification_needed(request, status):
+                side_effects.append(NotifySchEvents(request_id=request.id))
+
+        # If the request is accepted but canceled by requester set the status
+        if (
+            Request.Statuses.ACCEPTED <= status <= Request.Statuses.DONE
+            and additional_data.get("canceled") is True
+        ):
+            status = Request.Statuses.CANCELED
+
+        # If the request is accepted, but we failed to record it set the status
+        if (
+            Request.Statuses.ACCEPTED <= status <= Request.Statuses.DONE
+            and additional_data.get("failed") is True
+        ):
+            status = Request.Statuses.FAILED
+
+        # If the status is not canceled or failed and the request is accepted check if the end date is earlier than now
+        if (
+            Request.Statuses.ACCEPTED <= status <= Request.Statuses.DONE
+            and request.end_datetime < now
+        ):
+            status = Request.Statuses.RECORDED
+
+        # If path in recording is specified consider as successful recording and update video status
+        if status == Request.Statuses.RECORDED and additional_data.get(
+            "recording", {}
+        ).get("path"):
+            status = Request.Statuses.UPLOADED
+            for video in request.videos:
+                apply(video, max(request.status, status))
+
+        status = derive_post_production_status(status, request, video_statuses)
+
+    if not changed_video_ids:
+        for video in request.videos:
+            apply(video, status)
+
+    return StatusResult(
+        request_id=request.id,
+        original_request_status=request.status,
+        request_status=status,
+        original_video_statuses={video.id: video.status for video in request.videos},
+        video_statuses=video_statuses,
+        side_effects=side_effects,
+    )
+
+
+def evaluate(
+    requests: Iterable[RequestSnapshot],
+    now: datetime,
+    changed_video_ids: Collection[int] = (),
+) -> list[StatusResult]:
+    """Derive the statuses of many requests at once using the same point in time."""
+    changed_video_ids = frozenset(changed_video_ids)
+    return [derive_statuses(request, now, changed_video_ids) for request in requests]
@@ -1,8 +1,12 @@
-from datetime import timedelta
+from datetime import date, timedelta
+from io import StringIO
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from tests.helpers.users_test_utils import create_user
 from tests.helpers.video_requests_test_utils import (
@@ -13,6 +17,8 @@ from tests.helpers.video_requests_test_utils import (
     create_todo,
     create_video,
 )
+from video_requests.models import Comment, Request, Todo, Video
+from video_requests.utilities import update_request_status
 
 
 class VideoRequestsTestCase(TestCase):
@@ -126,3 +132,151 @@ class VideoRequestsTestCase(TestCase):
             "Additional properties are not allowed ('randomKey' was unexpected)",
             context.exception.messages[0],
         )
+
+    def test_video_save_increments_version(self):
+        version = self.video.version
+        self.video.save()
+        self.video.save(update_fields=["title"])
+        self.assertEqual(self.video.version, version + 2)
+        self.assertEqual(Video.objects.get(pk=self.video.pk).version, version + 2)
+
+    def test_video_compare_and_swap_detects_concurrent_save(self):
+        stale_video = Video.objects.get(pk=self.video.pk)
+        self.video.save()
+
+        stale_video.title = "Stale title"
+        self.assertFalse(stale_video.compare_and_swap(["title"]))
+        self.video.title = "New title"
+        self.assertTrue(self.video.compare_and_swap(["title"]))
+        self.assertEqual(Video.objects.get(pk=self.video.pk).title, "New title")
+
+    def test_video_update_with_retry_repeats_the_change(self):
+        def change(video):
+            if not calls:
+                # Simulate another worker saving the video meanwhile
+                Video.objects.get(pk=video.pk).save()
+            calls.append(video.version)
+            video.additional_data["editing_done"] = True
+
+        calls = []
+        video = Video.update_with_retry(self.video.pk, change, ["additional_data"])
+
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(video.additional_data["editing_done"])
+        self.assertEqual(self.video.history.count(), 3)
+
+    def test_stale_status_is_derived_again(self):
+        self.request.additional_data = {"accepted": True}
+        self.request.save()
+        stale_request = Request.objects.get(pk=self.request.pk)
+        self.request.additional_data = {"accepted": False}
+        self.request.save()
+
+        update_request_status(stale_request)
+
+        self.request.refresh_from_db()
+        self.assertEqual(self.request.status, Request.Statuses.DENIED)
+
+    def test_request_counters_are_maintained(self):
+        self.request.refresh_from_db()
+        self.assertEqual(
+            (
+                self.request.video_count,
+                self.request.comment_count,
+                self.request.open_todo_count,
+            ),
+            (1, 1, 1),
+        )
+
+        stale_request = Request.objects.get(pk=self.request.pk)
+        create_video(301, self.request)
+        self.comment.delete()
+        self.todo.status = Todo.Statuses.CLOSED
+        self.todo.save()
+        # Saving a stale request object does not overwrite the counters
+        stale_request.save()
+
+        self.request.refresh_from_db()
+        self.assertEqual(
+            (
+                self.request.video_count,
+                self.request.comment_count,
+                self.request.open_todo_count,
+            ),
+            (2, 0, 0),
+        )
+
+    def test_request_counters_are_updated_in_memory(self):
+        request = Request.objects.get(pk=self.request.pk)
+        comment = Comment(author=self.comment.author, request=request, text="Test")
+        # Only the comment and the counters are written, the loaded request is
+        # updated and invalidated without loading it again
+        with CaptureQueriesContext(connection) as queries:
+            comment.save()
+        self.assertFalse(
+            any(query["sql"].startswith("SELECT") for query in queries.captured_queries)
+        )
+        self.assertEqual(request.comment_count, 2)
+
+        request.refresh_from_db()
+        self.assertEqual(request.comment_count, 2)
+
+    def test_recalculate_request_counters(self):
+        Request.objects.update(video_count=5, comment_count=5, open_todo_count=5)
+
+        out = StringIO()
+        call_command("recalculate_request_counters", stdout=out)
+        self.assertIn("Counters of 1 requests were recalculated.", out.getvalue())
+
+        self.request.refresh_from_db()
+        self.assertEqual(
+            (
+                self.request.video_count,
+                self.request.comment_count,
+                self.request.open_todo_count,
+            ),
+            (1, 1, 1),
+        )
+
+    def test_video_rating_aggregate_is_maintained(self):
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.rating_count, 1)
+        self.assertEqual(self.video.avg_rating, self.rating.rating)
+
+        create_rating(501, self.video, create_user(), 5)
+        self.rating.rating = 2
+        self.rating.save()
+        self.video.refresh_from_db()
+        self.assertEqual((self.video.rating_count, self.video.avg_rating), (2, 3.5))
+
+        self.rating.delete()
+        self.video.save()
+        self.video.refresh_from_db()
+        self.assertEqual((self.video.rating_count, self.video.avg_rating), (1, 5.0))
+
+    def test_recalculate_video_ratings(self):
+        Video.objects.update(rating_count=0, rating_sum=0)
+
+        out = StringIO()
+        call_command("recalculate_video_ratings", stdout=out)
+        self.assertIn("Ratings of 1 videos were recalculated.", out.getvalue())
+
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.rating_count, 1)
+        self.assertEqual(self.video.avg_rating, self.rating.rating)
+
+    def test_video_length_and_last_aired_are_generated(self):
+        self.video.additional_data = {
+            "aired": ["2023-01-15", "2023-03-01"],
+            "length": 125,
+        }
+        self.video.save()
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.length, 125)
+        self.assertEqual(self.video.last_aired, "2023-03-01")
+        self.assertTrue(
+            Video.objects.filter(
+                last_aired__lte=date(2023, 3, 1), length__lt=130
+            ).exists()
+        )
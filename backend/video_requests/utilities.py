@@ -1,230 +1,512 @@
 import json
-from datetime import timedelta
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 
 import requests
+from cacheops import invalidate_model, invalidate_obj
 from celery import shared_task
 from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, transaction
+from django.db.models import (
+    Count,
+    F,
+    OuterRef,
+    QuerySet,
+    StringAgg,
+    Subquery,
+    Sum,
+    Value,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Coalesce, Concat, Lower
+from django.utils import timezone
 from django.utils.timezone import localtime
 from requests import RequestException
 
-from common.models import get_system_user
+from common.models import VersionConflict, get_system_user
+from common.search import SEARCH_CONFIG, Unaccent
 from common.utilities import get_pr_responsible
 from video_requests.emails import email_user_video_published
-from video_requests.models import Request, Todo, Video
+from video_requests.models import (
+    Comment,
+    CrewMember,
+    Participation,
+    Rating,
+    Request,
+    Todo,
+    Video,
+)
+from video_requests.statuses import (
+    NotifySchEvents,
+    RequestSnapshot,
+    StatusResult,
+    VideoPublished,
+    VideoSnapshot,
+    derive_statuses,
+    evaluate,
+)
 
 
-def update_request_status(request: Request, called_from_video: bool = False) -> None:
-    # Check if the status is set by admin (overwrites everything)
-    if (
-        "status_by_admin" in request.additional_data
-        and "status" in request.additional_data["status_by_admin"]
-        and request.additional_data["status_by_admin"].get("status")
-    ):
-        request.status = request.additional_data["status_by_admin"]["status"]
+def get_request_snapshot(request: Request, videos: Iterable[Video]) -> RequestSnapshot:
+    return RequestSnapshot(
+        id=request.id,
+        status=request.status,
+        additional_data=request.additional_data,
+        end_datetime=request.end_datetime,
+        requester_is_staff=request.requester.is_staff,
+        videos=tuple(get_video_snapshot(video) for video in videos),
+    )
 
-    # If status is not set by admin follow the flow and check if all required data are provided.
-    else:
-        # Incrementing this status variable if the required part is correct.
-        status = Request.Statuses.REQUESTED
-
-        # Check if request is accepted else consider as denied
-        if "accepted" in request.additional_data:
-            status = (
-                Request.Statuses.ACCEPTED
-                if request.additional_data["accepted"] is True
-                else Request.Statuses.DENIED
+
+def get_video_snapshot(video: Video) -> VideoSnapshot:
+    return VideoSnapshot(
+        id=video.id,
+        status=video.status,
+        additional_data=video.additional_data,
+        has_editor=video.editor_id is not None,
+    )
+
+
+_status_unit_of_work = ContextVar("status_unit_of_work", default=None)
+
+
+class StatusUnitOfWork:
+    """
+    Collects the requests and videos modified during a write so the status of every
+    affected request is recalculated only once and the changes are saved together.
+    """
+
+    def __init__(self):
+        self.requests: dict[int, Request] = {}
+        self.videos: dict[int, Video] = {}
+
+    def add_request(self, request: Request) -> None:
+        self.requests[request.id] = request
+
+    def add_video(self, video: Video) -> None:
+        self.videos[video.id] = video
+
+    def flush(self) -> None:
+        requests = dict(self.requests)
+        for video in self.videos.values():
+            requests.setdefault(video.request_id, video.request)
+        if not requests:
+            return
+
+        prefetch_related_objects(list(requests.values()), "requester", "videos")
+        now = localtime()
+        results, videos = [], []
+        for request in requests.values():
+            request_videos = [
+                self.videos.get(video.id, video) for video in request.videos.all()
+            ]
+            # If the request itself is dirty all of its videos are derived again
+            changed_video_ids = (
+                ()
+                if request.id in self.requests
+                else {video.id for video in request_videos if video.id in self.videos}
             )
-            if request.additional_data.get("external", {}).get(
-                "sch_events_callback_url"
-            ) and (
-                request.status == Request.Statuses.REQUESTED
-                or (
-                    request.status == Request.Statuses.DENIED
-                    and status == Request.Statuses.ACCEPTED
-                )
-                or (
-                    request.status >= Request.Statuses.ACCEPTED
-                    and status == Request.Statuses.DENIED
+            results.append(
+                derive_statuses(
+                    get_request_snapshot(request, request_videos),
+                    now,
+                    changed_video_ids,
                 )
-            ):
-                notify_sch_event_management_system.delay(request.id)
-
-        # If the request is accepted but canceled by requester set the status
-        if (
-            Request.Statuses.ACCEPTED <= status <= Request.Statuses.DONE
-            and "canceled" in request.additional_data
-        ):
-            status = (
-                Request.Statuses.CANCELED
-                if request.additional_data["canceled"] is True
-                else status
             )
+            videos.extend(request_videos)
 
-        # If the request is accepted, but we failed to record it set the status
-        if (
-            Request.Statuses.ACCEPTED <= status <= Request.Statuses.DONE
-            and "failed" in request.additional_data
-        ):
-            status = (
-                Request.Statuses.FAILED
-                if request.additional_data["failed"] is True
-                else status
-            )
+        self.requests.clear()
+        self.videos.clear()
+        save_status_results(results, requests.values(), videos)
 
-        # If the status is not canceled or failed and the request is accepted check if the end date is earlier than now
-        if (
-            Request.Statuses.ACCEPTED <= status <= Request.Statuses.DONE
-            and request.end_datetime < localtime()
-        ):
-            status = Request.Statuses.RECORDED
-
-        # If path in recording is specified consider as successful recording and update video status
-        if status == Request.Statuses.RECORDED and request.additional_data.get(
-            "recording", {}
-        ).get("path"):
-            status = Request.Statuses.UPLOADED
-            for video in request.videos.all():
-                update_video_status(video, True, status)
-
-        # If all videos are edited set the request status
-        if (
-            status == Request.Statuses.UPLOADED
-            and request.videos.exists()
-            and all(
-                video.status >= Video.Statuses.EDITED for video in request.videos.all()
-            )
-        ):
-            status = Request.Statuses.EDITED
-
-        # If all videos are done and the recording is copied to Google Drive set the status
-        if (
-            status == Request.Statuses.EDITED
-            and all(
-                video.status == Video.Statuses.DONE for video in request.videos.all()
-            )
-            and "copied_to_gdrive" in request.additional_data["recording"]
-        ):
-            status = (
-                Request.Statuses.ARCHIVED
-                if request.additional_data["recording"]["copied_to_gdrive"] is True
-                else status
-            )
 
-        # If the recording is removed set the status
-        if (
-            status == Request.Statuses.ARCHIVED
-            and "removed" in request.additional_data["recording"]
-        ):
-            status = (
-                Request.Statuses.DONE
-                if request.additional_data["recording"]["removed"] is True
-                else status
-            )
+@contextmanager
+def status_unit_of_work() -> Iterator[StatusUnitOfWork]:
+    """
+    Defer the status updates until the end of the block. Nested blocks join the
+    outermost one and nothing is saved if an exception is raised. The side effects
+    of the changes are dispatched once the transaction the block is closed in is
+    committed (see save_status_results).
+    """
+    unit_of_work = _status_unit_of_work.get()
+    if unit_of_work is not None:
+        yield unit_of_work
+        return
+
+    unit_of_work = StatusUnitOfWork()
+    token = _status_unit_of_work.set(unit_of_work)
+    try:
+        yield unit_of_work
+    finally:
+        _status_unit_of_work.reset(token)
+    unit_of_work.flush()
 
-        # Set the request status to the final score
-        request.status = status
 
-    request.save()
-    if not called_from_video:
-        for video in request.videos.all():
-            update_video_status(video, True)
+def update_request_status(request: Request) -> None:
+    """Recalculate and save the status of the request and all of its videos."""
+    with status_unit_of_work() as unit_of_work:
+        unit_of_work.add_request(request)
 
 
-def update_video_status(
-    video: Video, called_from_request: bool = False, request_status: int = 1
+def update_video_status(video: Video) -> None:
+    """Recalculate and save the status of the video and the request it belongs to."""
+    with status_unit_of_work() as unit_of_work:
+        unit_of_work.add_video(video)
+
+
+def bulk_update_request_status(requests: QuerySet[Request]) -> list[Request]:
+    """
+    Recalculate the status of every request in the queryset and all of their videos.
+    Requests and videos are loaded in a fixed number of queries and the new statuses are
+    derived in memory in one pass.
+    """
+    requests = list(requests.select_related("requester").prefetch_related("videos"))
+    videos = [video for request in requests for video in request.videos.all()]
+    results = evaluate(
+        (get_request_snapshot(request, request.videos.all()) for request in requests),
+        localtime(),
+    )
+    save_status_results(results, requests, videos)
+    return requests
+
+
+def save_status_results(
+    results: Iterable[StatusResult],
+    requests: Iterable[Request],
+    videos: Iterable[Video],
 ) -> None:
-    # Check if the status is set by admin (overwrites everything)
-    if (
-        "status_by_admin" in video.additional_data
-        and "status" in video.additional_data["status_by_admin"]
-        and video.additional_data["status_by_admin"].get("status")
-    ):
-        video.status = video.additional_data["status_by_admin"]["status"]
-
-    # If status is not set by admin follow the flow and check if all required data are provided.
-    else:
-        # Incrementing this status variable if the required part is correct.
-        status = Video.Statuses.PENDING
-
-        # If the event was recorded and the video has an editor
-        if (
-            max(video.request.status, request_status) >= Request.Statuses.UPLOADED
-            and video.editor
-        ):
-            status = Video.Statuses.IN_PROGRESS
-
-        # Check if the editing_done field is True
-        if (
-            status == Video.Statuses.IN_PROGRESS
-            and "editing_done" in video.additional_data
-        ):
-            status = (
-                Video.Statuses.EDITED
-                if video.additional_data["editing_done"] is True
-                else status
+    """
+    Write the derived statuses to the given objects and save only the changed rows
+    (with history). If a request or one of its videos was modified since it was
+    loaded, its statuses are derived again from the current data. Side effects are
+    dispatched once the outermost transaction is committed (and never if it is rolled
+    back).
+    """
+    results = list(results)
+    requests = {request.id: request for request in requests}
+    videos = {video.id: video for video in videos}
+    side_effects = []
+
+    for _ in range(Request.MAX_RETRIES):
+        with transaction.atomic():
+            stale = Request.lock_stale(list(requests.values()))
+            stale.update(
+                videos[video_id].request_id
+                for video_id in Video.lock_stale(list(videos.values()))
             )
 
-        # Check if the video is coded on the website
-        if (
-            status == Video.Statuses.EDITED
-            and "coding" in video.additional_data
-            and "website" in video.additional_data["coding"]
-        ):
-            status = (
-                Video.Statuses.CODED
-                if video.additional_data["coding"]["website"] is True
-                else status
-            )
+            changed_requests, changed_videos = [], []
+            for result in results:
+                if result.request_id in stale:
+                    continue
+                if result.request_changed:
+                    request = requests[result.request_id]
+                    request.status = result.request_status
+                    changed_requests.append(request)
+                for video_id, status in result.changed_videos.items():
+                    video = videos[video_id]
+                    video.status = status
+                    changed_videos.append(video)
+                side_effects.extend(result.side_effects)
+
+            Request.bulk_update_versioned(changed_requests, ["status"])
+            Video.bulk_update_versioned(changed_videos, ["status"])
+
+        if not stale:
+            break
+
+        requests = {
+            request.id: request
+            for request in Request.objects.filter(pk__in=stale)
+            .select_related("requester")
+            .prefetch_related("videos")
+        }
+        videos = {
+            video.id: video
+            for request in requests.values()
+            for video in request.videos.all()
+        }
+        results = evaluate(
+            (
+                get_request_snapshot(request, request.videos.all())
+                for request in requests.values()
+            ),
+            localtime(),
+        )
+    else:
+        raise VersionConflict("The status of the requests could not be saved.")
 
-        # Check if the video is published on the website
-        if status == Video.Statuses.CODED and video.additional_data.get(
-            "publishing", {}
-        ).get("website"):
-            status = Video.Statuses.PUBLISHED
-
-            # If the current status of the video is before published
-            if video.status < Video.Statuses.PUBLISHED:
-                # Check if there is a task or create one to share on social platforms
-                if not Todo.objects.filter(
-                    creator=get_system_user(), video=video
-                ).exists():
-                    todo = Todo.objects.create(
-                        creator=get_system_user(),
-                        description="Megosztás közösségi platformokon",
-                        request=video.request,
-                        video=video,
-                    )
-                    todo.assignees.set(get_pr_responsible())
-                    todo.save()
-                # Check if requester was already notified or send an e-mail to watch and rate us
-                if (
-                    not video.additional_data["publishing"].get(
-                        "email_sent_to_user", False
-                    )
-                    and not video.request.requester.is_staff
-                ):
-                    email_user_video_published.delay(video.id)
-
-        # Check if the HQ export has been moved to its place
-        if (
-            status == Video.Statuses.PUBLISHED
-            and "archiving" in video.additional_data
-            and "hq_archive" in video.additional_data["archiving"]
-        ):
-            status = (
-                Video.Statuses.DONE
-                if video.additional_data["archiving"]["hq_archive"] is True
-                else status
-            )
+    if side_effects:
+        transaction.on_commit(lambda: dispatch_side_effects(side_effects))
 
-        # Set the video status to the final score
-        video.refresh_from_db()  # update object from DB because async task might have changed additional_data
-        video.status = status
 
-    # Save the status and update the status of the request as well
-    video.save()
-    if not called_from_request:
-        update_request_status(video.request, True)
+def dispatch_side_effects(
+    side_effects: Iterable[NotifySchEvents | VideoPublished],
+) -> None:
+    """Carry out the side effects returned by the status derivation."""
+    published = []
+    for side_effect in side_effects:
+        if isinstance(side_effect, NotifySchEvents):
+            notify_sch_event_management_system.delay(side_effect.request_id)
+        elif isinstance(side_effect, VideoPublished):
+            published.append(side_effect)
+
+    if not published:
+        return
+
+    # Check if there is a task or create one to share on social platforms
+    with transaction.atomic():
+        system_user = get_system_user()
+        videos_with_todo = set(
+            Todo.objects.filter(
+                creator=system_user, video__in=[event.video_id for event in published]
+            ).values_list("video_id", flat=True)
+        )
+        todos = Todo.objects.bulk_create(
+            [
+                Todo(
+                    creator=system_user,
+                    description="Megosztás közösségi platformokon",
+                    request_id=event.request_id,
+                    video_id=event.video_id,
+                )
+                for event in published
+                if event.video_id not in videos_with_todo
+            ]
+        )
+        if todos:
+            pr_responsible = list(get_pr_responsible())
+            for todo in todos:
+                todo.assignees.set(pr_responsible)
+                # Signals are not sent by bulk_create()
+                update_request_counters(todo, open_todo_count=1)
+
+    # Send an e-mail to the requester to watch and rate us if not notified yet
+    for event in published:
+        if event.notify_requester:
+            email_user_video_published.delay(event.video_id)
+
+
+def update_counters(obj, related_name: str, **changes: int) -> None:
+    """
+    Add the changes to the counters of the related object (e.g. the request of a
+    video). The counters are incremented in the database so concurrent writes do not
+    overwrite each other.
+    """
+    changes = {counter: change for counter, change in changes.items() if change}
+    if not changes:
+        return
+    field = obj._meta.get_field(related_name)
+    model, pk = field.related_model, getattr(obj, field.attname)
+    # The related object is kept up to date in memory (e.g. for the response) and
+    # invalidated from it, so it is only loaded if it was not loaded with the object
+    if field.is_cached(obj):
+        related = getattr(obj, related_name)
+    elif related := model._base_manager.filter(pk=pk).first():
+        field.set_cached_value(obj, related)
+    now = timezone.now()
+    model._base_manager.filter(pk=pk).update(
+        updated=now,
+        **{counter: F(counter) + change for counter, change in changes.items()},
+    )
+    if related is not None:
+        related.updated = now
+        for counter, change in changes.items():
+            setattr(related, counter, getattr(related, counter) + change)
+        # Queryset updates are not invalidated by cacheops automatically
+        invalidate_obj(related)
+
+
+def touch(objs: Iterable) -> None:
+    """
+    Set the modification time of the objects to now (e.g. if only their relations
+    were changed) so the conditional requests do not return a stale response. The
+    objects are invalidated from memory, so a queryset is only fetched once.
+    """
+    objs = list(objs)
+    if not objs:
+        return
+    now = timezone.now()
+    type(objs[0])._base_manager.filter(pk__in=[obj.pk for obj in objs]).update(
+        updated=now
+    )
+    for obj in objs:
+        obj.updated = now
+        # Queryset updates are not invalidated by cacheops automatically
+        invalidate_obj(obj)
+
+
+_bulk_delete = ContextVar("bulk_delete", default=False)
+
+
+def bulk_delete(queryset: QuerySet) -> None:
+    """
+    Delete the objects (and the ones deleted by cascade) without updating the
+    counters and derived data of the related objects in the post_delete signals of
+    every object, the caller must update them only once.
+    """
+    token = _bulk_delete.set(True)
+    try:
+        queryset.delete()
+    finally:
+        _bulk_delete.reset(token)
+
+
+def is_bulk_delete() -> bool:
+    return _bulk_delete.get()
+
+
+def update_request_counters(obj: Video | Comment | Todo, **changes: int) -> None:
+    update_counters(obj, "request", **changes)
+
+
+def update_video_rating(rating: Rating, rating_count: int, rating_sum: int) -> None:
+    update_counters(rating, "video", rating_count=rating_count, rating_sum=rating_sum)
+
+
+def aggregate_per_object(queryset: QuerySet, related_name: str, aggregate) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{related_name: OuterRef("pk")})
+            .order_by()
+            .values(related_name)
+            .annotate(value=aggregate)
+            .values("value")
+        ),
+        0,
+    )
+
+
+def recalculate_request_counters(requests: QuerySet[Request]) -> int:
+    """
+    Recalculate the number of videos, comments and open todos of every request in the
+    queryset in one query and return the number of updated requests.
+    """
+    updated = requests.update(
+        video_count=aggregate_per_object(Video.objects.all(), "request", Count("pk")),
+        comment_count=aggregate_per_object(
+            Comment.objects.all(), "request", Count("pk")
+        ),
+        open_todo_count=aggregate_per_object(
+            Todo.objects.filter(status=Todo.Statuses.OPEN), "request", Count("pk")
+        ),
+    )
+    invalidate_model(Request)
+    return updated
+
+
+def recalculate_video_ratings(videos: QuerySet[Video]) -> int:
+    """
+    Recalculate the number and the sum of the ratings (and so the average rating) of
+    every video in the queryset in one query and return the number of updated videos.
+    """
+    updated = videos.update(
+        rating_count=aggregate_per_object(Rating.objects.all(), "video", Count("pk")),
+        rating_sum=aggregate_per_object(Rating.objects.all(), "video", Sum("rating")),
+    )
+    invalidate_model(Video)
+    return updated
+
+
+def update_search_documents(requests: QuerySet[Request]) -> None:
+    """
+    Update the full-text search document of the requests from their title and the
+    titles of their videos (with lower weight). The documents are only used on
+    PostgreSQL, other databases fall back to the default search.
+    """
+    if connections[requests.db].vendor != "postgresql":
+        return
+    video_titles = Coalesce(
+        Subquery(
+            Video.objects.filter(request=OuterRef("pk"))
+            .order_by()
+            .values("request")
+            .annotate(titles=StringAgg("title", delimiter=Value(" ")))
+            .values("titles")
+        ),
+        Value(""),
+    )
+    requests.update(
+        search_text=Lower(Unaccent(Concat("title", Value(" "), video_titles))),
+        search_vector=SearchVector("title", config=SEARCH_CONFIG, weight="A")
+        + SearchVector(video_titles, config=SEARCH_CONFIG, weight="B"),
+    )
+    # Queryset updates are not invalidated by cacheops automatically
+    for request in requests.iterator():
+        invalidate_obj(request)
+
+
+def update_video_search_documents(videos: QuerySet[Video]) -> None:
+    """Update the full-text search document of the videos from their title."""
+    if connections[videos.db].vendor != "postgresql":
+        return
+    videos.update(
+        search_text=Lower(Unaccent("title")),
+        search_vector=SearchVector("title", config=SEARCH_CONFIG, weight="A"),
+    )
+    for video in videos.iterator():
+        invalidate_obj(video)
+
+
+def update_participations(requests: QuerySet[Request]) -> None:
+    """
+    Rebuild the participations of the requests from their responsible, crew members
+    and the editors of their videos.
+    """
+    request_ids = list(requests.values_list("pk", flat=True))
+    if not request_ids:
+        return
+    sources = [
+        (
+            Participation.Roles.RESPONSIBLE,
+            Request.objects.filter(
+                pk__in=request_ids, responsible__isnull=False
+            ).values(
+                "start_datetime",
+                "end_datetime",
+                user_id=F("responsible_id"),
+                request_id=F("pk"),
+                position=Value(""),
+            ),
+        ),
+        (
+            Participation.Roles.CREW,
+            CrewMember.objects.filter(request_id__in=request_ids).values(
+                "request_id",
+                "position",
+                user_id=F("member_id"),
+                start_datetime=F("request__start_datetime"),
+                end_datetime=F("request__end_datetime"),
+            ),
+        ),
+        (
+            Participation.Roles.EDITOR,
+            Video.objects.filter(
+                request_id__in=request_ids, editor__isnull=False
+            ).values(
+                "request_id",
+                user_id=F("editor_id"),
+                start_datetime=F("request__start_datetime"),
+                end_datetime=F("request__end_datetime"),
+                position=Value(""),
+            ),
+        ),
+    ]
+    with transaction.atomic():
+        Participation.objects.filter(request_id__in=request_ids).delete()
+        Participation.objects.bulk_create(
+            [
+                Participation(role=role, **values)
+                for role, queryset in sources
+                for values in queryset
+            ],
+            batch_size=1000,
+        )
+    # Bulk operations are not invalidated by cacheops automatically
+    invalidate_model(Participation)
 
 
 def recalculate_deadline(instance: Request, data: dict) -> dict:
@@ -245,6 +527,40 @@ def recalculate_deadline(instance: Request, data: dict) -> dict:
     return data
 
 
+# Only the transitions before the next run of the hourly update_request_status task
+# are scheduled (the later ones are scheduled by that task) as the Redis broker
+# redelivers the tasks waiting for their ETA after every visibility timeout
+STATUS_TRANSITION_WINDOW = timedelta(hours=1)
+
+
+def schedule_request_status_transition(request: Request) -> bool:
+    """
+    Update the status of the request when its event ends if it ends within the
+    schedule window. The task is sent after the transaction is committed.
+    """
+    now = localtime()
+    if not now < request.end_datetime <= now + STATUS_TRANSITION_WINDOW:
+        return False
+    args = (request.id, request.end_datetime.isoformat())
+    eta = request.end_datetime
+    transaction.on_commit(lambda: request_status_transition.apply_async(args, eta=eta))
+    return True
+
+
+@shared_task
+def request_status_transition(request_id, end_datetime):
+    # Transitions scheduled before the end of the event was changed are skipped
+    to_update = bulk_update_request_status(
+        Request.objects.filter(
+            pk=request_id,
+            status=Request.Statuses.ACCEPTED,
+            end_datetime=datetime.fromisoformat(end_datetime),
+            end_datetime__lte=localtime(),
+        )
+    )
+    return f"{len(to_update)} requests was checked for valid status."
+
+
 @shared_task(
     bind=True,
     autoretry_for=(RequestException,),